@@ -0,0 +1,363 @@
+"""Benchmark suite for the TecnoOut client, codec and coordinator.
+
+Run from the repository root:
+
+    python benchmarks/bench_tecnout.py --output bench.json
+    python benchmarks/bench_tecnout.py --compare bench.json
+    python benchmarks/bench_tecnout.py --only replay --replay session.tosr --speed 0
+
+Micro-benchmarks only need the runtime requirements (pycryptodome, pydantic);
+the coordinator benchmarks also need Home Assistant and are skipped without it.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import functools
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "custom_components" / "ha_tecnout"))
+# The panel simulator lives with the tests, the integration package next to them
+sys.path.insert(0, str(ROOT))
+
+from Crypto.Cipher import AES  # noqa: E402
+from tecnout.entities import GeneralStatus, ProgramStatus  # noqa: E402
+from tecnout.recording import ReplayTransport  # noqa: E402
+from tecnout.tecnout_client import (  # noqa: E402
+    TecnoOutClient,
+    _ZoneDetailedStatusResponse,
+)
+
+from tests.simulator import PanelSimulator, SimulatedPanel  # noqa: E402
+
+USER_CODE = 123456
+PASSPHRASE = "benchmark"
+ZONE_COUNTS = (32, 128, 512)
+
+
+class _LoopbackSocket:
+    """In-process socket answering requests through a simulator, without TCP."""
+
+    def __init__(self, simulator: PanelSimulator, iv: bytes) -> None:
+        key = simulator.passphrase
+        self._simulator = simulator
+        self._decryptor = AES.new(key, AES.MODE_CFB, iv=iv, segment_size=128)
+        self._encryptor = AES.new(key, AES.MODE_CFB, iv=iv, segment_size=128)
+        self._pending = b""
+
+    def settimeout(self, timeout: float | None) -> None:
+        """Timeouts do not apply to in-process exchanges."""
+
+    def sendall(self, data: bytes) -> None:
+        frame = self._decryptor.decrypt(data)
+        self._pending = self._encryptor.encrypt(self._simulator.respond(frame))
+
+    def recv(self, size: int) -> bytes:
+        data, self._pending = self._pending[:size], self._pending[size:]
+        return data
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+def _loopback_client(simulator: PanelSimulator) -> TecnoOutClient:
+    """Return a client wired to ``simulator`` through a loopback socket."""
+    client = TecnoOutClient("loopback", 0, USER_CODE, PASSPHRASE)
+    iv = bytes(16)
+    key = simulator.passphrase
+    client._sock = _LoopbackSocket(simulator, iv)
+    client._aes_cipher = AES.new(key, AES.MODE_CFB, iv=iv, segment_size=128)
+    client._aes_cipher_response = AES.new(key, AES.MODE_CFB, iv=iv, segment_size=128)
+    return client
+
+
+def _measure(func: Callable[[], Any], repeat: int, number: int) -> dict[str, Any]:
+    """Time ``number`` calls of ``func``, ``repeat`` times; stats are per call."""
+    func()  # warm-up
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+    return _stats(samples, number)
+
+
+def _stats(samples: list[float], number: int) -> dict[str, Any]:
+    samples = sorted(samples)
+    return {
+        "unit": "s",
+        "repeat": len(samples),
+        "number": number,
+        "min": samples[0],
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "p95": samples[int(0.95 * (len(samples) - 1))],
+        "max": samples[-1],
+    }
+
+
+def bench_codec(repeat: int) -> dict[str, dict[str, Any]]:
+    """Benchmark CRC, AES framing and response decoding."""
+    results = {}
+    frame = bytes(range(64))
+    results["crc16_64b"] = _measure(
+        lambda: TecnoOutClient._calculate_crc16(frame), repeat, 2000
+    )
+
+    status = bytes([0x27, 0x21, 0x10, 0xFF, 0, 35, 0, 0, 1, 0x40, 0, 0, 0, 0, 0, 0])
+    results["decode_general_status"] = _measure(
+        lambda: GeneralStatus.from_bytes(status), repeat, 2000
+    )
+    zones = b"\xc2\x80" * 32
+    results["decode_zones_chunk_32"] = _measure(
+        lambda: _ZoneDetailedStatusResponse(zones, 1), repeat, 200
+    )
+    results["decode_program_status"] = _measure(
+        lambda: ProgramStatus.from_bytes(0x23, 1), repeat, 5000
+    )
+
+    with PanelSimulator(
+        SimulatedPanel(zones_count=32), user_code=USER_CODE, passphrase=PASSPHRASE
+    ) as simulator:
+        client = _loopback_client(simulator)
+        results["send_command_loopback"] = _measure(
+            lambda: client.send_command(0x01), repeat, 500
+        )
+    return results
+
+
+def _sweep(client: TecnoOutClient, zones_count: int) -> None:
+    """Read general status, every zone and every program once."""
+    client.get_general_status()
+    client.get_zones_detail(zones_count)
+    client.get_programs_status(8)
+
+
+def bench_client(repeat: int) -> dict[str, dict[str, Any]]:
+    """Benchmark a full client sweep against the simulator over TCP."""
+    results = {}
+    for zones_count in ZONE_COUNTS:
+        panel = SimulatedPanel(zones_count=zones_count, programs_count=8)
+        with PanelSimulator(panel, user_code=USER_CODE, passphrase=PASSPHRASE) as sim:
+            client = TecnoOutClient(sim.host, sim.port, USER_CODE, PASSPHRASE)
+            client.connect()
+            try:
+                results[f"client_sweep_{zones_count}"] = _measure(
+                    functools.partial(_sweep, client, zones_count), repeat, 10
+                )
+            finally:
+                client.close()
+    return results
+
+
+async def _coordinator_cycles(
+    hass, hub, host: str, port: int, repeat: int, name: str
+) -> dict[str, Any]:
+    """Set up a coordinator against ``host:port`` and time ``repeat`` refreshes."""
+    from custom_components.ha_tecnout.const import (
+        CONF_HOST,
+        CONF_PASSPHRASE,
+        CONF_PORT,
+        CONF_USER_CODE,
+    )
+    from custom_components.ha_tecnout.coordinator import TecnoOutCoordinator
+
+    entry = SimpleNamespace(
+        entry_id=name,
+        data={
+            CONF_HOST: host,
+            CONF_PORT: port,
+            CONF_USER_CODE: USER_CODE,
+            CONF_PASSPHRASE: PASSPHRASE,
+        },
+        options={},
+    )
+    coordinator = TecnoOutCoordinator(hass, entry, hub)
+    await coordinator.async_refresh()  # setup + descriptions
+    if not coordinator.last_update_success:
+        raise RuntimeError(coordinator.last_exception)
+    samples = []
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            await coordinator.async_refresh()
+            samples.append(time.perf_counter() - start)
+    finally:
+        await coordinator.async_shutdown()
+    return _stats(samples, 1)
+
+
+async def _bench_coordinator(repeat: int) -> dict[str, dict[str, Any]]:
+    from homeassistant.core import HomeAssistant
+
+    from custom_components.ha_tecnout.hub import TecnoOutHub
+
+    results = {}
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        hub = TecnoOutHub(hass)
+        try:
+            for zones_count in ZONE_COUNTS:
+                panel = SimulatedPanel(zones_count=zones_count, programs_count=8)
+                with PanelSimulator(
+                    panel, user_code=USER_CODE, passphrase=PASSPHRASE
+                ) as sim:
+                    name = f"coordinator_cycle_{zones_count}"
+                    results[name] = await _coordinator_cycles(
+                        hass, hub, sim.host, sim.port, repeat, name
+                    )
+        finally:
+            hub.shutdown()
+            await hass.async_stop(force=True)
+    return results
+
+
+async def _bench_replay(
+    repeat: int, session: Path, speed: float
+) -> dict[str, dict[str, Any]]:
+    from homeassistant.core import HomeAssistant
+
+    from custom_components.ha_tecnout import coordinator as coordinator_module
+    from custom_components.ha_tecnout.hub import TecnoOutHub
+
+    replay = ReplayTransport.from_file(str(session), passphrase=PASSPHRASE, speed=speed)
+    client_class = coordinator_module.TecnoOutClient
+    coordinator_module.TecnoOutClient = functools.partial(
+        client_class, socket_factory=replay.connect
+    )
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        hub = TecnoOutHub(hass)
+        try:
+            name = f"replay_cycle_{session.stem}"
+            return {
+                name: await _coordinator_cycles(hass, hub, "replay", 0, repeat, name)
+            }
+        finally:
+            coordinator_module.TecnoOutClient = client_class
+            hub.shutdown()
+            await hass.async_stop(force=True)
+
+
+def _has_homeassistant() -> bool:
+    try:
+        import homeassistant  # noqa: F401
+    except ImportError:
+        print("homeassistant not installed, skipping coordinator benchmarks")
+        return False
+    return True
+
+
+def bench_coordinator(repeat: int) -> dict[str, dict[str, Any]]:
+    """Benchmark full coordinator refresh cycles, if Home Assistant is installed."""
+    if not _has_homeassistant():
+        return {}
+    return asyncio.run(_bench_coordinator(repeat))
+
+
+def bench_replay(
+    repeat: int, session: Path | None, speed: float
+) -> dict[str, dict[str, Any]]:
+    """Benchmark coordinator refresh cycles against a recorded session."""
+    if session is None or not _has_homeassistant():
+        return {}
+    return asyncio.run(_bench_replay(repeat, session, speed))
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list[str]:
+    """Return the benchmarks whose median regressed by more than ``threshold``."""
+    regressions = []
+    for name, result in current["benchmarks"].items():
+        base = baseline["benchmarks"].get(name)
+        if base is None:
+            continue
+        ratio = result["median"] / base["median"]
+        flag = " REGRESSION" if ratio > 1 + threshold else ""
+        print(
+            f"{name:32} {base['median'] * 1e6:12.2f}us -> "
+            f"{result['median'] * 1e6:12.2f}us  x{ratio:.2f}{flag}"
+        )
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def main() -> int:
+    """Run the suite, write the results and optionally compare to a baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--output", type=Path, help="write JSON results here")
+    parser.add_argument("--compare", type=Path, help="baseline JSON to compare to")
+    parser.add_argument(
+        "--threshold", type=float, default=0.10, help="regression threshold (0.10 = 10%%)"
+    )
+    parser.add_argument(
+        "--only", choices=("codec", "client", "coordinator", "replay"), action="append"
+    )
+    parser.add_argument(
+        "--replay", type=Path, help="recorded session to replay (record_session)"
+    )
+    parser.add_argument(
+        "--speed", type=float, default=0.0, help="replay speed factor (0 = no delays)"
+    )
+    args = parser.parse_args()
+
+    suites = {
+        "codec": bench_codec,
+        "client": bench_client,
+        "coordinator": bench_coordinator,
+        "replay": functools.partial(
+            bench_replay, session=args.replay, speed=args.speed
+        ),
+    }
+    benchmarks: dict[str, dict[str, Any]] = {}
+    for name, suite in suites.items():
+        if args.only and name not in args.only:
+            continue
+        benchmarks.update(suite(args.repeat))
+
+    results = {
+        "commit": _git_commit(),
+        "timestamp": time.time(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "benchmarks": benchmarks,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+    else:
+        print(json.dumps(results, indent=2))
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        if compare(baseline, results, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
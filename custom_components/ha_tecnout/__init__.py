@@ -2,47 +2,169 @@
 from __future__ import annotations
 
 import logging
+import os
+from collections.abc import Awaitable, Callable
+from functools import partial
+from typing import Any
+
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.exceptions import HomeAssistantError
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 import homeassistant.helpers.config_validation as cv
+from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
     SERVICE_ARM_PROGRAM,
     SERVICE_DISARM_PROGRAM,
+    SERVICE_PROFILE_CYCLES,
+    SERVICE_TRACE_FRAMES,
+    SERVICE_RECORD_SESSION,
+    SERVICE_CHECK_PROGRAM_READY,
+    SERVICE_QUERY_ZONES,
+    SERVICE_ZONE_HISTORY,
+    ATTR_CONFIG_ENTRY_ID,
     ATTR_PROGRAM_ID,
     ATTR_PIN,
+    ATTR_ENABLED,
+    ATTR_SAMPLE_EVERY,
+    ATTR_COMMANDS,
+    ATTR_BUFFER_SIZE,
+    ATTR_ALL,
+    ATTR_NONE,
+    ATTR_ANY,
+    ATTR_AT,
+    ATTR_START,
+    ATTR_END,
     CONF_CONTROL_PIN,
+    DEFAULT_TRACE_BUFFER_SIZE,
+    DATA_HUB,
 )
-from .coordinator import TecnoOutCoordinator
+from .coordinator import TecnoOutCoordinator, activity_store, snapshot_path
+from .hub import TecnoOutHub, async_get_hub
+from .tecnout.zone_index import ZONE_FLAG_ALIASES, ZONE_FLAGS
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [
     Platform.ALARM_CONTROL_PANEL,
     Platform.BINARY_SENSOR,
+    Platform.SENSOR,
     Platform.SWITCH,
 ]
 
 # Service schemas
 SERVICE_PROGRAM_SCHEMA = vol.Schema(
     {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
         vol.Required(ATTR_PROGRAM_ID): cv.positive_int,
         vol.Optional(ATTR_PIN): cv.string,
     }
 )
 
+SERVICE_PROFILE_CYCLES_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_ENABLED): cv.boolean,
+    }
+)
+
+SERVICE_CHECK_PROGRAM_READY_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_PROGRAM_ID): cv.positive_int,
+    }
+)
+
+_ZONE_FLAG_LIST = vol.All(
+    cv.ensure_list, [vol.In([*ZONE_FLAGS, *ZONE_FLAG_ALIASES])]
+)
+
+SERVICE_QUERY_ZONES_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_ALL, default=[]): _ZONE_FLAG_LIST,
+        vol.Optional(ATTR_NONE, default=[]): _ZONE_FLAG_LIST,
+        vol.Optional(ATTR_ANY, default=[]): _ZONE_FLAG_LIST,
+        vol.Optional(ATTR_PROGRAM_ID): cv.positive_int,
+    }
+)
+
+SERVICE_ZONE_HISTORY_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+            vol.Exclusive(ATTR_AT, "history"): cv.datetime,
+            vol.Exclusive(ATTR_START, "history"): cv.datetime,
+            vol.Optional(ATTR_END): cv.datetime,
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_AT, ATTR_START),
+)
+
+SERVICE_RECORD_SESSION_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_ENABLED): cv.boolean,
+    }
+)
+
+
+def _command_code(value: Any) -> int:
+    """Validate a command code given as an integer or a hex string (0x0F)."""
+    try:
+        code = int(value, 0) if isinstance(value, str) else int(value)
+    except (TypeError, ValueError) as err:
+        raise vol.Invalid(f"Invalid command code: {value}") from err
+    if not 0 <= code <= 0xFF:
+        raise vol.Invalid(f"Command code out of range: {value}")
+    return code
+
+
+SERVICE_TRACE_FRAMES_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_ENABLED): cv.boolean,
+        vol.Optional(ATTR_SAMPLE_EVERY, default=1): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+        vol.Optional(ATTR_COMMANDS): vol.All(cv.ensure_list, [_command_code]),
+        vol.Optional(ATTR_BUFFER_SIZE, default=DEFAULT_TRACE_BUFFER_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=10000)
+        ),
+    }
+)
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up TecnoAlarm TecnoOut from a config entry."""
-    coordinator = TecnoOutCoordinator(hass, entry)
+    hub = async_get_hub(hass)
+    coordinator = TecnoOutCoordinator(hass, entry, hub)
+    await coordinator.async_load_activity()
+    coordinator.async_setup_statistics()
 
-    # Perform first refresh
-    await coordinator.async_config_entry_first_refresh()
+    # Show the last known state right away if there is one, otherwise
+    # perform first refresh
+    if not await coordinator.async_restore_snapshot():
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except Exception:
+            # Setup is retried with a new coordinator: release this one
+            await coordinator.async_close()
+            _drop_hub_if_empty(hass, hub)
+            raise
+        coordinator.mark_startup("first_refresh_s")
+
+    # Hand polling over to the hub, staggered with the other panels
+    hub.async_add(coordinator)
 
     # Store coordinator
     hass.data.setdefault(DOMAIN, {})
@@ -50,71 +172,272 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    coordinator.mark_startup("first_entity_s")
 
     # Register services
-    await async_setup_services(hass, entry, coordinator)
+    await async_setup_services(hass)
+
+    # Apply option changes to the running coordinator
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
 
     return True
 
 
-async def async_setup_services(
-    hass: HomeAssistant, entry: ConfigEntry, coordinator: TecnoOutCoordinator
+def _drop_hub_if_empty(hass: HomeAssistant, hub: TecnoOutHub) -> None:
+    """Drop the hub with the last panel."""
+    if hub.empty:
+        hub.shutdown()
+        hass.data.pop(DATA_HUB, None)
+
+
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply changed options live, reloading only if the entities change."""
+    coordinator: TecnoOutCoordinator = hass.data[DOMAIN][entry.entry_id]
+    if not coordinator.async_apply_options():
+        await hass.config_entries.async_reload(entry.entry_id)
+
+
+_ServiceHandler = Callable[[HomeAssistant, ServiceCall], Awaitable[ServiceResponse]]
+
+
+def _get_coordinator(hass: HomeAssistant, call: ServiceCall) -> TecnoOutCoordinator:
+    """Return the coordinator of the panel the service call targets."""
+    entry_id = call.data[ATTR_CONFIG_ENTRY_ID]
+    entry = hass.config_entries.async_get_entry(entry_id)
+    if entry is None or entry.domain != DOMAIN:
+        raise ServiceValidationError(
+            f"Unknown TecnoOut config entry: {entry_id}",
+            translation_domain=DOMAIN,
+            translation_key="invalid_config_entry",
+            translation_placeholders={"config_entry_id": entry_id},
+        )
+    coordinator: TecnoOutCoordinator | None = hass.data.get(DOMAIN, {}).get(entry_id)
+    if coordinator is None:
+        raise ServiceValidationError(
+            f"TecnoOut panel {entry.title} is not loaded",
+            translation_domain=DOMAIN,
+            translation_key="config_entry_not_loaded",
+            translation_placeholders={"title": entry.title},
+        )
+    return coordinator
+
+
+def _verify_pin(coordinator: TecnoOutCoordinator, provided_pin: str | None) -> bool:
+    """Verify if the provided PIN matches the one configured for the panel."""
+    configured_pin = coordinator.entry.data.get(CONF_CONTROL_PIN)
+
+    # If no PIN is configured, allow the action
+    if not configured_pin:
+        return True
+
+    # If PIN is configured but not provided, deny
+    if not provided_pin:
+        return False
+
+    # Verify PIN matches
+    return provided_pin == configured_pin
+
+
+def _describe_zones(
+    coordinator: TecnoOutCoordinator, zones: list[int]
+) -> list[dict[str, Any]]:
+    """Return zone numbers with their descriptions."""
+    described = []
+    for zone_idx in zones:
+        zone = coordinator.get_zone(zone_idx)
+        described.append({"zone": zone_idx, "name": zone.description if zone else None})
+    return described
+
+
+async def _async_set_program(
+    hass: HomeAssistant, call: ServiceCall, status: int
 ) -> None:
-    """Set up services for the integration."""
-    
-    def verify_pin(provided_pin: str | None) -> bool:
-        """Verify if the provided PIN matches the configured one."""
-        configured_pin = entry.data.get(CONF_CONTROL_PIN)
-        
-        # If no PIN is configured, allow the action
-        if not configured_pin:
-            return True
-        
-        # If PIN is configured but not provided, deny
-        if not provided_pin:
-            return False
-        
-        # Verify PIN matches
-        return provided_pin == configured_pin
-
-    async def handle_arm_program(call: ServiceCall) -> None:
-        """Handle arm program service call."""
-        program_id = call.data[ATTR_PROGRAM_ID]
-        provided_pin = call.data.get(ATTR_PIN)
-        
-        if not verify_pin(provided_pin):
-            raise HomeAssistantError("Invalid or missing PIN")
-        
-        _LOGGER.info("Arming program %s via service", program_id)
-        await coordinator.async_set_program(program_id, 1)  # AUTOARM
-
-    async def handle_disarm_program(call: ServiceCall) -> None:
-        """Handle disarm program service call."""
-        program_id = call.data[ATTR_PROGRAM_ID]
-        provided_pin = call.data.get(ATTR_PIN)
-        
-        if not verify_pin(provided_pin):
-            raise HomeAssistantError("Invalid or missing PIN")
-        
-        _LOGGER.info("Disarming program %s via service", program_id)
-        await coordinator.async_set_program(program_id, 0)  # STANDBY
-
-    # Register services only if not already registered
-    if not hass.services.has_service(DOMAIN, SERVICE_ARM_PROGRAM):
-        hass.services.async_register(
-            DOMAIN,
-            SERVICE_ARM_PROGRAM,
-            handle_arm_program,
-            schema=SERVICE_PROGRAM_SCHEMA,
+    """Set the status of a program after checking the PIN of its panel."""
+    coordinator = _get_coordinator(hass, call)
+    if not _verify_pin(coordinator, call.data.get(ATTR_PIN)):
+        raise ServiceValidationError(
+            "Invalid or missing PIN",
+            translation_domain=DOMAIN,
+            translation_key="invalid_pin",
+        )
+    await coordinator.async_set_program(call.data[ATTR_PROGRAM_ID], status)
+
+
+async def _async_arm_program(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Handle arm program service call."""
+    _LOGGER.info("Arming program %s via service", call.data[ATTR_PROGRAM_ID])
+    await _async_set_program(hass, call, 1)  # AUTOARM
+
+
+async def _async_disarm_program(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Handle disarm program service call."""
+    _LOGGER.info("Disarming program %s via service", call.data[ATTR_PROGRAM_ID])
+    await _async_set_program(hass, call, 0)  # STANDBY
+
+
+async def _async_profile_cycles(
+    hass: HomeAssistant, call: ServiceCall
+) -> ServiceResponse:
+    """Handle profile cycles service call."""
+    coordinator = _get_coordinator(hass, call)
+    if ATTR_ENABLED in call.data:
+        coordinator.set_profiling(call.data[ATTR_ENABLED])
+        _LOGGER.info(
+            "Cycle profiler %s via service",
+            "enabled" if call.data[ATTR_ENABLED] else "disabled",
         )
+    return coordinator.profile_report()
+
 
-    if not hass.services.has_service(DOMAIN, SERVICE_DISARM_PROGRAM):
-        hass.services.async_register(
-            DOMAIN,
-            SERVICE_DISARM_PROGRAM,
-            handle_disarm_program,
-            schema=SERVICE_PROGRAM_SCHEMA,
+async def _async_trace_frames(
+    hass: HomeAssistant, call: ServiceCall
+) -> ServiceResponse:
+    """Handle trace frames service call."""
+    coordinator = _get_coordinator(hass, call)
+    if ATTR_ENABLED in call.data:
+        coordinator.set_frame_tracing(
+            call.data[ATTR_ENABLED],
+            size=call.data[ATTR_BUFFER_SIZE],
+            sample_every=call.data[ATTR_SAMPLE_EVERY],
+            commands=call.data.get(ATTR_COMMANDS),
+        )
+        _LOGGER.info(
+            "Frame tracing %s via service",
+            "enabled" if call.data[ATTR_ENABLED] else "disabled",
         )
+    return coordinator.frame_trace_dump()
+
+
+async def _async_record_session(
+    hass: HomeAssistant, call: ServiceCall
+) -> ServiceResponse:
+    """Handle record session service call."""
+    coordinator = _get_coordinator(hass, call)
+    await coordinator.async_set_recording(call.data[ATTR_ENABLED])
+    return coordinator.recording_status()
+
+
+async def _async_check_program_ready(
+    hass: HomeAssistant, call: ServiceCall
+) -> ServiceResponse:
+    """Handle check program ready service call."""
+    coordinator = _get_coordinator(hass, call)
+    readiness = coordinator.program_readiness(call.data[ATTR_PROGRAM_ID])
+    if readiness is None:
+        raise HomeAssistantError("Zone settings not loaded yet")
+
+    return {
+        **readiness,
+        "blocking_zones": _describe_zones(coordinator, readiness["blocking_zones"]),
+        "unexcludable_zones": _describe_zones(
+            coordinator, readiness["unexcludable_zones"]
+        ),
+    }
+
+
+async def _async_query_zones(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Handle query zones service call."""
+    coordinator = _get_coordinator(hass, call)
+    try:
+        zones = coordinator.query_zones(
+            all_of=call.data[ATTR_ALL],
+            none_of=call.data[ATTR_NONE],
+            any_of=call.data[ATTR_ANY],
+            program_idx=call.data.get(ATTR_PROGRAM_ID),
+        )
+    except ValueError as err:
+        raise HomeAssistantError(str(err)) from err
+    return {"count": len(zones), "zones": _describe_zones(coordinator, zones)}
+
+
+async def _async_zone_history(
+    hass: HomeAssistant, call: ServiceCall
+) -> ServiceResponse:
+    """Handle zone history service call."""
+    coordinator = _get_coordinator(hass, call)
+    if ATTR_AT in call.data:
+        when = dt_util.as_utc(call.data[ATTR_AT]).timestamp()
+        state = coordinator.zone_state_at(when)
+        if state is None:
+            raise HomeAssistantError("Time is older than the zone timeline")
+        return state
+    start = dt_util.as_utc(call.data[ATTR_START]).timestamp()
+    end = (
+        dt_util.as_utc(call.data[ATTR_END]).timestamp()
+        if ATTR_END in call.data
+        else dt_util.utcnow().timestamp()
+    )
+    return {"transitions": coordinator.zone_transitions(start, end)}
+
+
+# Service name: (handler, schema, response support)
+SERVICES: dict[str, tuple[_ServiceHandler, vol.Schema, SupportsResponse]] = {
+    SERVICE_ARM_PROGRAM: (
+        _async_arm_program,
+        SERVICE_PROGRAM_SCHEMA,
+        SupportsResponse.NONE,
+    ),
+    SERVICE_DISARM_PROGRAM: (
+        _async_disarm_program,
+        SERVICE_PROGRAM_SCHEMA,
+        SupportsResponse.NONE,
+    ),
+    SERVICE_PROFILE_CYCLES: (
+        _async_profile_cycles,
+        SERVICE_PROFILE_CYCLES_SCHEMA,
+        SupportsResponse.OPTIONAL,
+    ),
+    SERVICE_RECORD_SESSION: (
+        _async_record_session,
+        SERVICE_RECORD_SESSION_SCHEMA,
+        SupportsResponse.OPTIONAL,
+    ),
+    SERVICE_CHECK_PROGRAM_READY: (
+        _async_check_program_ready,
+        SERVICE_CHECK_PROGRAM_READY_SCHEMA,
+        SupportsResponse.ONLY,
+    ),
+    SERVICE_QUERY_ZONES: (
+        _async_query_zones,
+        SERVICE_QUERY_ZONES_SCHEMA,
+        SupportsResponse.ONLY,
+    ),
+    SERVICE_ZONE_HISTORY: (
+        _async_zone_history,
+        SERVICE_ZONE_HISTORY_SCHEMA,
+        SupportsResponse.ONLY,
+    ),
+    SERVICE_TRACE_FRAMES: (
+        _async_trace_frames,
+        SERVICE_TRACE_FRAMES_SCHEMA,
+        SupportsResponse.OPTIONAL,
+    ),
+}
+
+
+async def async_setup_services(hass: HomeAssistant) -> None:
+    """Set up services for the integration, shared by every panel."""
+    for service, (handler, schema, supports_response) in SERVICES.items():
+        # Register services only if not already registered
+        if not hass.services.has_service(DOMAIN, service):
+            hass.services.async_register(
+                DOMAIN,
+                service,
+                partial(handler, hass),
+                schema=schema,
+                supports_response=supports_response,
+            )
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the state snapshot and activity counters of a deleted config entry."""
+    await activity_store(hass, entry.entry_id).async_remove()
+    try:
+        await hass.async_add_executor_job(
+            os.remove, snapshot_path(hass, entry.entry_id)
+        )
+    except FileNotFoundError:
+        pass
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -123,12 +446,19 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        # Shutdown coordinator
+        # Stop polling and shutdown coordinator
         coordinator: TecnoOutCoordinator = hass.data[DOMAIN][entry.entry_id]
+        coordinator.hub.async_remove(entry.entry_id)
         await coordinator.async_shutdown()
 
         # Remove coordinator
         hass.data[DOMAIN].pop(entry.entry_id)
 
-    return unload_ok
+        # Remove the services with the last panel
+        if not hass.data[DOMAIN]:
+            for service in list(hass.services.async_services().get(DOMAIN, {})):
+                hass.services.async_remove(DOMAIN, service)
 
+        _drop_hub_if_empty(hass, coordinator.hub)
+
+    return unload_ok
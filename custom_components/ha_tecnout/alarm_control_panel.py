@@ -13,7 +13,6 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .tecnout.entities import (
     ProgramStatus,
@@ -21,8 +20,9 @@ from .tecnout.entities import (
     SetProgramStatusEnum,
 )
 
-from .const import DOMAIN, MANUFACTURER, CONF_CONTROL_PIN
+from .const import DOMAIN, CONF_CONTROL_PIN
 from .coordinator import TecnoOutCoordinator
+from .entity import TecnoOutEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -52,10 +52,12 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class TecnoOutAlarmControlPanel(CoordinatorEntity[TecnoOutCoordinator], AlarmControlPanelEntity):
+class TecnoOutAlarmControlPanel(TecnoOutEntity, AlarmControlPanelEntity):
     """Representation of a TecnoOut Program as an Alarm Control Panel."""
 
     _attr_has_entity_name = True
+    # Follows every zone that opens or closes; ready_to_arm is enough history
+    _unrecorded_attributes = frozenset({"blocking_zones"})
     _attr_supported_features = (
         AlarmControlPanelEntityFeature.ARM_AWAY
     )
@@ -137,7 +139,11 @@ class TecnoOutAlarmControlPanel(CoordinatorEntity[TecnoOutCoordinator], AlarmCon
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return super().available and self._get_program() is not None
+        # Keep the last good state until the programs have been failing for too long
+        return (
+            self.coordinator.section_available("programs")
+            and self._get_program() is not None
+        )
 
     async def async_alarm_disarm(self, code: str | None = None) -> None:
         """Send disarm command."""
@@ -191,30 +197,20 @@ class TecnoOutAlarmControlPanel(CoordinatorEntity[TecnoOutCoordinator], AlarmCon
             ProgramStatusEnum.END_OF_BYPASS_SIGNALING: "End of Bypass Signaling",
         }
 
-        return {
+        attributes = {
             "program_number": program.idx,
             "detailed_status": status_map.get(program.program_status, "Unknown"),
             "prealarm": program.prealarm,
             "alarm": program.alarm,
             "alarm_memory": program.alarm_memory,
             "is_active": program.is_active,
+            "stale": self.coordinator.stale,
         }
+        # Known once the zone settings have been indexed
+        readiness = self.coordinator.program_readiness(self._program_idx)
+        if readiness is not None:
+            attributes["ready_to_arm"] = readiness["ready"]
+            attributes["blocking_zones"] = readiness["blocking_zones"]
+        return attributes
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        general_status = self.coordinator.data.get("general_status")
-        device_name = (
-            general_status.control_panel_type if general_status else "TecnoAlarm"
-        )
-
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.entry.entry_id)},
-            "name": device_name,
-            "manufacturer": MANUFACTURER,
-            "model": general_status.control_panel_type if general_status else "Unknown",
-            "sw_version": (
-                general_status.firmware_release if general_status else None
-            ),
-        }
 
@@ -1,26 +1,388 @@
 """Binary sensor platform for TecnoAlarm TecnoOut integration."""
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
 import logging
 from typing import Any
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
+    BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EntityCategory
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .tecnout.entities import ZoneDetailedStatus
+from .tecnout.entities import GeneralStatus, ZoneDetailedStatus
 
-from .const import DOMAIN, MANUFACTURER
-from .coordinator import TecnoOutCoordinator
+from .const import (
+    CONF_ZONE_DIAGNOSTICS,
+    DEFAULT_ZONE_DIAGNOSTICS,
+    DOMAIN,
+)
+from .coordinator import TecnoOutCoordinator, get_option
+from .entity import TecnoOutEntity
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, kw_only=True)
+class TecnoOutZoneFlagDescription(BinarySensorEntityDescription):
+    """Describes a diagnostic flag of a zone."""
+
+    label: str
+    value_fn: Callable[[ZoneDetailedStatus], bool]
+
+
+ZONE_FLAGS: tuple[TecnoOutZoneFlagDescription, ...] = (
+    TecnoOutZoneFlagDescription(
+        key="tamper",
+        label="Tamper",
+        device_class=BinarySensorDeviceClass.TAMPER,
+        value_fn=lambda zone: zone.zone_tamper_status,
+    ),
+    TecnoOutZoneFlagDescription(
+        key="battery_low",
+        label="Battery",
+        device_class=BinarySensorDeviceClass.BATTERY,
+        value_fn=lambda zone: zone.battery_low,
+    ),
+    TecnoOutZoneFlagDescription(
+        key="mask",
+        label="Mask",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        value_fn=lambda zone: zone.mask_status,
+    ),
+    TecnoOutZoneFlagDescription(
+        key="fail",
+        label="Failure",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        value_fn=lambda zone: zone.fail_status,
+    ),
+    TecnoOutZoneFlagDescription(
+        key="alim_failure",
+        label="Power Supply Failure",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        value_fn=lambda zone: zone.alim_failure,
+    ),
+    TecnoOutZoneFlagDescription(
+        key="supervision",
+        label="Supervision",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        value_fn=lambda zone: zone.supervision_alarm,
+    ),
+    TecnoOutZoneFlagDescription(
+        key="alarm_24h",
+        label="24h Alarm",
+        device_class=BinarySensorDeviceClass.SAFETY,
+        value_fn=lambda zone: zone.alarm_24h,
+    ),
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class TecnoOutPanelFlagDescription(BinarySensorEntityDescription):
+    """Describes a flag of the panel general status; key is the field name."""
+
+
+# Faults and alarms are enabled by default, memories and outputs on request
+PANEL_FLAGS: tuple[TecnoOutPanelFlagDescription, ...] = (
+    TecnoOutPanelFlagDescription(
+        key="general_standby",
+        name="Standby",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="general_alarm_failure",
+        name="Alarm Failure",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="general_low_battery",
+        name="Low Battery",
+        device_class=BinarySensorDeviceClass.BATTERY,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="general_power_failure",
+        name="Power Failure",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="general_tamper",
+        name="Tamper",
+        device_class=BinarySensorDeviceClass.TAMPER,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="wireless_failure",
+        name="Wireless Failure",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="hold_up_status",
+        name="Hold-Up",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="technical_status",
+        name="Technical",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="chime_status",
+        name="Chime",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="pstn_status",
+        name="PSTN",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="general_pre_alarm",
+        name="Pre-Alarm",
+        device_class=BinarySensorDeviceClass.SAFETY,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="pgm_logical_output",
+        name="PGM Logical Output",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="access_denied",
+        name="Access Denied",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="program_alarm",
+        name="Program Alarm",
+        device_class=BinarySensorDeviceClass.SAFETY,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="system_status_ok",
+        name="System OK",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="gsm_status",
+        name="GSM",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="general_tamper_alarm",
+        name="Tamper Alarm",
+        device_class=BinarySensorDeviceClass.TAMPER,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="general_failure_alarm",
+        name="Failure Alarm",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="false_code_alarm",
+        name="False Code Alarm",
+        device_class=BinarySensorDeviceClass.SAFETY,
+        entity_registry_enabled_default=False,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="false_key_alarm",
+        name="False Key Alarm",
+        device_class=BinarySensorDeviceClass.SAFETY,
+        entity_registry_enabled_default=False,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="general_supervision_alarm",
+        name="Supervision Alarm",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        entity_registry_enabled_default=False,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="general_masking_alarm",
+        name="Masking Alarm",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        entity_registry_enabled_default=False,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="general_hold_up_alarm",
+        name="Hold-Up Alarm",
+        device_class=BinarySensorDeviceClass.SAFETY,
+        entity_registry_enabled_default=False,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="general_technical_alarm",
+        name="Technical Alarm",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        entity_registry_enabled_default=False,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="general_memory_alarm",
+        name="Alarm Memory",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="active_exit_time",
+        name="Exit Time",
+        device_class=BinarySensorDeviceClass.RUNNING,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="control_panel_maintenance",
+        name="Maintenance",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="outgoing_call",
+        name="Outgoing Call",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="end_bypass_signaling",
+        name="End Bypass Signaling",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="automatic_arming",
+        name="Automatic Arming",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="general_isolation_status",
+        name="Isolation",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="masking_status",
+        name="Masking",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="general_tamper_memory",
+        name="Tamper Memory",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="failure_memory",
+        name="Failure Memory",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="false_code_memory",
+        name="False Code Memory",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="false_key_memory",
+        name="False Key Memory",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="low_battery_memory",
+        name="Low Battery Memory",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="power_failure_memory",
+        name="Power Failure Memory",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="pstn_memory",
+        name="PSTN Memory",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="gsm_alarm_memory",
+        name="GSM Alarm Memory",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="voice_synthesis_board_present",
+        name="Voice Board",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="incoming_call",
+        name="Incoming Call",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="internal_siren_status",
+        name="Internal Siren Status",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="external_siren_status",
+        name="External Siren Status",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="out1_status",
+        name="Output 1",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="out2_status",
+        name="Output 2",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="local_expansion_present",
+        name="Local Expansion",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="panic_alarm",
+        name="Panic Alarm",
+        device_class=BinarySensorDeviceClass.SAFETY,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="internal_siren",
+        name="Internal Siren",
+        device_class=BinarySensorDeviceClass.SOUND,
+    ),
+    TecnoOutPanelFlagDescription(
+        key="external_siren",
+        name="External Siren",
+        device_class=BinarySensorDeviceClass.SOUND,
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -35,20 +397,47 @@ async def async_setup_entry(
 
     zones: list[ZoneDetailedStatus] = coordinator.data.get("zones", [])
 
-    entities = []
+    zone_diagnostics = get_option(entry, CONF_ZONE_DIAGNOSTICS, DEFAULT_ZONE_DIAGNOSTICS)
+
+    entities: list[BinarySensorEntity] = [
+        TecnoOutPanelFlagSensor(coordinator, entry, description)
+        for description in PANEL_FLAGS
+    ]
     for zone in zones:
         # Only add enabled zones
         if zone.enabled:
             entities.append(TecnoOutZoneSensor(coordinator, zone.idx, entry))
+            # Opt-in: one sensor per diagnostic flag, from the same zone status
+            if zone_diagnostics:
+                entities.extend(
+                    TecnoOutZoneFlagSensor(coordinator, zone.idx, entry, description)
+                    for description in ZONE_FLAGS
+                )
 
     async_add_entities(entities)
 
 
-class TecnoOutZoneSensor(CoordinatorEntity[TecnoOutCoordinator], BinarySensorEntity):
+class TecnoOutZoneSensor(TecnoOutEntity, BinarySensorEntity):
     """Representation of a TecnoOut Zone as a Binary Sensor."""
 
     _attr_device_class = BinarySensorDeviceClass.MOTION
     _attr_has_entity_name = True
+    # Volatile flags stay on the state for automations but are not recorded
+    _unrecorded_attributes = frozenset(
+        {
+            "zone_status",
+            "zone_tamper_status",
+            "zone_tamper_alarm",
+            "battery_low",
+            "supervision_alarm",
+            "mask_status",
+            "fail_status",
+            "alim_failure",
+            "pre_alarm",
+            "alarm",
+            "alarm_24h",
+        }
+    )
 
     def __init__(
         self, coordinator: TecnoOutCoordinator, zone_idx: int, entry: ConfigEntry
@@ -66,36 +455,33 @@ class TecnoOutZoneSensor(CoordinatorEntity[TecnoOutCoordinator], BinarySensorEnt
         else:
             self._attr_name = f"Zone {zone_idx}"
 
+        self._version: tuple | None = None
+        self._attributes: dict[str, Any] = {}
+        self._refresh_attributes()
+
     def _get_zone(self) -> ZoneDetailedStatus | None:
         """Get zone data from coordinator."""
-        zones: list[ZoneDetailedStatus] = self.coordinator.data.get("zones", [])
-        for zone in zones:
-            if zone.idx == self._zone_idx:
-                return zone
-        return None
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if the binary sensor is on (zone is triggered)."""
-        zone = self._get_zone()
-        if zone is None:
-            return None
-        # Return True if zone has alarm, tamper, or tamper alarm
-        return zone.zone_status or zone.zone_tamper_status or zone.zone_tamper_alarm
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return super().available and self._get_zone() is not None
+        return self.coordinator.get_zone(self._zone_idx)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
+    def _refresh_attributes(self) -> bool:
+        """Rebuild the cached attributes if the zone changed; return True if so."""
         zone = self._get_zone()
+        version = (
+            (zone.to_bytes(), zone.description) if zone is not None else None,
+            self.available,
+            self.coordinator.stale,
+        )
+        if version == self._version:
+            return False
+        self._version = version
         if zone is None:
-            return {}
+            self._attributes = {}
+            return True
 
-        return {
+        # Rename the zone in place once its description is known
+        if zone.description and self._attr_name != zone.description:
+            self._attr_name = zone.description
+        self._attributes = {
             "zone_number": zone.idx,
             "isolation_active": zone.isolation_active,
             "zone_status": zone.zone_status,
@@ -111,23 +497,146 @@ class TecnoOutZoneSensor(CoordinatorEntity[TecnoOutCoordinator], BinarySensorEnt
             "pre_alarm": zone.pre_alarm,
             "alarm": zone.alarm,
             "alarm_24h": zone.alarm_24h,
+            "stale": self.coordinator.stale,
         }
+        return True
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only if the zone changed since the last write."""
+        if self._refresh_attributes():
+            super()._handle_coordinator_update()
 
     @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        general_status = self.coordinator.data.get("general_status")
-        device_name = (
-            general_status.control_panel_type if general_status else "TecnoAlarm"
+    def is_on(self) -> bool | None:
+        """Return true if the binary sensor is on (zone is triggered)."""
+        zone = self._get_zone()
+        if zone is None:
+            return None
+        # Return True if zone has alarm, tamper, or tamper alarm
+        return zone.zone_status or zone.zone_tamper_status or zone.zone_tamper_alarm
+
+    @property
+    def available(self) -> bool:
+        """Return True if entity is available."""
+        # Keep the last good state until the zones have been failing for too long
+        return (
+            self.coordinator.section_available("zones")
+            and self._get_zone() is not None
         )
 
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.entry.entry_id)},
-            "name": device_name,
-            "manufacturer": MANUFACTURER,
-            "model": general_status.control_panel_type if general_status else "Unknown",
-            "sw_version": (
-                general_status.firmware_release if general_status else None
-            ),
-        }
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return additional state attributes, rebuilt only when the zone changes."""
+        return self._attributes
+
+
+class TecnoOutZoneFlagSensor(TecnoOutEntity, BinarySensorEntity):
+    """A diagnostic flag of a TecnoOut Zone as a Binary Sensor."""
+
+    entity_description: TecnoOutZoneFlagDescription
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator: TecnoOutCoordinator,
+        zone_idx: int,
+        entry: ConfigEntry,
+        description: TecnoOutZoneFlagDescription,
+    ) -> None:
+        """Initialize the binary sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._zone_idx = zone_idx
+        self._attr_unique_id = f"{entry.entry_id}_zone_{zone_idx}_{description.key}"
+        self._version: tuple | None = None
+        self._refresh_state()
+
+    def _get_zone(self) -> ZoneDetailedStatus | None:
+        """Get zone data from coordinator."""
+        return self.coordinator.get_zone(self._zone_idx)
+
+    def _refresh_state(self) -> bool:
+        """Update the flag and name if they changed; return True if so."""
+        zone = self._get_zone()
+        is_on = self.entity_description.value_fn(zone) if zone is not None else None
+        description = zone.description if zone is not None else None
+        version = (is_on, description, self.available)
+        if version == self._version:
+            return False
+        self._version = version
+        self._attr_is_on = is_on
+        self._attr_name = (
+            f"{description or f'Zone {self._zone_idx}'} "
+            f"{self.entity_description.label}"
+        )
+        return True
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only when the flag flips."""
+        if self._refresh_state():
+            super()._handle_coordinator_update()
+
+    @property
+    def available(self) -> bool:
+        """Return True if entity is available."""
+        return (
+            self.coordinator.section_available("zones")
+            and self._get_zone() is not None
+        )
+
+
+class TecnoOutPanelFlagSensor(TecnoOutEntity, BinarySensorEntity):
+    """A flag of the TecnoOut panel general status as a Binary Sensor."""
+
+    entity_description: TecnoOutPanelFlagDescription
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator: TecnoOutCoordinator,
+        entry: ConfigEntry,
+        description: TecnoOutPanelFlagDescription,
+    ) -> None:
+        """Initialize the binary sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_panel_{description.key}"
+        self._version: tuple | None = None
+        self._refresh_state()
+
+    def _get_general_status(self) -> GeneralStatus | None:
+        """Get the general status from coordinator."""
+        return self.coordinator.data.get("general_status")
+
+    def _refresh_state(self) -> bool:
+        """Update the flag if it changed; return True if so."""
+        general_status = self._get_general_status()
+        is_on = (
+            getattr(general_status, self.entity_description.key)
+            if general_status is not None
+            else None
+        )
+        version = (is_on, self.available)
+        if version == self._version:
+            return False
+        self._version = version
+        self._attr_is_on = is_on
+        return True
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only when the flag flips."""
+        if self._refresh_state():
+            super()._handle_coordinator_update()
+
+    @property
+    def available(self) -> bool:
+        """Return True if entity is available."""
+        return (
+            self.coordinator.section_available("general_status")
+            and self._get_general_status() is not None
+        )
 
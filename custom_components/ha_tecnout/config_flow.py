@@ -8,12 +8,14 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_PORT
-from homeassistant.core import HomeAssistant
-from homeassistant.data_entry_flow import FlowResult
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.data_entry_flow import AbortFlow, FlowResult
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import selector
 
 from .tecnout.tecnout_client import TecnoOutClient
+from .coordinator import get_option
+from .hub import async_get_hub, session_key
 
 from .const import (
     CONF_USER_CODE,
@@ -21,10 +23,38 @@ from .const import (
     CONF_LEGACY,
     CONF_WATCHDOG_INTERVAL,
     CONF_CONTROL_PIN,
+    CONF_FAST_START,
+    CONF_ZONE_DIAGNOSTICS,
+    CONF_ZONE_ACTIVITY,
+    CONF_LONG_TERM_STATISTICS,
+    CONF_POLL_INTERVAL,
+    CONF_DESCRIPTIONS_INTERVAL,
+    CONF_COMMAND_TIMEOUT,
+    CONF_CYCLE_TIMEOUT,
+    CONF_BUSY_RETRIES,
+    CONF_STALE_AFTER,
+    CONF_FULL_SWEEP_INTERVAL,
+    CONF_RATE_LIMIT,
+    CONF_RATE_BURST,
+    CONF_CONTROL_BURST,
     DEFAULT_PORT,
     DEFAULT_LEGACY,
     DEFAULT_WATCHDOG_INTERVAL,
+    DEFAULT_FAST_START,
+    DEFAULT_ZONE_DIAGNOSTICS,
+    DEFAULT_ZONE_ACTIVITY,
+    DEFAULT_LONG_TERM_STATISTICS,
+    DEFAULT_DESCRIPTIONS_INTERVAL,
+    DEFAULT_COMMAND_TIMEOUT,
+    DEFAULT_CYCLE_TIMEOUT,
+    DEFAULT_BUSY_RETRIES,
+    DEFAULT_STALE_AFTER,
+    DEFAULT_FULL_SWEEP_INTERVAL,
+    DEFAULT_RATE_LIMIT,
+    DEFAULT_RATE_BURST,
+    DEFAULT_CONTROL_BURST,
     DOMAIN,
+    UPDATE_INTERVAL,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -52,43 +82,89 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
         vol.Optional(CONF_CONTROL_PIN): selector.TextSelector(
             selector.TextSelectorConfig(type=selector.TextSelectorType.PASSWORD)
         ),
+        vol.Optional(CONF_FAST_START, default=DEFAULT_FAST_START): selector.BooleanSelector(),
+        vol.Optional(
+            CONF_ZONE_DIAGNOSTICS, default=DEFAULT_ZONE_DIAGNOSTICS
+        ): selector.BooleanSelector(),
+        vol.Optional(
+            CONF_ZONE_ACTIVITY, default=DEFAULT_ZONE_ACTIVITY
+        ): selector.BooleanSelector(),
+        vol.Optional(
+            CONF_LONG_TERM_STATISTICS, default=DEFAULT_LONG_TERM_STATISTICS
+        ): selector.BooleanSelector(),
     }
 )
 
 
+def _number(
+    minimum: float, maximum: float, step: float = 1, unit: str | None = None
+) -> selector.NumberSelector:
+    """Return a number box selector."""
+    config = selector.NumberSelectorConfig(
+        min=minimum, max=maximum, step=step, mode=selector.NumberSelectorMode.BOX
+    )
+    if unit is not None:
+        config["unit_of_measurement"] = unit
+    return selector.NumberSelector(config)
+
+
+# Option, default and selector; polling options are applied live, the
+# feature toggles below them reload the entry
+OPTIONS = (
+    (CONF_POLL_INTERVAL, UPDATE_INTERVAL, _number(0.5, 60, 0.1, "s")),
+    (CONF_DESCRIPTIONS_INTERVAL, DEFAULT_DESCRIPTIONS_INTERVAL, _number(30, 86400, 1, "s")),
+    (CONF_WATCHDOG_INTERVAL, DEFAULT_WATCHDOG_INTERVAL, _number(1, 300, 1, "s")),
+    (CONF_COMMAND_TIMEOUT, DEFAULT_COMMAND_TIMEOUT, _number(0.5, 60, 0.5, "s")),
+    (CONF_CYCLE_TIMEOUT, DEFAULT_CYCLE_TIMEOUT, _number(1, 120, 0.5, "s")),
+    (CONF_BUSY_RETRIES, DEFAULT_BUSY_RETRIES, _number(0, 10)),
+    (CONF_STALE_AFTER, DEFAULT_STALE_AFTER, _number(0, 3600, 1, "s")),
+    (CONF_FULL_SWEEP_INTERVAL, DEFAULT_FULL_SWEEP_INTERVAL, _number(0, 3600, 1, "s")),
+    (CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT, _number(0, 100, 0.5)),
+    (CONF_RATE_BURST, DEFAULT_RATE_BURST, _number(1, 50)),
+    (CONF_CONTROL_BURST, DEFAULT_CONTROL_BURST, _number(0, 10)),
+    (CONF_FAST_START, DEFAULT_FAST_START, selector.BooleanSelector()),
+    (CONF_ZONE_DIAGNOSTICS, DEFAULT_ZONE_DIAGNOSTICS, selector.BooleanSelector()),
+    (CONF_ZONE_ACTIVITY, DEFAULT_ZONE_ACTIVITY, selector.BooleanSelector()),
+    (CONF_LONG_TERM_STATISTICS, DEFAULT_LONG_TERM_STATISTICS, selector.BooleanSelector()),
+)
+
+
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect.
 
     Data has the keys from STEP_USER_DATA_SCHEMA with values provided by the user.
+    The connected client and the panel info are returned too, so the session
+    can be handed over to the integration instead of being opened again.
     """
+    # No watchdog: keep-alive is the hub's job once the session is adopted
     client = TecnoOutClient(
         host=data[CONF_HOST],
         port=int(data[CONF_PORT]),
         user_code=int(data[CONF_USER_CODE]),
         passphrase=data.get(CONF_PASSPHRASE, "") or "",
         legacy=data.get(CONF_LEGACY, DEFAULT_LEGACY),
-        watchdog_interval=data.get(CONF_WATCHDOG_INTERVAL),
     )
 
     try:
         await hass.async_add_executor_job(client.connect)
         info = await hass.async_add_executor_job(client.get_info)
-    except ConnectionError as err:
-        raise CannotConnect from err
     except Exception as err:
-        _LOGGER.exception("Unexpected exception")
-        raise InvalidAuth from err
-    finally:
-        # Always close the client, even if there's an error
+        # Always close the client if the validation fails
         try:
             await hass.async_add_executor_job(client.close)
         except Exception:
             pass  # Ignore errors during cleanup
+        if isinstance(err, ConnectionError):
+            raise CannotConnect from err
+        _LOGGER.exception("Unexpected exception")
+        raise InvalidAuth from err
 
     # Return info that you want to store in the config entry.
     return {
         "title": f"TecnoAlarm {info.panel_type}",
         "panel_type": info.panel_type,
+        "client": client,
+        "info": info,
     }
 
 
@@ -97,6 +173,14 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlowHandler:
+        """Create the options flow."""
+        return OptionsFlowHandler(config_entry)
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -114,11 +198,17 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 errors["base"] = "unknown"
             else:
                 # Create unique ID based on host and port
-                await self.async_set_unique_id(
-                    f"{user_input[CONF_HOST]}:{user_input[CONF_PORT]}"
+                await self.async_set_unique_id(session_key(user_input))
+                try:
+                    self._abort_if_unique_id_configured()
+                except AbortFlow:
+                    await self.hass.async_add_executor_job(info["client"].close)
+                    raise
+
+                # Hand the open session over to the coordinator set up next
+                async_get_hub(self.hass).async_park_session(
+                    session_key(user_input), info["client"], info["info"]
                 )
-                self._abort_if_unique_id_configured()
-
                 return self.async_create_entry(title=info["title"], data=user_input)
 
         return self.async_show_form(
@@ -126,6 +216,33 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
 
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle the polling and feature options of a TecnoOut panel."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize the options flow."""
+        self.config_entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        key, default=get_option(self.config_entry, key, default)
+                    ): option_selector
+                    for key, default, option_selector in OPTIONS
+                }
+            ),
+        )
+
+
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
 
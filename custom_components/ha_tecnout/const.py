@@ -13,21 +13,88 @@ CONF_PASSPHRASE: Final = "passphrase"
 CONF_LEGACY: Final = "legacy"
 CONF_WATCHDOG_INTERVAL: Final = "watchdog_interval"
 CONF_CONTROL_PIN: Final = "control_pin"
+CONF_FAST_START: Final = "fast_start"
+CONF_ZONE_DIAGNOSTICS: Final = "zone_diagnostics"
+CONF_ZONE_ACTIVITY: Final = "zone_activity"
+CONF_LONG_TERM_STATISTICS: Final = "long_term_statistics"
+CONF_COMMAND_TIMEOUT: Final = "command_timeout"
+CONF_CYCLE_TIMEOUT: Final = "cycle_timeout"
+CONF_BUSY_RETRIES: Final = "busy_retries"
+CONF_STALE_AFTER: Final = "stale_after"
+CONF_POLL_INTERVAL: Final = "poll_interval"
+CONF_DESCRIPTIONS_INTERVAL: Final = "descriptions_interval"
+CONF_FULL_SWEEP_INTERVAL: Final = "full_sweep_interval"
+CONF_RATE_LIMIT: Final = "rate_limit"
+CONF_RATE_BURST: Final = "rate_burst"
+CONF_CONTROL_BURST: Final = "control_burst"
 
 # Default values
 DEFAULT_PORT: Final = 10001
 DEFAULT_LEGACY: Final = False
 DEFAULT_WATCHDOG_INTERVAL: Final = 30.0
+DEFAULT_FAST_START: Final = False
+DEFAULT_ZONE_DIAGNOSTICS: Final = False
+DEFAULT_ZONE_ACTIVITY: Final = False
+DEFAULT_LONG_TERM_STATISTICS: Final = False
+DEFAULT_COMMAND_TIMEOUT: Final = 5.0  # seconds for one request/response exchange
+DEFAULT_CYCLE_TIMEOUT: Final = 10.0  # seconds for the status reads of one cycle
+DEFAULT_BUSY_RETRIES: Final = 3  # retries of a command the panel answers busy
+DEFAULT_STALE_AFTER: Final = 30.0  # seconds a failing section keeps its last value
+DEFAULT_DESCRIPTIONS_INTERVAL: Final = 300  # seconds between zone/program description refreshes
+DEFAULT_FULL_SWEEP_INTERVAL: Final = 0.0  # max seconds between zone sweeps, 0 = every cycle
+DEFAULT_RATE_LIMIT: Final = 0.0  # commands per second sent to the panel, 0 = unlimited
+DEFAULT_RATE_BURST: Final = 5  # commands sent back to back once the limiter is idle
+DEFAULT_CONTROL_BURST: Final = 2  # extra burst kept for arm/disarm and isolation
 
 # Services
+ATTR_CONFIG_ENTRY_ID: Final = "config_entry_id"
 SERVICE_ARM_PROGRAM: Final = "arm_program"
 SERVICE_DISARM_PROGRAM: Final = "disarm_program"
 ATTR_PROGRAM_ID: Final = "program_id"
 ATTR_PIN: Final = "pin"
+SERVICE_PROFILE_CYCLES: Final = "profile_cycles"
+ATTR_ENABLED: Final = "enabled"
+SERVICE_TRACE_FRAMES: Final = "trace_frames"
+ATTR_SAMPLE_EVERY: Final = "sample_every"
+ATTR_COMMANDS: Final = "commands"
+ATTR_BUFFER_SIZE: Final = "buffer_size"
+SERVICE_RECORD_SESSION: Final = "record_session"
+SERVICE_CHECK_PROGRAM_READY: Final = "check_program_ready"
+SERVICE_QUERY_ZONES: Final = "query_zones"
+ATTR_ALL: Final = "all"
+ATTR_NONE: Final = "none"
+ATTR_ANY: Final = "any"
+SERVICE_ZONE_HISTORY: Final = "zone_history"
+ATTR_AT: Final = "at"
+ATTR_START: Final = "start"
+ATTR_END: Final = "end"
 
 # Update interval
 UPDATE_INTERVAL: Final = 1  # seconds - Fast polling for real-time zone updates
 
+# Multi-panel hub
+DATA_HUB: Final = f"{DOMAIN}_hub"
+HANDOFF_TIMEOUT: Final = 30  # seconds a validated config flow session waits to be adopted
+HUB_MAX_IO_WORKERS: Final = 4  # panels running blocking I/O at the same time
+
+# Last known state snapshot
+SNAPSHOT_SAVE_INTERVAL: Final = 60  # seconds between snapshot writes
+
+# Zone activity statistics
+ACTIVITY_SAVE_DELAY: Final = 60  # seconds to batch counter changes before saving
+
+# Long-term statistics
+STATISTICS_MAX_SAMPLE_GAP: Final = 60  # seconds of fault time one sample may account for
+
+# Zone state timeline
+TIMELINE_SIZE: Final = 10000  # changed cycles kept in memory
+
+# Cycle profiler
+PROFILER_WINDOW: Final = 300  # cycles kept in the rolling window
+
+# Frame tracer
+DEFAULT_TRACE_BUFFER_SIZE: Final = 500  # frames kept in the ring buffer
+
 # Device info
 MANUFACTURER: Final = "TecnoAlarm"
 MODEL: Final = "TecnoOut"
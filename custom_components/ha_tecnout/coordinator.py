@@ -1,18 +1,33 @@
 """DataUpdateCoordinator for TecnoAlarm TecnoOut integration."""
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
 import logging
 import time
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import STORAGE_DIR, Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.util import dt as dt_util
 
+from .tecnout.rate_limit import TokenBucket
 from .tecnout.tecnout_client import TecnoOutClient
+from .tecnout.activity import ZoneActivity
 from .tecnout.entities import GeneralStatus, ZoneDetailedStatus, ProgramStatus
+from .tecnout.io_thread import PanelIOThread
+from .tecnout.profiler import (
+    PHASE_DESCRIPTION_MERGE,
+    PHASE_ENTITY_WRITES,
+    CycleProfiler,
+)
+from .tecnout.recording import SessionRecorder
+from .tecnout.snapshot import encode_snapshot, read_snapshot, write_snapshot
+from .tecnout.sweep_gate import SweepGate
+from .tecnout.timeline import ZoneTimeline
+from .tecnout.tracing import FrameTracer
+from .tecnout.zone_index import ProgramZoneIndex, ZoneBitsets, zones_in
 
 from .const import (
     CONF_HOST,
@@ -21,51 +36,255 @@ from .const import (
     CONF_PASSPHRASE,
     CONF_LEGACY,
     CONF_WATCHDOG_INTERVAL,
+    CONF_FAST_START,
+    CONF_ZONE_DIAGNOSTICS,
+    CONF_ZONE_ACTIVITY,
+    CONF_LONG_TERM_STATISTICS,
+    CONF_POLL_INTERVAL,
+    CONF_DESCRIPTIONS_INTERVAL,
+    CONF_COMMAND_TIMEOUT,
+    CONF_CYCLE_TIMEOUT,
+    CONF_BUSY_RETRIES,
+    CONF_STALE_AFTER,
+    CONF_FULL_SWEEP_INTERVAL,
+    CONF_RATE_LIMIT,
+    CONF_RATE_BURST,
+    CONF_CONTROL_BURST,
+    DEFAULT_FAST_START,
+    DEFAULT_ZONE_DIAGNOSTICS,
+    DEFAULT_ZONE_ACTIVITY,
+    DEFAULT_LONG_TERM_STATISTICS,
+    DEFAULT_COMMAND_TIMEOUT,
+    DEFAULT_CYCLE_TIMEOUT,
+    DEFAULT_BUSY_RETRIES,
+    DEFAULT_STALE_AFTER,
+    DEFAULT_FULL_SWEEP_INTERVAL,
+    DEFAULT_RATE_LIMIT,
+    DEFAULT_RATE_BURST,
+    DEFAULT_CONTROL_BURST,
+    DEFAULT_DESCRIPTIONS_INTERVAL,
+    DEFAULT_TRACE_BUFFER_SIZE,
+    ACTIVITY_SAVE_DELAY,
     DOMAIN,
+    PROFILER_WINDOW,
+    SNAPSHOT_SAVE_INTERVAL,
+    TIMELINE_SIZE,
     UPDATE_INTERVAL,
 )
 
+from .hub import session_key
+
+if TYPE_CHECKING:
+    from .hub import TecnoOutHub
+    from .long_term_statistics import ActivityStatistics
+
 _LOGGER = logging.getLogger(__name__)
 
-# Interval for updating descriptions (5 minutes)
-DESCRIPTIONS_UPDATE_INTERVAL = 300  # seconds
+# Zones per description request while streaming them in (fast start)
+DESCRIPTIONS_STREAM_CHUNK = 8
+
+# Sections of the polled data, fetched and tracked independently
+SECTIONS = ("general_status", "zones", "programs")
+
+# Options that change the entities or the services set up: applied by a reload
+RELOAD_OPTIONS = {
+    CONF_ZONE_DIAGNOSTICS: DEFAULT_ZONE_DIAGNOSTICS,
+    CONF_ZONE_ACTIVITY: DEFAULT_ZONE_ACTIVITY,
+    CONF_LONG_TERM_STATISTICS: DEFAULT_LONG_TERM_STATISTICS,
+}
+
+
+def get_option(entry: ConfigEntry, key: str, default: Any = None) -> Any:
+    """Return an option, falling back to the value set up with the entry."""
+    return entry.options.get(key, entry.data.get(key, default))
+
+
+def snapshot_path(hass: HomeAssistant, entry_id: str) -> str:
+    """Return the path of the last known state snapshot of a config entry."""
+    return hass.config.path(STORAGE_DIR, f"{DOMAIN}.{entry_id}.snapshot")
+
+
+def _snapshot_complete(data: dict[str, Any]) -> bool:
+    """Return True if every section of ``data`` was fetched at least once."""
+    return (
+        data["general_status"] is not None
+        and bool(data["zones"])
+        and bool(data["programs"])
+    )
+
+
+def activity_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the store of the zone activity counters of a config entry."""
+    return Store(hass, 1, f"{DOMAIN}.{entry_id}.activity")
 
 
 class TecnoOutCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Class to manage fetching TecnoOut data."""
 
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+    def __init__(
+        self, hass: HomeAssistant, entry: ConfigEntry, hub: TecnoOutHub
+    ) -> None:
         """Initialize the coordinator."""
+        # Polling is scheduled by the hub, staggered with the other panels
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=UPDATE_INTERVAL),
+            update_interval=None,
         )
         self.entry = entry
+        self.hub = hub
+        self.poll_interval: float = float(
+            get_option(entry, CONF_POLL_INTERVAL, UPDATE_INTERVAL)
+        )
+        self.descriptions_interval: float = DEFAULT_DESCRIPTIONS_INTERVAL
+        # Keep-alive is handled by the hub instead of a watchdog thread per client
+        self.watchdog_interval: float | None = None
+        # Tail latency of a command and of the status reads of a cycle
+        self.command_timeout: float = DEFAULT_COMMAND_TIMEOUT
+        self.cycle_timeout: float = DEFAULT_CYCLE_TIMEOUT
+        self.busy_retries: int = DEFAULT_BUSY_RETRIES
+        # Seconds a section may keep failing before its entities are unavailable
+        self.stale_after: float = DEFAULT_STALE_AFTER
+        # Skip the zone sweep while general status and programs are unchanged
+        self.sweep_gate: SweepGate | None = None
+        # Options the entities were set up with, see RELOAD_OPTIONS
+        self._reload_options = {
+            key: get_option(entry, key, default) for key, default in RELOAD_OPTIONS.items()
+        }
+        # Monotonic time of the last successful fetch, and last error, by section
+        self.section_updated: dict[str, float] = {}
+        self.section_errors: dict[str, str] = {}
         self.client: TecnoOutClient | None = None
+        # The only thread that talks to the panel: every client call runs on it
+        self.io = PanelIOThread(f"tecnout_io_{entry.entry_id}", hub.io_limiter)
         self._zones_count: int = 0
         self._programs_count: int = 0
         self._zones_descriptions: list[str] = []
         self._programs_descriptions: list[str] = []
         self._last_descriptions_update: float = 0.0
+        self.profiler: CycleProfiler | None = None
+        self.tracer: FrameTracer | None = None
+        self.recorder: SessionRecorder | None = None
+        self.fast_start: bool = get_option(entry, CONF_FAST_START, DEFAULT_FAST_START)
+        self.startup_timings: dict[str, float] = {}
+        # Whether setup reused the session opened by the config flow
+        self.session_adopted = False
+        self._created = time.monotonic()
+        self._descriptions_task: asyncio.Task | None = None
+        self.snapshot_path = snapshot_path(hass, entry.entry_id)
+        # Wall-clock time of the restored snapshot while its data is shown
+        self.restored_at: float | None = None
+        self._snapshot_saved: float = 0.0
+        # Program -> member zones, indexed once from the zone settings
+        self.zone_index: ProgramZoneIndex | None = None
+        self._zone_bitsets: tuple[list[ZoneDetailedStatus] | None, ZoneBitsets] = (
+            None,
+            ZoneBitsets(()),
+        )
+        # Open zones and program bytes of every changed cycle, in memory only
+        self.timeline = ZoneTimeline(TIMELINE_SIZE)
+        # Per-zone activity counters, opt-in and persisted
+        self.zone_activity: ZoneActivity | None = None
+        self._activity_store = activity_store(hass, entry.entry_id)
+        # Start of the current local hour and day, refreshed every cycle
+        self.activity_period: tuple[float, float] = (0.0, 0.0)
+        # Hourly long-term statistics writer, opt-in
+        self.statistics: ActivityStatistics | None = None
+        self.async_apply_options()
+
+    @callback
+    def async_apply_options(self) -> bool:
+        """Apply the polling options to the running coordinator and client.
+
+        Returns False if an option changing the entities was modified, in
+        which case the entry has to be reloaded instead.
+        """
+        entry = self.entry
+        if any(
+            get_option(entry, key, default) != self._reload_options[key]
+            for key, default in RELOAD_OPTIONS.items()
+        ):
+            return False
+        poll_interval = float(get_option(entry, CONF_POLL_INTERVAL, UPDATE_INTERVAL))
+        self.descriptions_interval = float(
+            get_option(entry, CONF_DESCRIPTIONS_INTERVAL, DEFAULT_DESCRIPTIONS_INTERVAL)
+        )
+        self.watchdog_interval = get_option(entry, CONF_WATCHDOG_INTERVAL)
+        self.command_timeout = float(
+            get_option(entry, CONF_COMMAND_TIMEOUT, DEFAULT_COMMAND_TIMEOUT)
+        )
+        self.cycle_timeout = float(
+            get_option(entry, CONF_CYCLE_TIMEOUT, DEFAULT_CYCLE_TIMEOUT)
+        )
+        self.busy_retries = int(
+            get_option(entry, CONF_BUSY_RETRIES, DEFAULT_BUSY_RETRIES)
+        )
+        self.stale_after = float(
+            get_option(entry, CONF_STALE_AFTER, DEFAULT_STALE_AFTER)
+        )
+        full_sweep_interval = float(
+            get_option(entry, CONF_FULL_SWEEP_INTERVAL, DEFAULT_FULL_SWEEP_INTERVAL)
+        )
+        if full_sweep_interval <= 0:
+            self.sweep_gate = None
+        elif self.sweep_gate is None:
+            self.sweep_gate = SweepGate(full_sweep_interval)
+        else:
+            self.sweep_gate.forced_interval = full_sweep_interval
+        if self.profiler is not None:
+            self.profiler.budget = poll_interval
+        if self.client is not None:
+            self.client.command_timeout = self.command_timeout
+            self.client.busy_retries = self.busy_retries
+            self.client.rate_limiter = self._rate_limiter()
+        if poll_interval != self.poll_interval:
+            self.poll_interval = poll_interval
+            self.hub.async_reschedule()
+        return True
+
+    def _rate_limiter(self) -> TokenBucket | None:
+        """Return a token bucket for the rate limit options, or None if unlimited."""
+        rate = float(get_option(self.entry, CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT))
+        if rate <= 0:
+            return None
+        return TokenBucket(
+            rate,
+            int(get_option(self.entry, CONF_RATE_BURST, DEFAULT_RATE_BURST)),
+            int(get_option(self.entry, CONF_CONTROL_BURST, DEFAULT_CONTROL_BURST)),
+        )
 
     async def _async_setup(self) -> None:
         """Set up the client and get initial info."""
         try:
-            self.client = TecnoOutClient(
-                host=self.entry.data[CONF_HOST],
-                port=int(self.entry.data[CONF_PORT]),
-                user_code=int(self.entry.data[CONF_USER_CODE]),
-                passphrase=self.entry.data[CONF_PASSPHRASE],
-                legacy=self.entry.data.get(CONF_LEGACY, False),
-                watchdog_interval=self.entry.data.get(CONF_WATCHDOG_INTERVAL),
-            )
+            # Reuse the session the config flow just validated, if any
+            if (adopted := self.hub.async_adopt_session(session_key(self.entry.data))):
+                self.client, info = adopted
+                self.client.command_timeout = self.command_timeout
+                self.client.busy_retries = self.busy_retries
+                self.session_adopted = True
+            else:
+                self.client = TecnoOutClient(
+                    host=self.entry.data[CONF_HOST],
+                    port=int(self.entry.data[CONF_PORT]),
+                    user_code=int(self.entry.data[CONF_USER_CODE]),
+                    passphrase=self.entry.data[CONF_PASSPHRASE],
+                    legacy=self.entry.data.get(CONF_LEGACY, False),
+                    command_timeout=self.command_timeout,
+                    busy_retries=self.busy_retries,
+                )
+            self.client.rate_limiter = self._rate_limiter()
+            # Arm and disarm commands run while a read waits for a token
+            self.client.throttle_sleep = self.io.idle
+            self.client.profiler = self.profiler
+            self.client.tracer = self.tracer
+            self.client.recorder = self.recorder
 
-            await self.hass.async_add_executor_job(self.client.connect)
+            if adopted is None:
+                await self.io.run(self.client.connect)
 
-            # Get control panel info to know zones and programs count
-            info = await self.hass.async_add_executor_job(self.client.get_info)
+                # Get control panel info to know zones and programs count
+                info = await self.io.run(self.client.get_info)
             self._zones_count = info.associated_zones
             self._programs_count = info.programs_count
 
@@ -75,12 +294,31 @@ class TecnoOutCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 self._programs_count,
             )
 
-            # Get zones and programs descriptions (initial load)
-            await self._async_update_descriptions()
+            if self.fast_start:
+                # Program names decide which alarm panels are created, so load
+                # them now; the (many more) zone descriptions stream in later
+                if self._programs_count > 0:
+                    self._programs_descriptions = await self.io.run(
+                        self.client.get_programs_description, self._programs_count
+                    )
+                self._last_descriptions_update = time.time()
+                self._descriptions_task = self.hass.async_create_background_task(
+                    self._async_stream_zone_descriptions(),
+                    f"{DOMAIN}_zone_descriptions_{self.entry.entry_id}",
+                )
+            else:
+                # Get zones and programs descriptions (initial load)
+                await self._async_update_descriptions()
 
         except Exception as err:
-            _LOGGER.error("Error connecting to TecnoOut: %s", err)
-            raise ConfigEntryNotReady(f"Error connecting to TecnoOut: {err}") from err
+            _LOGGER.debug("Error connecting to TecnoOut: %s", err)
+            # Set up again on the next cycle (restored snapshot still shown)
+            if self.client is not None:
+                await self.io.run(self.client.close)
+                self.client = None
+            # Not ConfigEntryNotReady: the first refresh turns this into one,
+            # later cycles just report the failure
+            raise UpdateFailed(f"Error connecting to TecnoOut: {err}") from err
 
     async def _async_update_descriptions(self) -> None:
         """Update zones and programs descriptions from TecnoOut."""
@@ -90,14 +328,14 @@ class TecnoOutCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         try:
             # Update zones descriptions
             if self._zones_count > 0:
-                self._zones_descriptions = await self.hass.async_add_executor_job(
+                self._zones_descriptions = await self.io.run(
                     self.client.get_zones_description, self._zones_count
                 )
                 _LOGGER.debug("Updated %s zone descriptions", len(self._zones_descriptions))
 
             # Update programs descriptions
             if self._programs_count > 0:
-                self._programs_descriptions = await self.hass.async_add_executor_job(
+                self._programs_descriptions = await self.io.run(
                     self.client.get_programs_description, self._programs_count
                 )
                 _LOGGER.debug("Updated %s program descriptions", len(self._programs_descriptions))
@@ -107,64 +345,626 @@ class TecnoOutCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER.warning("Error updating descriptions: %s", err)
             # Don't raise - descriptions are not critical for real-time updates
 
+        if self.zone_index is None:
+            await self._async_load_zone_settings()
+
+    async def _async_load_zone_settings(self) -> None:
+        """Fetch the zone settings once and index the zones of each program."""
+        if self._zones_count == 0:
+            return
+        try:
+            settings = await self.io.run(
+                self.client.get_zones_setting, self._zones_count
+            )
+        except Exception as err:
+            _LOGGER.warning("Error loading zone settings: %s", err)
+            # Retried with the next descriptions update
+            return
+        self.zone_index = ProgramZoneIndex(settings)
+        _LOGGER.debug("Indexed program membership of %s zones", len(settings))
+
+    async def _async_stream_zone_descriptions(self) -> None:
+        """Load zone descriptions chunk by chunk after the entities exist.
+
+        Each chunk is a separate I/O job, so polling cycles interleave with the
+        download; the descriptions loaded so far are merged on every cycle and
+        entities rename themselves as their description lands.
+        """
+        zones_descriptions: list[str] = []
+        self._zones_descriptions = zones_descriptions
+        zone_from = 1
+        try:
+            while zone_from <= self._zones_count:
+                count = min(DESCRIPTIONS_STREAM_CHUNK, self._zones_count - zone_from + 1)
+                zones_descriptions.extend(
+                    await self.io.run(
+                        self.client.get_zones_description, count, zone_from
+                    )
+                )
+                zone_from += count
+        except Exception as err:
+            _LOGGER.warning("Error streaming zone descriptions: %s", err)
+            # Let the periodic update retry on the next cycle
+            self._last_descriptions_update = 0.0
+            return
+        finally:
+            self._descriptions_task = None
+        self.mark_startup("descriptions_s")
+        _LOGGER.info(
+            "TecnoOut startup: first entity after %ss, %s zone descriptions after %ss",
+            self.startup_timings.get("first_entity_s"),
+            len(zones_descriptions),
+            self.startup_timings["descriptions_s"],
+        )
+        if self.zone_index is None:
+            await self._async_load_zone_settings()
+
+    @property
+    def stale(self) -> bool:
+        """Return True while the data comes from a restored snapshot."""
+        return self.restored_at is not None
+
+    def get_zone(self, zone_idx: int) -> ZoneDetailedStatus | None:
+        """Return the last known status of a zone."""
+        zones: list[ZoneDetailedStatus] = self.data.get("zones", []) if self.data else []
+        # Zones are numbered from 1 in list order
+        if 0 < zone_idx <= len(zones):
+            zone = zones[zone_idx - 1]
+            if zone.idx == zone_idx:
+                return zone
+        for zone in zones:
+            if zone.idx == zone_idx:
+                return zone
+        return None
+
+    @property
+    def zone_bitsets(self) -> ZoneBitsets:
+        """Return the per-flag bitsets of the current zone table."""
+        zones = self.data.get("zones", []) if self.data else []
+        # Built once per zone table, however many queries run against it
+        cached_for, bitsets = self._zone_bitsets
+        if cached_for is not zones:
+            bitsets = ZoneBitsets(zones)
+            self._zone_bitsets = (zones, bitsets)
+        return bitsets
+
+    @property
+    def open_zones(self) -> int:
+        """Return the bitset of the open zones that are not isolated."""
+        return self.zone_bitsets.query(
+            all_of=("zone_status",), none_of=("isolation_active",)
+        )
+
+    def query_zones(
+        self,
+        all_of: list[str] | None = None,
+        none_of: list[str] | None = None,
+        any_of: list[str] | None = None,
+        program_idx: int | None = None,
+    ) -> list[int]:
+        """Return the numbers of the zones matching a flag filter.
+
+        :raises ValueError: If a flag is unknown, or a program is given
+            before the zone settings have been indexed.
+        """
+        within = None
+        if program_idx is not None:
+            if self.zone_index is None:
+                raise ValueError("Zone settings not loaded yet")
+            within = self.zone_index.members(program_idx)
+        return zones_in(
+            self.zone_bitsets.query(
+                all_of or (), none_of or (), any_of or (), within
+            )
+        )
+
+    def program_readiness(self, program_idx: int) -> dict[str, Any] | None:
+        """Return whether a program is ready to arm and the open zones blocking it.
+
+        Returns None until the zone settings have been indexed.
+        """
+        if self.zone_index is None:
+            return None
+        blocking = self.zone_index.blocking(program_idx, self.open_zones)
+        return {
+            "program": program_idx,
+            "ready": not blocking,
+            "blocking_zones": zones_in(blocking),
+            "unexcludable_zones": zones_in(
+                blocking & self.zone_index.cannot_be_excluded
+            ),
+        }
+
+    def _record_changes(self, data: dict[str, Any]) -> None:
+        """Feed the open zones of a cycle to the timeline and activity counters."""
+        now = time.time()
+        open_zones = 0
+        for zone in data["zones"]:
+            if zone.zone_status:
+                open_zones |= 1 << (zone.idx - 1)
+        programs = b"".join(program.to_bytes() for program in data["programs"])
+        self.timeline.append(now, open_zones, programs)
+        if self.zone_activity is not None:
+            self.activity_period = hour_start, day_start = self._activity_periods()
+            if self.zone_activity.update(now, open_zones, hour_start, day_start):
+                self._activity_store.async_delay_save(
+                    self._activity_data, ACTIVITY_SAVE_DELAY
+                )
+        if self.statistics is not None:
+            self.statistics.record(
+                now, open_zones, data["programs"], data["general_status"]
+            )
+
+    @staticmethod
+    def _activity_periods() -> tuple[float, float]:
+        """Return the start of the current local hour and day, as timestamps."""
+        now = dt_util.now()
+        return (
+            now.replace(minute=0, second=0, microsecond=0).timestamp(),
+            dt_util.start_of_local_day(now).timestamp(),
+        )
+
+    @callback
+    def async_setup_statistics(self) -> None:
+        """Start the hourly long-term statistics writer, if enabled."""
+        if not self._reload_options[CONF_LONG_TERM_STATISTICS]:
+            return
+        if "recorder" not in self.hass.config.components:
+            _LOGGER.warning("Long-term statistics need the recorder, not writing them")
+            return
+        # Imported here so the recorder is only loaded when statistics are used
+        from .long_term_statistics import ActivityStatistics
+
+        self.statistics = ActivityStatistics(self.hass, self)
+
+    def _activity_data(self) -> dict[str, Any]:
+        """Return the activity counters to persist."""
+        return self.zone_activity.to_dict(time.time())
+
+    async def async_load_activity(self) -> None:
+        """Restore the zone activity counters, if enabled."""
+        if not self._reload_options[CONF_ZONE_ACTIVITY]:
+            return
+        self.activity_period = self._activity_periods()
+        data = await self._activity_store.async_load()
+        try:
+            self.zone_activity = ZoneActivity.from_dict(data or {})
+        except (TypeError, ValueError) as err:
+            _LOGGER.warning("Ignoring saved TecnoOut zone activity: %s", err)
+            self.zone_activity = ZoneActivity()
+
+    @staticmethod
+    def _describe_programs(programs: bytes) -> list[dict[str, Any]]:
+        """Decode program status bytes for a service response."""
+        described = []
+        for idx, status_byte in enumerate(programs, start=1):
+            try:
+                program = ProgramStatus.from_bytes(status_byte, idx)
+            except ValueError:
+                described.append({"program": idx, "status": "unknown"})
+                continue
+            described.append(
+                {
+                    "program": idx,
+                    "status": program.program_status.name.lower(),
+                    "alarm": program.alarm,
+                }
+            )
+        return described
+
+    def zone_state_at(self, when: float) -> dict[str, Any] | None:
+        """Return the open zones and programs at a wall-clock time.
+
+        Returns None if the time predates the in-memory timeline.
+        """
+        state = self.timeline.state_at(when)
+        if state is None:
+            return None
+        return {
+            "time": dt_util.utc_from_timestamp(when).isoformat(),
+            "open_zones": zones_in(state.open_zones),
+            "programs": self._describe_programs(state.programs),
+        }
+
+    def zone_transitions(self, start: float, end: float) -> list[dict[str, Any]]:
+        """Return the zone and program changes between two wall-clock times."""
+        transitions = []
+        for transition in self.timeline.transitions(start, end):
+            item: dict[str, Any] = {
+                "time": dt_util.utc_from_timestamp(transition.time).isoformat(),
+                "opened": zones_in(transition.opened),
+                "closed": zones_in(transition.closed),
+            }
+            if transition.programs is not None:
+                item["programs"] = self._describe_programs(transition.programs)
+            transitions.append(item)
+        return transitions
+
+    def section_available(self, section: str) -> bool:
+        """Return True unless the section has been failing for too long."""
+        updated = self.section_updated.get(section)
+        return updated is not None and time.monotonic() - updated <= self.stale_after
+
+    def _update_section_errors(self, errors: dict[str, str]) -> None:
+        """Store the errors of a cycle, logging when a section fails or recovers."""
+        for section in SECTIONS:
+            error = errors.get(section)
+            if error is None:
+                if section in self.section_errors:
+                    _LOGGER.info("TecnoOut %s fetched again", section)
+            elif section in self.section_errors:
+                _LOGGER.debug("Error fetching TecnoOut %s: %s", section, error)
+            else:
+                _LOGGER.warning("Error fetching TecnoOut %s: %s", section, error)
+        self.section_errors = errors
+
+    def section_report(self) -> dict[str, dict[str, Any]]:
+        """Return the age and last error of every section."""
+        now = time.monotonic()
+        return {
+            section: {
+                "age_s": (
+                    round(now - self.section_updated[section], 3)
+                    if section in self.section_updated
+                    else None
+                ),
+                "available": self.section_available(section),
+                "error": self.section_errors.get(section),
+            }
+            for section in SECTIONS
+        }
+
+    async def async_restore_snapshot(self) -> bool:
+        """Rehydrate the data from the last snapshot, marked stale until the first poll.
+
+        The restored sections count as fetched now: if the panel stays
+        unreachable they go unavailable ``stale_after`` seconds later.
+        """
+        try:
+            snapshot = await self.hass.async_add_executor_job(
+                read_snapshot, self.snapshot_path
+            )
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as err:
+            _LOGGER.warning("Ignoring TecnoOut snapshot %s: %s", self.snapshot_path, err)
+            return False
+        self.restored_at = snapshot.saved_at
+        now = time.monotonic()
+        for section in SECTIONS:
+            self.section_updated[section] = now
+        self.data = {
+            "general_status": snapshot.general_status,
+            "zones": snapshot.zones,
+            "programs": snapshot.programs,
+        }
+        _LOGGER.info(
+            "Restored TecnoOut state from %s (%s zones, %s programs)",
+            time.ctime(snapshot.saved_at),
+            len(snapshot.zones),
+            len(snapshot.programs),
+        )
+        return True
+
+    async def _async_save_snapshot(self, data: dict[str, Any]) -> None:
+        """Persist the last known state of the panel."""
+        self._snapshot_saved = time.monotonic()
+        snapshot = encode_snapshot(
+            time.time(), data["general_status"], data["zones"], data["programs"]
+        )
+        try:
+            await self.hass.async_add_executor_job(
+                write_snapshot, self.snapshot_path, snapshot
+            )
+        except OSError as err:
+            _LOGGER.warning("Error saving TecnoOut snapshot: %s", err)
+
+    def mark_startup(self, milestone: str) -> None:
+        """Record the time elapsed from coordinator creation to a startup milestone."""
+        if milestone not in self.startup_timings:
+            self.startup_timings[milestone] = round(time.monotonic() - self._created, 3)
+
+    def set_profiling(self, enabled: bool) -> None:
+        """Enable or disable the cycle-time profiler."""
+        if enabled and self.profiler is None:
+            self.profiler = CycleProfiler(
+                window=PROFILER_WINDOW,
+                budget=self.poll_interval,
+            )
+        elif not enabled:
+            self.profiler = None
+        if self.client is not None:
+            self.client.profiler = self.profiler
+
+    def profile_report(self) -> dict[str, Any]:
+        """Return the cycle-time breakdown, or an empty report when disabled."""
+        if self.profiler is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.profiler.report()}
+
+    def set_frame_tracing(
+        self,
+        enabled: bool,
+        size: int = DEFAULT_TRACE_BUFFER_SIZE,
+        sample_every: int = 1,
+        commands: list[int] | None = None,
+    ) -> None:
+        """Enable (replacing any previous tracer) or disable frame tracing."""
+        self.tracer = (
+            FrameTracer(size=size, sample_every=sample_every, commands=commands)
+            if enabled
+            else None
+        )
+        if self.client is not None:
+            self.client.tracer = self.tracer
+
+    def frame_trace_dump(self) -> dict[str, Any]:
+        """Return the traced frames, or an empty dump when disabled."""
+        if self.tracer is None:
+            return {"enabled": False, "frames": []}
+        return {"enabled": True, "frames": self.tracer.dump()}
+
+    async def async_set_recording(self, enabled: bool) -> None:
+        """Start recording the session to a file in the config dir, or stop."""
+        if self.client is None:
+            raise UpdateFailed("Client not initialized")
+
+        if self.recorder is not None and self.client.recorder is not None:
+            self.client.recorder = None
+            # After the command in flight, if any, has been recorded
+            await self.io.run(self.recorder.close)
+            _LOGGER.info("Session recorded to %s", self.recorder.path)
+        if not enabled:
+            return
+
+        path = self.hass.config.path(
+            f"{DOMAIN}_{self.entry.entry_id}_{int(time.time())}.tosr"
+        )
+        self.recorder = await self.hass.async_add_executor_job(
+            SessionRecorder, path, self.entry.data.get(CONF_LEGACY, False)
+        )
+        self.client.recorder = self.recorder
+        # Capture the setup exchanges too, so the session can be replayed from start
+        await self.io.run(self.client.get_info)
+        self._last_descriptions_update = 0.0
+
+    def busy_retry_report(self) -> dict[str, dict[str, int]]:
+        """Return how often each command was retried, or gave up, on a busy panel."""
+        if self.client is None:
+            return {}
+        return {
+            f"{command:#04x}": {
+                "retries": self.client.busy_retry_counts[command],
+                "exhausted": self.client.busy_exhausted_counts[command],
+            }
+            for command in sorted(
+                self.client.busy_retry_counts | self.client.busy_exhausted_counts
+            )
+        }
+
+    def throttle_report(self) -> dict[str, Any]:
+        """Return how often and how long each command waited for the rate limit."""
+        if self.client is None or self.client.rate_limiter is None:
+            return {"enabled": False}
+        limiter = self.client.rate_limiter
+        return {
+            "enabled": True,
+            "rate": limiter.rate,
+            "burst": limiter.burst,
+            "control_burst": limiter.reserved,
+            "commands": {
+                f"{command:#04x}": {
+                    "throttled": count,
+                    "delay_total_s": round(self.client.throttle_delays[command], 3),
+                    "delay_max_s": round(self.client.throttle_max_delays[command], 3),
+                }
+                for command, count in sorted(self.client.throttled_counts.items())
+            },
+        }
+
+    def recording_status(self) -> dict[str, Any]:
+        """Return the state of the session recorder."""
+        if self.recorder is None:
+            return {"recording": False}
+        return {
+            "recording": self.client is not None and self.client.recorder is not None,
+            "path": self.recorder.path,
+            "frames": self.recorder.frames,
+        }
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all registered listeners, timing entity state writes."""
+        profiler = self.profiler
+        if profiler is None or not profiler.in_cycle:
+            super().async_update_listeners()
+            return
+        start = profiler.clock()
+        super().async_update_listeners()
+        profiler.mark(PHASE_ENTITY_WRITES, start)
+        profiler.end_cycle()
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from TecnoOut."""
         _LOGGER.debug("Init Client - _async_update_data")
+        profiler = self.profiler
+        if profiler is None:
+            return await self._async_poll()
+        profiler.begin_cycle()
+        try:
+            return await self._async_poll()
+        except BaseException:
+            # Listeners are not updated after a failed refresh: close the
+            # cycle now, before the wait for the next poll counts towards it
+            profiler.end_cycle()
+            raise
+
+    async def _async_poll(self) -> dict[str, Any]:
+        """Run one polling cycle, keeping the last good data of failed sections."""
         if self.client is None:
-            await self._async_setup()
+            try:
+                await self._async_setup()
+            except UpdateFailed as err:
+                self._update_section_errors({section: str(err) for section in SECTIONS})
+                if not any(self.section_available(section) for section in SECTIONS):
+                    raise
+                # Keep the last good data while the grace period lasts
+                _LOGGER.debug("Keeping the last TecnoOut data: %s", err)
+                return self.data
 
-        # Update descriptions periodically (every 5 minutes)
+        # Update descriptions periodically (every 5 minutes by default)
         current_time = time.time()
-        if current_time - self._last_descriptions_update >= DESCRIPTIONS_UPDATE_INTERVAL:
-            await self._async_update_descriptions()            
+        if (
+            self._descriptions_task is None
+            and current_time - self._last_descriptions_update
+            >= self.descriptions_interval
+        ):
+            await self._async_update_descriptions()
 
-        try:
-            # Get general status (lightweight, always needed)
-            general_status: GeneralStatus = await self.hass.async_add_executor_job(
-                self.client.get_general_status
-            )
-            _LOGGER.debug("General Status: %s", general_status)
-            # Get zones detailed status (critical for binary sensors)
-            zones: list[ZoneDetailedStatus] = []
-            if self._zones_count > 0:
-                zones = await self.hass.async_add_executor_job(
-                    self.client.get_zones_detail, self._zones_count
-                )
-                # Add cached descriptions to zones (no API call needed)
-                for zone in zones:
-                    if 1 <= zone.idx <= len(self._zones_descriptions):
-                        zone.description = self._zones_descriptions[zone.idx - 1]
-            _LOGGER.debug("Zones: %s", zones)
-            # Get programs status (less critical for real-time updates)
-            programs: list[ProgramStatus] = []
-            if self._programs_count > 0:
-                programs = await self.hass.async_add_executor_job(
-                    self.client.get_programs_status, self._programs_count
+        # Every status read of the cycle shares one deadline
+        deadline = time.monotonic() + self.cycle_timeout
+        # Sections that fail keep their last good value
+        data: dict[str, Any] = dict(self.data) if self.data else {
+            "general_status": None,
+            "zones": [],
+            "programs": [],
+        }
+        errors = await self._async_fetch_sections(data, deadline)
+        self._update_section_errors(errors)
+
+        if errors and len(errors) == len(SECTIONS):
+            if not any(self.section_available(section) for section in SECTIONS):
+                raise UpdateFailed(
+                    f"Error communicating with TecnoOut: {errors['general_status']}"
                 )
-                # Add cached descriptions to programs (no API call needed)
-                for program in programs:
-                    if 1 <= program.idx <= len(self._programs_descriptions):
-                        program.name = self._programs_descriptions[program.idx - 1]
-            _LOGGER.debug("Programs: %s", programs)
-            return {
-                "general_status": general_status,
-                "zones": zones,
-                "programs": programs,
-            }
+        elif self.restored_at is not None:
+            # The panel answers again; sections still failing keep the
+            # grace period that started with the restore
+            self.restored_at = None
 
-        except Exception as err:
-            _LOGGER.error("Error fetching TecnoOut data: %s", err)
-            raise UpdateFailed(f"Error communicating with TecnoOut: {err}") from err
+        if len(errors) < len(SECTIONS):
+            self._record_changes(data)
+
+        if not errors and (
+            time.monotonic() - self._snapshot_saved >= SNAPSHOT_SAVE_INTERVAL
+        ):
+            self.hass.async_create_background_task(
+                self._async_save_snapshot(data),
+                f"{DOMAIN}_snapshot_{self.entry.entry_id}",
+            )
+        return data
+
+    async def _async_fetch_sections(
+        self, data: dict[str, Any], deadline: float
+    ) -> dict[str, str]:
+        """Fetch every section into ``data`` and return the errors by section."""
+        errors: dict[str, str] = {}
+        # Zones last: their sweep may be skipped depending on the other two
+        for section, fetch in (
+            ("general_status", self._async_fetch_general_status),
+            ("programs", self._async_fetch_programs),
+            ("zones", self._async_fetch_zones),
+        ):
+            if section == "zones" and not self._zone_sweep_due(data, errors):
+                # Indicators unchanged since the last good sweep
+                self.section_updated[section] = time.monotonic()
+                continue
+            try:
+                data[section] = await fetch(deadline)
+            except Exception as err:  # pylint: disable=broad-except
+                errors[section] = str(err)
+                if section == "zones" and self.sweep_gate is not None:
+                    self.sweep_gate.request()
+            else:
+                self.section_updated[section] = time.monotonic()
+                if section == "zones" and self.sweep_gate is not None:
+                    self.sweep_gate.swept(
+                        time.monotonic(),
+                        b"".join(zone.to_bytes() for zone in data[section]),
+                    )
+        return errors
+
+    def _zone_sweep_due(self, data: dict[str, Any], errors: dict[str, str]) -> bool:
+        """Return True unless the sweep gate allows reusing the last zones."""
+        if self.sweep_gate is None:
+            return True
+        indicators = None
+        if (
+            "general_status" not in errors
+            and "programs" not in errors
+            and data["general_status"] is not None
+        ):
+            # Flag bytes of 0x01 and the program status bytes
+            indicators = data["general_status"].to_bytes()[8:] + b"".join(
+                program.to_bytes() for program in data["programs"]
+            )
+        return self.sweep_gate.should_sweep(time.monotonic(), indicators)
+
+    def sweep_report(self) -> dict[str, Any]:
+        """Return how many zone sweeps were avoided and changes caught late."""
+        if self.sweep_gate is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.sweep_gate.report()}
+
+    async def _async_fetch_general_status(self, deadline: float) -> GeneralStatus:
+        """Fetch the general status (lightweight, always needed)."""
+        general_status: GeneralStatus = await self.io.run(
+            self.client.get_general_status, deadline=deadline
+        )
+        _LOGGER.debug("General Status: %s", general_status)
+        return general_status
+
+    async def _async_fetch_zones(self, deadline: float) -> list[ZoneDetailedStatus]:
+        """Fetch the zones detailed status (critical for binary sensors)."""
+        zones: list[ZoneDetailedStatus] = []
+        if self._zones_count > 0:
+            zones = await self.io.run(
+                self.client.get_zones_detail, self._zones_count, deadline=deadline
+            )
+            # Add cached descriptions to zones (no API call needed)
+            profiler = self.profiler
+            if profiler is not None:
+                merge_start = profiler.clock()
+            for zone in zones:
+                if 1 <= zone.idx <= len(self._zones_descriptions):
+                    zone.description = self._zones_descriptions[zone.idx - 1]
+            if profiler is not None:
+                profiler.mark(PHASE_DESCRIPTION_MERGE, merge_start)
+        _LOGGER.debug("Fetched %s zones", len(zones))
+        return zones
+
+    async def _async_fetch_programs(self, deadline: float) -> list[ProgramStatus]:
+        """Fetch the programs status (less critical for real-time updates)."""
+        programs: list[ProgramStatus] = []
+        if self._programs_count > 0:
+            programs = await self.io.run(
+                self.client.get_programs_status,
+                self._programs_count,
+                deadline=deadline,
+            )
+            # Add cached descriptions to programs (no API call needed)
+            profiler = self.profiler
+            if profiler is not None:
+                merge_start = profiler.clock()
+            for program in programs:
+                if 1 <= program.idx <= len(self._programs_descriptions):
+                    program.name = self._programs_descriptions[program.idx - 1]
+            if profiler is not None:
+                profiler.mark(PHASE_DESCRIPTION_MERGE, merge_start)
+        _LOGGER.debug("Fetched %s programs", len(programs))
+        return programs
 
     async def async_set_program(self, program_idx: int, status: int) -> None:
         """Set program status."""
         if self.client is None:
             raise UpdateFailed("Client not initialized")
 
+        if self.sweep_gate is not None:
+            self.sweep_gate.request()
         try:
             from .tecnout.entities import SetProgramStatusEnum
 
-            await self.hass.async_add_executor_job(
+            await self.io.run_urgent(
                 self.client.set_program, program_idx, SetProgramStatusEnum(status)
             )
             await self.async_request_refresh()
@@ -179,8 +979,10 @@ class TecnoOutCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if self.client is None:
             raise UpdateFailed("Client not initialized")
 
+        if self.sweep_gate is not None:
+            self.sweep_gate.request()
         try:
-            await self.hass.async_add_executor_job(
+            await self.io.run_urgent(
                 self.client.set_zone_isolation, zone_number, isolate
             )
             await self.async_request_refresh()
@@ -190,7 +992,31 @@ class TecnoOutCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     async def async_shutdown(self) -> None:
         """Shutdown the coordinator."""
+        self._cancel_descriptions()
+        try:
+            if self.data and not self.stale and _snapshot_complete(self.data):
+                await self._async_save_snapshot(self.data)
+            if self.zone_activity is not None:
+                await self._activity_store.async_save(self._activity_data())
+            if self.statistics is not None:
+                await self.statistics.async_shutdown()
+        finally:
+            # Never leak the connection and the I/O thread on unload
+            await self.async_close()
+
+    async def async_close(self) -> None:
+        """Close the connection and end the I/O thread, saving nothing."""
+        self._cancel_descriptions()
         if self.client:
-            await self.hass.async_add_executor_job(self.client.close)
+            await self.io.run(self.client.close)
             self.client = None
+        self.io.stop()
+        if self.recorder is not None:
+            await self.hass.async_add_executor_job(self.recorder.close)
+
+    def _cancel_descriptions(self) -> None:
+        """Stop the background download of the zone descriptions."""
+        if self._descriptions_task is not None:
+            self._descriptions_task.cancel()
+            self._descriptions_task = None
 
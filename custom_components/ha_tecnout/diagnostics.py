@@ -0,0 +1,40 @@
+"""Diagnostics support for TecnoAlarm TecnoOut integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_CONTROL_PIN, CONF_PASSPHRASE, CONF_USER_CODE, DOMAIN
+from .coordinator import TecnoOutCoordinator
+
+TO_REDACT = {CONF_USER_CODE, CONF_PASSPHRASE, CONF_CONTROL_PIN}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: TecnoOutCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    return {
+        "entry": async_redact_data(entry.data, TO_REDACT),
+        "options": dict(entry.options),
+        "last_update_success": coordinator.last_update_success,
+        "restored_at": coordinator.restored_at,
+        "sections": coordinator.section_report(),
+        "startup": {
+            "fast_start": coordinator.fast_start,
+            "session_adopted": coordinator.session_adopted,
+            **coordinator.startup_timings,
+        },
+        "cycle_profile": coordinator.profile_report(),
+        "busy_retries": coordinator.busy_retry_report(),
+        "zone_sweeps": coordinator.sweep_report(),
+        "throttling": coordinator.throttle_report(),
+        "frame_trace": coordinator.frame_trace_dump(),
+        "session_recording": coordinator.recording_status(),
+        "hub": coordinator.hub.health(),
+    }
@@ -0,0 +1,31 @@
+"""Base entity for TecnoAlarm TecnoOut integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN, MANUFACTURER
+from .coordinator import TecnoOutCoordinator
+
+
+class TecnoOutEntity(CoordinatorEntity[TecnoOutCoordinator]):
+    """An entity of the TecnoOut control panel device."""
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """Return device information."""
+        general_status = self.coordinator.data.get("general_status")
+        device_name = (
+            general_status.control_panel_type if general_status else "TecnoAlarm"
+        )
+
+        return {
+            "identifiers": {(DOMAIN, self.coordinator.entry.entry_id)},
+            "name": device_name,
+            "manufacturer": MANUFACTURER,
+            "model": general_status.control_panel_type if general_status else "Unknown",
+            "sw_version": (
+                general_status.firmware_release if general_status else None
+            ),
+        }
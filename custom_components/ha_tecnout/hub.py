@@ -0,0 +1,264 @@
+"""Domain-level hub scheduling polling for all TecnoOut panels."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import (
+    CONF_HOST,
+    CONF_PORT,
+    DATA_HUB,
+    HANDOFF_TIMEOUT,
+    HUB_MAX_IO_WORKERS,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import TecnoOutCoordinator
+    from .tecnout.entities import ControlPanelInfo
+    from .tecnout.tecnout_client import TecnoOutClient
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class PanelSlot:
+    """Polling slot and cycle health of one panel."""
+
+    coordinator: TecnoOutCoordinator
+    next_due: float = 0.0
+    phase: float = 0.0
+    in_flight: bool = False
+    cycles: int = 0
+    failures: int = 0
+    skipped: int = 0
+    overruns: int = 0
+    keep_alives: int = 0
+    last_duration: float = 0.0
+    max_duration: float = 0.0
+    task: asyncio.Task | None = field(default=None, repr=False)
+
+    def health(self) -> dict[str, Any]:
+        """Return the cycle health of the panel."""
+        return {
+            "interval_s": self.coordinator.poll_interval,
+            "phase_s": round(self.phase, 3),
+            "cycles": self.cycles,
+            "failures": self.failures,
+            "skipped": self.skipped,
+            "overruns": self.overruns,
+            "keep_alives": self.keep_alives,
+            "io_calls": self.coordinator.io.calls,
+            "io_pending": self.coordinator.io.pending,
+            "last_duration_ms": round(self.last_duration * 1000, 3),
+            "max_duration_ms": round(self.max_duration * 1000, 3),
+        }
+
+
+def session_key(data: Mapping[str, Any]) -> str:
+    """Return the key of a panel session: the unique ID of its config entry."""
+    return f"{data[CONF_HOST]}:{data[CONF_PORT]}"
+
+
+@dataclass
+class ParkedSession:
+    """A connected client validated by the config flow, awaiting its coordinator."""
+
+    client: TecnoOutClient
+    info: ControlPanelInfo
+    cancel: Callable[[], None] = field(repr=False)
+
+
+class TecnoOutHub:
+    """Own the polling schedule of every configured panel and cap their I/O.
+
+    Panels are polled from a single timer, with their phases spread evenly
+    over the polling interval so they do not fire in lockstep. Each panel
+    has its own I/O thread (see ``TecnoOutCoordinator.io``); the hub only
+    limits how many of them run a call at once, with ``io_limiter``.
+    Keep-alive runs on those threads and replaces the per-client watchdog
+    threads.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the hub."""
+        self.hass = hass
+        self._slots: dict[str, PanelSlot] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._sessions: dict[str, ParkedSession] = {}
+        # Shared by the I/O threads of all panels; control commands bypass it
+        self.io_limiter = asyncio.Semaphore(HUB_MAX_IO_WORKERS)
+
+    @callback
+    def async_add(self, coordinator: TecnoOutCoordinator) -> None:
+        """Start polling a panel."""
+        self._slots[coordinator.entry.entry_id] = PanelSlot(coordinator)
+        self._async_stagger()
+
+    @callback
+    def async_remove(self, entry_id: str) -> None:
+        """Stop polling a panel."""
+        slot = self._slots.pop(entry_id, None)
+        if slot is not None and slot.task is not None:
+            slot.task.cancel()
+        self._async_stagger()
+
+    @callback
+    def async_reschedule(self) -> None:
+        """Spread the phases again after the poll interval of a panel changed."""
+        self._async_stagger()
+
+    @property
+    def empty(self) -> bool:
+        """Return True if no panel is registered."""
+        return not self._slots
+
+    @callback
+    def shutdown(self) -> None:
+        """Stop the timer and close the sessions nobody adopted."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        for key in list(self._sessions):
+            self._async_close_session(key)
+
+    @callback
+    def async_park_session(
+        self, key: str, client: TecnoOutClient, info: ControlPanelInfo
+    ) -> None:
+        """Keep a validated session open for the coordinator set up next.
+
+        Panels often accept a single client and are slow to release a
+        session, so reusing the one the config flow opened spares a second
+        connect and handshake. Sessions not adopted in time are closed.
+        """
+        self._async_close_session(key)
+        self._sessions[key] = ParkedSession(
+            client,
+            info,
+            async_call_later(
+                self.hass, HANDOFF_TIMEOUT, partial(self._async_expire_session, key)
+            ),
+        )
+
+    @callback
+    def async_adopt_session(
+        self, key: str
+    ) -> tuple[TecnoOutClient, ControlPanelInfo] | None:
+        """Take over the parked session of a panel, if there is one."""
+        if (session := self._sessions.pop(key, None)) is None:
+            return None
+        session.cancel()
+        return session.client, session.info
+
+    @callback
+    def _async_expire_session(self, key: str, _now: Any) -> None:
+        """Close a parked session nobody adopted."""
+        _LOGGER.debug("Closing the unused TecnoOut session of %s", key)
+        self._async_close_session(key)
+
+    @callback
+    def _async_close_session(self, key: str) -> None:
+        """Close and forget a parked session, if there is one."""
+        if (session := self._sessions.pop(key, None)) is None:
+            return
+        session.cancel()
+        self.hass.async_add_executor_job(session.client.close)
+
+    @callback
+    def _async_stagger(self) -> None:
+        """Spread the poll phases of all panels evenly and reschedule."""
+        now = self.hass.loop.time()
+        count = len(self._slots)
+        for index, slot in enumerate(self._slots.values()):
+            slot.phase = slot.coordinator.poll_interval * index / count
+            slot.next_due = now + slot.phase
+        self._async_schedule()
+
+    @callback
+    def _async_schedule(self) -> None:
+        """Arm the timer for the earliest due panel."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._slots:
+            next_due = min(slot.next_due for slot in self._slots.values())
+            self._timer = self.hass.loop.call_at(next_due, self._async_on_timer)
+
+    @callback
+    def _async_on_timer(self) -> None:
+        """Start the refresh of every due panel."""
+        self._timer = None
+        now = self.hass.loop.time()
+        for slot in self._slots.values():
+            if slot.next_due > now:
+                continue
+            interval = slot.coordinator.poll_interval
+            # Keep the phase: skip missed periods instead of bursting
+            while slot.next_due <= now:
+                slot.next_due += interval
+            if slot.in_flight:
+                slot.skipped += 1
+                continue
+            slot.in_flight = True
+            slot.task = self.hass.async_create_task(self._async_poll(slot))
+        self._async_schedule()
+
+    async def _async_poll(self, slot: PanelSlot) -> None:
+        """Refresh one panel and update its health counters."""
+        coordinator = slot.coordinator
+        start = time.monotonic()
+        try:
+            await coordinator.async_refresh()
+        finally:
+            slot.in_flight = False
+            slot.task = None
+        duration = time.monotonic() - start
+        slot.cycles += 1
+        slot.last_duration = duration
+        slot.max_duration = max(slot.max_duration, duration)
+        if duration > coordinator.poll_interval:
+            slot.overruns += 1
+        if coordinator.last_update_success:
+            return
+        slot.failures += 1
+        # Watchdog duty: reconnect once the panel has been silent long enough
+        client = coordinator.client
+        interval = coordinator.watchdog_interval
+        if (
+            client is not None
+            and interval is not None
+            and time.monotonic() - client.last_response >= interval
+        ):
+            slot.keep_alives += 1
+            try:
+                await coordinator.io.run(client.keep_alive)
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.error("Failed to reconnect to TecnoOut: %s", err)
+
+    def health(self) -> dict[str, Any]:
+        """Return the cycle health of the hub and every panel."""
+        return {
+            "panels": len(self._slots),
+            "threads": threading.active_count(),
+            "io_workers": HUB_MAX_IO_WORKERS,
+            "slots": {
+                entry_id: slot.health() for entry_id, slot in self._slots.items()
+            },
+        }
+
+
+@callback
+def async_get_hub(hass: HomeAssistant) -> TecnoOutHub:
+    """Return the hub, creating it on first use."""
+    if (hub := hass.data.get(DATA_HUB)) is None:
+        hub = hass.data[DATA_HUB] = TecnoOutHub(hass)
+    return hub
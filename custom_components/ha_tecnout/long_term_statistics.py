@@ -0,0 +1,187 @@
+"""Hourly long-term statistics of zone activations, alarms and panel faults."""
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.const import UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, STATISTICS_MAX_SAMPLE_GAP
+from .tecnout.entities import GeneralStatus, ProgramStatus
+from .tecnout.zone_index import zones_in
+
+if TYPE_CHECKING:
+    from .coordinator import TecnoOutCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+HOUR = 3600
+
+# General status flags counted as panel fault time
+PANEL_FAULT_FLAGS = (
+    "general_alarm_failure",
+    "general_low_battery",
+    "general_power_failure",
+    "general_tamper",
+    "wireless_failure",
+)
+
+
+class ActivityStatistics:
+    """Aggregate cycle samples into hourly buckets and import them as statistics.
+
+    Every sample only costs a few integer operations; at each hour boundary
+    the non-empty buckets of the hour that ended are written as external
+    statistics (``ha_tecnout:<entry>_...``) with a running sum, so the
+    zone entities themselves can be excluded from the recorder.
+    """
+
+    def __init__(self, hass: HomeAssistant, coordinator: TecnoOutCoordinator) -> None:
+        """Initialize the writer."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self._prefix = f"{DOMAIN}:{coordinator.entry.entry_id.lower()}"
+        self._hour: float | None = None
+        self._bucket: dict[str, float] = {}
+        # Start, running sum and state of the last row written, by statistic id
+        self._sums: dict[str, tuple[float, float, float]] = {}
+        self._last_sample: float | None = None
+        self._open_zones = 0
+        self._alarms = 0
+        self._faulted = False
+
+    @callback
+    def record(
+        self,
+        now: float,
+        open_zones: int,
+        programs: list[ProgramStatus],
+        general_status: GeneralStatus | None,
+    ) -> None:
+        """Add one cycle: open zones bitset, program and general status."""
+        alarms = 0
+        for program in programs:
+            if program.alarm:
+                alarms |= 1 << (program.idx - 1)
+        faulted = general_status is not None and any(
+            getattr(general_status, flag) for flag in PANEL_FAULT_FLAGS
+        )
+        hour = now - now % HOUR
+        if self._hour is not None and hour != self._hour:
+            self.async_flush()
+        self._hour = hour
+
+        if self._last_sample is not None:
+            for zone_idx in zones_in(open_zones & ~self._open_zones):
+                self._add(f"zone_{zone_idx}_activations", 1)
+            for program_idx in zones_in(alarms & ~self._alarms):
+                self._add(f"program_{program_idx}_alarms", 1)
+            if self._faulted:
+                gap = min(now - self._last_sample, STATISTICS_MAX_SAMPLE_GAP)
+                self._add("panel_fault_time", max(gap, 0.0))
+        self._last_sample = now
+        self._open_zones = open_zones
+        self._alarms = alarms
+        self._faulted = faulted
+
+    def _add(self, key: str, value: float) -> None:
+        self._bucket[key] = self._bucket.get(key, 0) + value
+
+    @callback
+    def async_flush(self) -> None:
+        """Write the current buckets in the background and start new ones."""
+        if not self._bucket or self._hour is None:
+            return
+        bucket, self._bucket = self._bucket, {}
+        self.hass.async_create_background_task(
+            self._async_write(self._hour, bucket),
+            f"{DOMAIN}_statistics_{self.coordinator.entry.entry_id}",
+        )
+
+    async def async_shutdown(self) -> None:
+        """Write the partial buckets of the current hour."""
+        if not self._bucket or self._hour is None:
+            return
+        bucket, self._bucket = self._bucket, {}
+        await self._async_write(self._hour, bucket)
+
+    def _metadata(self, key: str) -> tuple[str, str | None]:
+        """Return the name and unit of a statistic."""
+        kind, _, rest = key.partition("_")
+        if kind == "zone":
+            zone_idx = int(rest.split("_")[0])
+            zone = self.coordinator.get_zone(zone_idx)
+            name = zone.description if zone and zone.description else f"Zone {zone_idx}"
+            return f"{name} activations", None
+        if kind == "program":
+            return f"Program {rest.split('_')[0]} alarms", None
+        return "Panel fault time", UnitOfTime.SECONDS
+
+    async def _async_write(self, hour: float, bucket: dict[str, float]) -> None:
+        """Import one hour of buckets, continuing the running sums."""
+        statistic_ids = {key: f"{self._prefix}_{key}" for key in bucket}
+        missing = [
+            statistic_id
+            for statistic_id in statistic_ids.values()
+            if statistic_id not in self._sums
+        ]
+        if missing:
+            self._sums.update(
+                await get_instance(self.hass).async_add_executor_job(
+                    self._load_sums, missing
+                )
+            )
+        start = dt_util.utc_from_timestamp(hour)
+        for key, value in bucket.items():
+            statistic_id = statistic_ids[key]
+            name, unit = self._metadata(key)
+            last_start, last_sum, last_state = self._sums[statistic_id]
+            if last_start == hour:
+                # Same hour written before a restart: extend that row
+                value += last_state
+                last_sum -= last_state
+            total = last_sum + value
+            self._sums[statistic_id] = (hour, total, value)
+            async_add_external_statistics(
+                self.hass,
+                StatisticMetaData(
+                    has_mean=False,
+                    has_sum=True,
+                    name=name,
+                    source=DOMAIN,
+                    statistic_id=statistic_id,
+                    unit_of_measurement=unit,
+                ),
+                [StatisticData(start=start, state=value, sum=total)],
+            )
+        _LOGGER.debug(
+            "Imported %s statistics for %s", len(bucket), start.isoformat()
+        )
+
+    def _load_sums(
+        self, statistic_ids: list[str]
+    ) -> dict[str, tuple[float, float, float]]:
+        """Return the start, sum and state of the last row of each statistic."""
+        sums = {}
+        for statistic_id in statistic_ids:
+            rows = get_last_statistics(
+                self.hass, 1, statistic_id, False, {"state", "sum"}
+            ).get(statistic_id)
+            if rows:
+                row = rows[0]
+                sums[statistic_id] = (
+                    row["start"],
+                    row.get("sum") or 0.0,
+                    row.get("state") or 0.0,
+                )
+            else:
+                sums[statistic_id] = (0.0, 0.0, 0.0)
+        return sums
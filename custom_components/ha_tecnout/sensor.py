@@ -0,0 +1,159 @@
+"""Sensor platform for TecnoAlarm TecnoOut integration."""
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .coordinator import TecnoOutCoordinator
+from .entity import TecnoOutEntity
+from .tecnout.activity import ZoneStats
+from .tecnout.entities import ZoneDetailedStatus
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, kw_only=True)
+class TecnoOutZoneActivityDescription(SensorEntityDescription):
+    """Describes an activity counter of a zone."""
+
+    label: str
+    # Counters, and the start of the current local hour and day
+    value_fn: Callable[[ZoneStats, float, float], Any]
+    # Start of the period the value counts (hour and day start), for TOTAL
+    last_reset_fn: Callable[[float, float], float] | None = None
+
+
+ZONE_ACTIVITY_SENSORS: tuple[TecnoOutZoneActivityDescription, ...] = (
+    TecnoOutZoneActivityDescription(
+        key="activations_hour",
+        label="Activations This Hour",
+        state_class=SensorStateClass.TOTAL,
+        value_fn=lambda stats, hour, day: stats.activations_in_hour(hour),
+        last_reset_fn=lambda hour, day: hour,
+    ),
+    TecnoOutZoneActivityDescription(
+        key="activations_day",
+        label="Activations Today",
+        state_class=SensorStateClass.TOTAL,
+        value_fn=lambda stats, hour, day: stats.activations_in_day(day),
+        last_reset_fn=lambda hour, day: day,
+    ),
+    TecnoOutZoneActivityDescription(
+        key="open_time",
+        label="Open Time",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_display_precision=0,
+        # Completed open intervals: the value moves when the zone closes
+        value_fn=lambda stats, hour, day: round(stats.open_time, 1),
+    ),
+    TecnoOutZoneActivityDescription(
+        key="last_activated",
+        label="Last Activated",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=lambda stats, hour, day: (
+            dt_util.utc_from_timestamp(stats.last_activated)
+            if stats.last_activated is not None
+            else None
+        ),
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up TecnoOut sensors from a config entry."""
+    coordinator: TecnoOutCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    # Wait for first data
+    if not coordinator.data or coordinator.zone_activity is None:
+        return
+
+    zones: list[ZoneDetailedStatus] = coordinator.data.get("zones", [])
+
+    async_add_entities(
+        TecnoOutZoneActivitySensor(coordinator, zone.idx, entry, description)
+        for zone in zones
+        # Only add enabled zones
+        if zone.enabled
+        for description in ZONE_ACTIVITY_SENSORS
+    )
+
+
+class TecnoOutZoneActivitySensor(TecnoOutEntity, SensorEntity):
+    """An activity counter of a TecnoOut Zone as a Sensor."""
+
+    entity_description: TecnoOutZoneActivityDescription
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator: TecnoOutCoordinator,
+        zone_idx: int,
+        entry: ConfigEntry,
+        description: TecnoOutZoneActivityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._zone_idx = zone_idx
+        self._attr_unique_id = f"{entry.entry_id}_zone_{zone_idx}_{description.key}"
+        self._version: tuple | None = None
+        self._refresh_state()
+
+    def _refresh_state(self) -> bool:
+        """Update the value and name if they changed; return True if so."""
+        stats = self.coordinator.zone_activity.zones.get(self._zone_idx, ZoneStats())
+        hour_start, day_start = self.coordinator.activity_period
+        value = self.entity_description.value_fn(stats, hour_start, day_start)
+        last_reset_fn = self.entity_description.last_reset_fn
+        last_reset = None
+        # No period before the first poll
+        if last_reset_fn is not None and day_start:
+            last_reset = last_reset_fn(hour_start, day_start)
+        zone = self.coordinator.get_zone(self._zone_idx)
+        description = zone.description if zone is not None else None
+        version = (value, last_reset, description, self.available)
+        if version == self._version:
+            return False
+        self._version = version
+        self._attr_native_value = value
+        self._attr_last_reset = (
+            dt_util.utc_from_timestamp(last_reset) if last_reset is not None else None
+        )
+        self._attr_name = (
+            f"{description or f'Zone {self._zone_idx}'} "
+            f"{self.entity_description.label}"
+        )
+        return True
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only when the counter changes."""
+        if self._refresh_state():
+            super()._handle_coordinator_update()
+
+    @property
+    def available(self) -> bool:
+        """Return True if entity is available."""
+        return self.coordinator.section_available("zones")
+
@@ -6,14 +6,14 @@ from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .tecnout.entities import ZoneDetailedStatus
 
-from .const import DOMAIN, MANUFACTURER
+from .const import DOMAIN
 from .coordinator import TecnoOutCoordinator
+from .entity import TecnoOutEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -42,7 +42,7 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class TecnoOutZoneSwitch(CoordinatorEntity[TecnoOutCoordinator], SwitchEntity):
+class TecnoOutZoneSwitch(TecnoOutEntity, SwitchEntity):
     """Representation of a TecnoOut Zone as a Switch for isolation control."""
 
     _attr_has_entity_name = True
@@ -63,13 +63,59 @@ class TecnoOutZoneSwitch(CoordinatorEntity[TecnoOutCoordinator], SwitchEntity):
         else:
             self._attr_name = f"Zone {zone_idx} Isolation"
 
+        self._version: tuple | None = None
+        self._attributes: dict[str, Any] = {}
+        self._refresh_attributes()
+
     def _get_zone(self) -> ZoneDetailedStatus | None:
         """Get zone data from coordinator."""
-        zones: list[ZoneDetailedStatus] = self.coordinator.data.get("zones", [])
-        for zone in zones:
-            if zone.idx == self._zone_idx:
-                return zone
-        return None
+        return self.coordinator.get_zone(self._zone_idx)
+
+    def _refresh_attributes(self) -> bool:
+        """Rebuild the cached attributes if the zone changed; return True if so.
+
+        Only the fields the switch shows count: zone activity (open/closed,
+        alarms) is left to the zone binary sensor and does not rewrite the switch.
+        """
+        zone = self._get_zone()
+        version = (
+            (
+                zone.isolation_active,
+                zone.active_zone,
+                zone.learned_zone,
+                zone.description,
+            )
+            if zone is not None
+            else None,
+            self.available,
+            self.coordinator.stale,
+        )
+        if version == self._version:
+            return False
+        self._version = version
+        if zone is None:
+            self._attributes = {}
+            return True
+
+        # Rename the switch in place once the zone description is known
+        if zone.description:
+            name = f"{zone.description} Isolation"
+            if self._attr_name != name:
+                self._attr_name = name
+        self._attributes = {
+            "zone_number": zone.idx,
+            "isolation_active": zone.isolation_active,
+            "active_zone": zone.active_zone,
+            "learned_zone": zone.learned_zone,
+            "stale": self.coordinator.stale,
+        }
+        return True
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only if the zone changed since the last write."""
+        if self._refresh_attributes():
+            super()._handle_coordinator_update()
 
     @property
     def is_on(self) -> bool | None:
@@ -84,7 +130,11 @@ class TecnoOutZoneSwitch(CoordinatorEntity[TecnoOutCoordinator], SwitchEntity):
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return super().available and self._get_zone() is not None
+        # Keep the last good state until the zones have been failing for too long
+        return (
+            self.coordinator.section_available("zones")
+            and self._get_zone() is not None
+        )
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on (reintegrate the zone - make it active)."""
@@ -108,36 +158,7 @@ class TecnoOutZoneSwitch(CoordinatorEntity[TecnoOutCoordinator], SwitchEntity):
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
-        zone = self._get_zone()
-        if zone is None:
-            return {}
+        """Return additional state attributes, rebuilt only when the zone changes."""
+        return self._attributes
 
-        return {
-            "zone_number": zone.idx,
-            "isolation_active": zone.isolation_active,
-            "zone_status": zone.zone_status,
-            "alarm": zone.alarm,
-            "pre_alarm": zone.pre_alarm,
-            "active_zone": zone.active_zone,
-            "learned_zone": zone.learned_zone,
-        }
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        general_status = self.coordinator.data.get("general_status")
-        device_name = (
-            general_status.control_panel_type if general_status else "TecnoAlarm"
-        )
-
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.entry.entry_id)},
-            "name": device_name,
-            "manufacturer": MANUFACTURER,
-            "model": general_status.control_panel_type if general_status else "Unknown",
-            "sw_version": (
-                general_status.firmware_release if general_status else None
-            ),
-        }
 
@@ -0,0 +1,98 @@
+"""Incremental per-zone activity counters, fed with the open zones bitset."""
+
+from dataclasses import asdict, dataclass
+from typing import Any, Optional
+
+
+@dataclass
+class ZoneStats:
+    """Activity counters of one zone."""
+
+    activations: int = 0
+    hour_start: float = 0.0
+    hour_activations: int = 0
+    day_start: float = 0.0
+    day_activations: int = 0
+    open_time: float = 0.0
+    open_since: Optional[float] = None
+    last_activated: Optional[float] = None
+
+    def activations_in_hour(self, hour_start: float) -> int:
+        """Return the activations of the hour starting at ``hour_start``."""
+        return self.hour_activations if self.hour_start == hour_start else 0
+
+    def activations_in_day(self, day_start: float) -> int:
+        """Return the activations of the day starting at ``day_start``."""
+        return self.day_activations if self.day_start == day_start else 0
+
+
+class ZoneActivity:
+    """Per-zone activation counts and open time, updated from cycle diffs.
+
+    Only zones that open or close in a cycle are touched. The first update
+    after creation or restore is a baseline: zones already open start their
+    open interval but do not count as activations.
+    """
+
+    def __init__(self) -> None:
+        self.zones: dict[int, ZoneStats] = {}
+        self._open = 0
+        self._primed = False
+
+    def update(
+        self, now: float, open_zones: int, hour_start: float, day_start: float
+    ) -> bool:
+        """Apply the open zones of a cycle; return True if any counter changed."""
+        delta = open_zones ^ self._open
+        if not delta:
+            self._primed = True
+            return False
+        primed = self._primed
+        self._open = open_zones
+        self._primed = True
+        while delta:
+            bit = delta & -delta
+            delta ^= bit
+            stats = self.zones.setdefault(bit.bit_length(), ZoneStats())
+            if open_zones & bit:
+                stats.open_since = now
+                if primed:
+                    self._activate(stats, now, hour_start, day_start)
+            elif stats.open_since is not None:
+                stats.open_time += max(now - stats.open_since, 0.0)
+                stats.open_since = None
+        return True
+
+    @staticmethod
+    def _activate(
+        stats: ZoneStats, now: float, hour_start: float, day_start: float
+    ) -> None:
+        stats.activations += 1
+        stats.last_activated = now
+        if stats.hour_start != hour_start:
+            stats.hour_start = hour_start
+            stats.hour_activations = 0
+        stats.hour_activations += 1
+        if stats.day_start != day_start:
+            stats.day_start = day_start
+            stats.day_activations = 0
+        stats.day_activations += 1
+
+    def to_dict(self, now: float) -> dict[str, Any]:
+        """Serialize the counters, closing open intervals at ``now``."""
+        zones = {}
+        for zone_idx, stats in self.zones.items():
+            data = asdict(stats)
+            if stats.open_since is not None:
+                data["open_time"] += max(now - stats.open_since, 0.0)
+                data["open_since"] = None
+            zones[str(zone_idx)] = data
+        return {"zones": zones}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ZoneActivity":
+        """Restore counters saved by :meth:`to_dict`; the next update is a baseline."""
+        activity = cls()
+        for zone_idx, stats in data.get("zones", {}).items():
+            activity.zones[int(zone_idx)] = ZoneStats(**stats)
+        return activity
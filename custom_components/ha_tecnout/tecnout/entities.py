@@ -111,6 +111,29 @@ class ZoneDetailedStatus(BaseModel):
             enabled=bool(zone_data[1] & 0b10000000),
         )
 
+    def to_bytes(self) -> bytes:
+        """Encode the zone status back to the 2 bytes of the 0x0F response."""
+        return bytes(
+            (
+                self.isolation_active
+                | self.zone_status << 1
+                | self.zone_tamper_status << 2
+                | self.zone_tamper_alarm << 3
+                | self.battery_low << 4
+                | self.supervision_alarm << 5
+                | self.active_zone << 6
+                | self.learned_zone << 7,
+                self.mask_status
+                | self.fail_status << 1
+                | self.alim_failure << 2
+                | self.input_10s_status << 3
+                | self.pre_alarm << 4
+                | self.alarm << 5
+                | self.alarm_24h << 6
+                | self.enabled << 7,
+            )
+        )
+
     def __hash__(self) -> int:
         return hash(
             (
@@ -304,6 +327,102 @@ class GeneralStatus(BaseModel):
             external_siren=bool(data[14] & 0b00000100),
         )
 
+    # Flag fields by response byte, least significant bit first (None = unused)
+    _FLAG_BYTES: ClassVar[dict[int, tuple[Optional[str], ...]]] = {
+        8: (
+            "general_standby",
+            "general_alarm_failure",
+            "general_low_battery",
+            "general_power_failure",
+            "general_tamper",
+            "wireless_failure",
+            "hold_up_status",
+            "technical_status",
+        ),
+        9: (
+            "chime_status",
+            "pstn_status",
+            "general_pre_alarm",
+            "pgm_logical_output",
+            "access_denied",
+            "program_alarm",
+            "system_status_ok",
+            "gsm_status",
+        ),
+        10: (
+            "general_tamper_alarm",
+            "general_failure_alarm",
+            "false_code_alarm",
+            "false_key_alarm",
+            "general_supervision_alarm",
+            "general_masking_alarm",
+            "general_hold_up_alarm",
+            "general_technical_alarm",
+        ),
+        11: (
+            "general_memory_alarm",
+            "active_exit_time",
+            "control_panel_maintenance",
+            "outgoing_call",
+            "end_bypass_signaling",
+            "automatic_arming",
+            "general_isolation_status",
+            "masking_status",
+        ),
+        12: (
+            "general_tamper_memory",
+            "failure_memory",
+            "false_code_memory",
+            "false_key_memory",
+            None,
+            "low_battery_memory",
+            "power_failure_memory",
+            "pstn_memory",
+        ),
+        13: (
+            "gsm_alarm_memory",
+            "voice_synthesis_board_present",
+            "incoming_call",
+            "internal_siren_status",
+            "external_siren_status",
+            "out1_status",
+            "out2_status",
+            "local_expansion_present",
+        ),
+        14: (
+            "panic_alarm",
+            "internal_siren",
+            "external_siren",
+        ),
+    }
+
+    def to_bytes(self) -> bytes:
+        """
+        Encode the status back to the 16 bytes of the 0x06 response.
+
+        Bytes 6, 7 and 15 are not decoded and are encoded as zero.
+        """
+        def _encode_release(release: str) -> int:
+            major, minor = release.split(".")
+            return int(major) << 4 | int(minor)
+
+        panel_types = {name: code for code, name in self.PANEL_TYPE_MAP.items()}
+        data = bytearray(16)
+        data[0] = self.firmware_language
+        data[1] = _encode_release(self.firmware_release)
+        data[2] = _encode_release(self.hardware_release)
+        if self.vocabulary_language is None:
+            data[3] = 0xFF
+        else:
+            data[3] = self.vocabulary_language
+            data[4] = _encode_release(self.vocabulary_release)
+        data[5] = panel_types.get(self.control_panel_type, 0)
+        for index, fields in self._FLAG_BYTES.items():
+            for bit, name in enumerate(fields):
+                if name is not None and getattr(self, name):
+                    data[index] |= 1 << bit
+        return bytes(data)
+
     def __hash__(self) -> int:
         return hash(
             (
@@ -362,6 +481,18 @@ class ProgramStatus(BaseModel):
             idx=idx,
         )
 
+    def to_bytes(self) -> bytes:
+        """Encode the program status back to its byte of the 0x03 response."""
+        return bytes(
+            (
+                self.program_status
+                | self.prealarm << 4
+                | self.alarm << 5
+                | self.alarm_memory << 6
+                | self.reserved << 7,
+            )
+        )
+
     def __hash__(self) -> int:
         return hash(
             (
@@ -0,0 +1,183 @@
+"""Dedicated thread owning the connection of one panel, driven from asyncio."""
+
+import asyncio
+import queue
+import threading
+import time
+from functools import partial
+from typing import Any, Callable, Optional, TypeVar
+
+_T = TypeVar("_T")
+
+# Queued after the last call to end the thread
+_STOP = object()
+# Queued to wake the thread up when an urgent call is waiting
+_URGENT = object()
+
+
+def _set_result(future: asyncio.Future, result: Any) -> None:
+    if not future.done():
+        future.set_result(result)
+
+
+def _set_exception(future: asyncio.Future, error: BaseException) -> None:
+    if not future.done():
+        future.set_exception(error)
+
+
+class PanelIOThread:
+    """Run every blocking call of one panel, in submission order, on one thread.
+
+    Calls are queued with the asyncio future awaiting them, and the thread
+    completes that future on its loop with ``call_soon_threadsafe``. Since
+    only this thread touches the client, commands, keep-alives and
+    reconnections never interleave and the client lock is never contended.
+    The thread starts with the first call and stops after :meth:`stop`.
+
+    Urgent calls (:meth:`run_urgent`) go before the queued ones, and also
+    run while a call waits in :meth:`idle`, e.g. for a rate limit token.
+
+    A ``limiter`` shared by several threads caps how many of them run a
+    queued call at the same time; urgent calls do not wait for it.
+    """
+
+    def __init__(
+        self, name: str = "tecnout_io", limiter: Optional[asyncio.Semaphore] = None
+    ) -> None:
+        """
+        Initialize the thread (not started).
+
+        :param name: Name of the thread, e.g. to tell panels apart in dumps.
+        :param limiter: Semaphore held while a call of :meth:`run` is pending.
+        """
+        self.name = name
+        self.limiter = limiter
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._urgent: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        # Urgent queue of the thread running the current call
+        self._local = threading.local()
+        self.calls = 0
+        self.failures = 0
+
+    @property
+    def running(self) -> bool:
+        """Return True if the thread is alive and accepting calls."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def pending(self) -> int:
+        """Return the number of calls waiting to run."""
+        return self._queue.qsize() + self._urgent.qsize()
+
+    def start(self) -> None:
+        """Start the thread if it is not running."""
+        if self.running:
+            return
+        # Fresh queues, so a stopping thread cannot take calls meant for this one
+        self._queue = queue.SimpleQueue()
+        self._urgent = queue.SimpleQueue()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(self._queue, self._urgent),
+            name=self.name,
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Let the thread exit once the calls already queued have run."""
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread = None
+
+    async def run(self, func: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+        """Run ``func(*args, **kwargs)`` on the thread and return its result."""
+        if kwargs:
+            func = partial(func, **kwargs)
+        if self.limiter is None:
+            return await self._submit(func, args)
+        async with self.limiter:
+            return await self._submit(func, args)
+
+    async def _submit(self, func: Callable[..., _T], args: tuple) -> _T:
+        """Queue a call and wait for its result."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.start()
+        self._queue.put((func, args, loop, future))
+        return await future
+
+    async def run_urgent(
+        self, func: Callable[..., _T], *args: Any, **kwargs: Any
+    ) -> _T:
+        """Run ``func(*args, **kwargs)`` on the thread before the queued calls."""
+        if kwargs:
+            func = partial(func, **kwargs)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.start()
+        self._urgent.put((func, args, loop, future))
+        self._queue.put(_URGENT)
+        return await future
+
+    def idle(self, seconds: float) -> None:
+        """
+        Wait ``seconds``, running the urgent calls that arrive meanwhile.
+
+        Outside the thread this is a plain sleep.
+
+        :param seconds: Time to wait.
+        """
+        urgent: Optional[queue.SimpleQueue] = getattr(self._local, "urgent", None)
+        if urgent is None:
+            time.sleep(seconds)
+            return
+        end = time.monotonic() + seconds
+        while True:
+            remaining = end - time.monotonic()
+            if remaining <= 0:
+                return
+            try:
+                item = urgent.get(timeout=remaining)
+            except queue.Empty:
+                return
+            self._call(item)
+
+    def _run(self, calls: queue.SimpleQueue, urgent: queue.SimpleQueue) -> None:
+        """Serve the queued calls until stopped."""
+        self._local.urgent = urgent
+        while True:
+            item = calls.get()
+            if item is _STOP:
+                return
+            self._run_urgent(urgent)
+            if item is not _URGENT:
+                self._call(item)
+
+    def _run_urgent(self, urgent: queue.SimpleQueue) -> None:
+        """Run the urgent calls waiting, if any."""
+        while True:
+            try:
+                item = urgent.get_nowait()
+            except queue.Empty:
+                return
+            self._call(item)
+
+    def _call(self, item: tuple) -> None:
+        """Run one call and complete its future on the loop."""
+        func, args, loop, future = item
+        self.calls += 1
+        try:
+            result = func(*args)
+        except BaseException as err:  # pylint: disable=broad-except
+            # Delivered to the awaiting task, like an executor would
+            self.failures += 1
+            callback, value = _set_exception, err
+        else:
+            callback, value = _set_result, result
+        try:
+            loop.call_soon_threadsafe(callback, future, value)
+        except RuntimeError:
+            # The loop was closed while the call ran: nobody is waiting
+            pass
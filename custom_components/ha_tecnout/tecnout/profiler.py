@@ -0,0 +1,120 @@
+"""Cycle-time profiler for TecnoOUT polling loops."""
+
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+PHASE_LOCK_WAIT = "lock_wait"
+PHASE_SOCKET_IO = "socket_io"
+PHASE_AES = "aes"
+PHASE_CRC = "crc"
+PHASE_DECODE = "decode"
+PHASE_DESCRIPTION_MERGE = "description_merge"
+PHASE_ENTITY_WRITES = "entity_writes"
+PHASE_OTHER = "other"
+
+PHASES = (
+    PHASE_LOCK_WAIT,
+    PHASE_SOCKET_IO,
+    PHASE_AES,
+    PHASE_CRC,
+    PHASE_DECODE,
+    PHASE_DESCRIPTION_MERGE,
+    PHASE_ENTITY_WRITES,
+)
+
+
+class CycleProfiler:
+    """Attribute the wall time of each polling cycle to its phases.
+
+    The client and the coordinator report elapsed time per phase while a cycle
+    is open; whatever is not attributed (executor scheduling, event loop,
+    logging) ends up in the ``other`` bucket. Closed cycles are kept in a
+    rolling window.
+    """
+
+    clock = staticmethod(time.perf_counter)
+
+    def __init__(self, window: int = 300, budget: float = 1.0) -> None:
+        """
+        Initialize the profiler.
+
+        :param window: Number of cycles kept in the rolling window.
+        :param budget: Cycle time budget in seconds (the polling interval).
+        """
+        self.budget = budget
+        self._cycles: deque = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._current: Optional[dict[str, float]] = None
+        self._cycle_start = 0.0
+
+    @property
+    def in_cycle(self) -> bool:
+        """Return True if a cycle is currently open."""
+        return self._current is not None
+
+    def begin_cycle(self) -> None:
+        """Open a new cycle, dropping any cycle left open.
+
+        A cycle left open would span the wait for this one, so it is not
+        recorded: failed cycles must be closed with :meth:`end_cycle`.
+        """
+        with self._lock:
+            self._current = dict.fromkeys(PHASES, 0.0)
+            self._cycle_start = self.clock()
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Attribute ``seconds`` to ``phase`` in the open cycle."""
+        with self._lock:
+            if self._current is not None:
+                self._current[phase] = self._current.get(phase, 0.0) + seconds
+
+    def mark(self, phase: str, since: float) -> float:
+        """Attribute the time elapsed from ``since`` to ``phase``.
+
+        :return: The current clock value, to chain consecutive phases.
+        """
+        now = self.clock()
+        self.add(phase, now - since)
+        return now
+
+    def end_cycle(self) -> Optional[dict[str, float]]:
+        """Close the open cycle and store it in the rolling window."""
+        with self._lock:
+            current = self._current
+            if current is None:
+                return None
+            self._current = None
+            total = self.clock() - self._cycle_start
+            current[PHASE_OTHER] = max(0.0, total - sum(current.values()))
+            current["total"] = total
+            self._cycles.append(current)
+            return current
+
+    def reset(self) -> None:
+        """Drop all recorded cycles."""
+        with self._lock:
+            self._cycles.clear()
+            self._current = None
+
+    def report(self) -> dict:
+        """Return a per-phase breakdown of the cycles in the window (in ms)."""
+        with self._lock:
+            cycles = list(self._cycles)
+        report: dict = {
+            "cycles": len(cycles),
+            "budget_ms": round(self.budget * 1000, 3),
+            "overruns": sum(1 for cycle in cycles if cycle["total"] > self.budget),
+            "phases": {},
+        }
+        if not cycles:
+            return report
+        for phase in (*PHASES, PHASE_OTHER, "total"):
+            values = sorted(cycle.get(phase, 0.0) for cycle in cycles)
+            report["phases"][phase] = {
+                "mean_ms": round(sum(values) / len(values) * 1000, 3),
+                "p95_ms": round(values[int(0.95 * (len(values) - 1))] * 1000, 3),
+                "max_ms": round(values[-1] * 1000, 3),
+            }
+        return report
@@ -0,0 +1,82 @@
+"""Token bucket shaping the rate of the commands sent to a control panel."""
+
+import threading
+import time
+from typing import Callable, Optional
+
+# Commands that change the panel state (set program, zone isolation)
+CONTROL_COMMANDS = frozenset({0x10, 0x11})
+
+
+class TokenBucket:
+    """Allow ``rate`` commands per second with bursts of up to ``burst``.
+
+    ``reserved`` extra tokens sit on top of the burst and can only be taken
+    by control commands, so an arm or disarm is not queued behind a sweep or
+    a flood of automation reads. Safe to share between threads.
+    """
+
+    clock = staticmethod(time.monotonic)
+
+    def __init__(self, rate: float, burst: int = 1, reserved: int = 0) -> None:
+        """
+        Initialize a full bucket.
+
+        :param rate: Tokens added per second.
+        :param burst: Tokens any command may take.
+        :param reserved: Additional tokens only control commands may take.
+        :raises ValueError: If the rate is not positive or the burst is below 1.
+        """
+        if rate <= 0:
+            raise ValueError("Rate must be positive.")
+        if burst < 1 or reserved < 0:
+            raise ValueError("Burst must be at least 1 and reserved not negative.")
+        self.rate = rate
+        self.burst = burst
+        self.reserved = reserved
+        self._capacity = float(burst + reserved)
+        self._tokens = self._capacity
+        self._updated = self.clock()
+        self._lock = threading.Lock()
+
+    def _wait_time(self, control: bool) -> float:
+        """Take a token if one is available, else return the time to wait (lock held)."""
+        now = self.clock()
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+        # Other commands must leave the reserved tokens in the bucket
+        floor = 0.0 if control else float(self.reserved)
+        if self._tokens >= floor + 1:
+            self._tokens -= 1
+            return 0.0
+        return (floor + 1 - self._tokens) / self.rate
+
+    def acquire(
+        self,
+        control: bool = False,
+        deadline: Optional[float] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> float:
+        """
+        Take a token, sleeping until one is available.
+
+        :param control: Whether the reserved tokens may be used.
+        :param deadline: Monotonic time after which not to wait (optional).
+        :param sleep: Function waiting the given seconds, e.g. to do other
+            work in the meantime.
+        :return: The seconds spent waiting.
+        :raises TimeoutError: If no token is available by the deadline.
+        """
+        start = None
+        while True:
+            with self._lock:
+                wait = self._wait_time(control)
+            if not wait:
+                return 0.0 if start is None else self.clock() - start
+            if start is None:
+                start = self.clock()
+            if deadline is not None and self.clock() + wait > deadline:
+                raise TimeoutError("Rate limit: no token available before the deadline")
+            sleep(wait)
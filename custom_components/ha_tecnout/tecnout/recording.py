@@ -0,0 +1,220 @@
+"""Session recording and replay for TecnoOUT client."""
+
+import struct
+import threading
+import time
+from collections import defaultdict, deque
+from typing import NamedTuple, Optional
+
+from Crypto.Cipher import AES
+
+from .tecnout_client import TecnoOutClient
+from .tracing import DIRECTION_RX, DIRECTION_TX, mask_user_code
+
+_MAGIC = b"TOSR"
+_VERSION = 1
+_FILE_HEADER = struct.Struct("<4sBB")
+# time offset from session start (s), direction, command, frame length
+_RECORD_HEADER = struct.Struct("<dBBH")
+
+
+class SessionFrame(NamedTuple):
+    """A decrypted frame captured during a session."""
+
+    time: float
+    direction: str
+    command: int
+    frame: bytes
+
+
+class SessionRecorder:
+    """Append timestamped decrypted frames of a live session to a file.
+
+    The format is a 6-byte header (magic, version, legacy flag) followed by
+    records of a 12-byte header and the raw frame. The user code is masked
+    in every frame; the replay puts back the one of the replaying client.
+    """
+
+    def __init__(self, path: str, legacy: bool = False) -> None:
+        """
+        Open the session file for writing.
+
+        :param path: Destination file (overwritten).
+        :param legacy: Legacy CRC layout used by the recorded client.
+        """
+        self.path = path
+        self.frames = 0
+        self._file = open(path, "wb")  # pylint: disable=consider-using-with
+        self._file.write(_FILE_HEADER.pack(_MAGIC, _VERSION, int(legacy)))
+        self._lock = threading.Lock()
+        self._start = time.monotonic()
+
+    def record(self, direction: str, command: int, frame: bytes) -> None:
+        """Append a frame to the session, user code masked."""
+        frame = mask_user_code(frame)
+        header = _RECORD_HEADER.pack(
+            time.monotonic() - self._start,
+            direction == DIRECTION_RX,
+            command,
+            len(frame),
+        )
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.write(header + frame)
+            self.frames += 1
+
+    def close(self) -> None:
+        """Flush and close the session file."""
+        with self._lock:
+            self._file.close()
+
+
+def read_session(path: str) -> tuple[bool, list[SessionFrame]]:
+    """
+    Read a recorded session.
+
+    :param path: The session file.
+    :return: The legacy flag and the recorded frames.
+    :raises ValueError: If the file is not a session recording.
+    """
+    with open(path, "rb") as file:
+        data = file.read()
+    if len(data) < _FILE_HEADER.size:
+        raise ValueError("File is too short to be a session recording.")
+    magic, version, legacy = _FILE_HEADER.unpack_from(data)
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError("Not a TecnoOut session recording.")
+    frames = []
+    offset = _FILE_HEADER.size
+    while offset + _RECORD_HEADER.size <= len(data):
+        timestamp, direction, command, length = _RECORD_HEADER.unpack_from(data, offset)
+        offset += _RECORD_HEADER.size
+        frames.append(
+            SessionFrame(
+                timestamp,
+                DIRECTION_RX if direction else DIRECTION_TX,
+                command,
+                data[offset : offset + length],
+            )
+        )
+        offset += length
+    return bool(legacy), frames
+
+
+class ReplayTransport:
+    """Serve a recorded session back to a client in place of a panel.
+
+    Requests are matched by command and payload to the recorded exchanges,
+    in recording order; each answer is delayed by the recorded response
+    latency divided by ``speed`` (0 disables delays). Responses carry the
+    user code of the request they answer, with the CRC computed again, so
+    any user code can replay a masked recording. Pass :meth:`connect`
+    as the client's ``socket_factory``::
+
+        replay = ReplayTransport.from_file("session.tosr", speed=10)
+        client = TecnoOutClient("replay", 0, 123456, "", socket_factory=replay.connect)
+    """
+
+    def __init__(
+        self,
+        frames: list[SessionFrame],
+        passphrase: str = "",
+        speed: float = 1.0,
+        loop: bool = True,
+        legacy: bool = False,
+    ) -> None:
+        """
+        Initialize the replay transport.
+
+        :param frames: Recorded frames, as returned by :func:`read_session`.
+        :param passphrase: Passphrase the replaying client is configured with.
+        :param speed: Replay speed factor (0 for no delays).
+        :param loop: Restart from the first exchange of a kind once exhausted.
+        :param legacy: Legacy CRC layout used by the recorded client.
+        """
+        self.speed = speed
+        self.loop = loop
+        self.legacy = legacy
+        self._key = TecnoOutClient._format_passphrase(passphrase).encode("utf-8")
+        # request key (command + payload) -> recorded (latency, response) pairs
+        self._exchanges: dict[tuple[int, bytes], list[tuple[float, bytes]]] = (
+            defaultdict(list)
+        )
+        pending: Optional[SessionFrame] = None
+        for frame in frames:
+            if frame.direction == DIRECTION_TX:
+                pending = frame
+            elif pending is not None and frame.command == pending.command:
+                key = (pending.command, pending.frame[6:-2])
+                self._exchanges[key].append((frame.time - pending.time, frame.frame))
+                pending = None
+        self._queues: dict[tuple[int, bytes], deque] = {}
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs) -> "ReplayTransport":
+        """Create a replay transport from a session file."""
+        legacy, frames = read_session(path)
+        kwargs.setdefault("legacy", legacy)
+        return cls(frames, **kwargs)
+
+    def connect(self, address, timeout: Optional[float] = None) -> "_ReplaySocket":
+        """Return a socket-like object replaying the session (socket_factory)."""
+        return _ReplaySocket(self)
+
+    def next_response(self, command: int, payload: bytes) -> tuple[float, bytes]:
+        """Return the delay and the recorded response for a request."""
+        key = (command, payload)
+        queue = self._queues.get(key)
+        if not queue:
+            recorded = self._exchanges.get(key)
+            if not recorded or (key in self._queues and not self.loop):
+                raise ConnectionError(
+                    f"No recorded response for command {command:#04x}"
+                )
+            queue = self._queues[key] = deque(recorded)
+        latency, response = queue.popleft()
+        return (latency / self.speed if self.speed else 0.0), response
+
+    def with_user_code(self, response: bytes, user_code: bytes) -> bytes:
+        """Return ``response`` echoing ``user_code``, with its CRC updated."""
+        body = response[:1] + user_code + response[4:-2]
+        return body + TecnoOutClient._calculate_crc16(body[:-1] if self.legacy else body)
+
+
+class _ReplaySocket:
+    """Socket-like object decrypting requests and answering from a ReplayTransport."""
+
+    def __init__(self, transport: ReplayTransport) -> None:
+        self._transport = transport
+        self._decryptor = None
+        self._encryptor = None
+        self._buffer = b""
+        self._pending = b""
+
+    def settimeout(self, timeout: Optional[float]) -> None:
+        """Timeouts do not apply to replayed sessions."""
+
+    def sendall(self, data: bytes) -> None:
+        if self._decryptor is None:
+            # First write is the IV of the handshake
+            key = self._transport._key
+            self._decryptor = AES.new(key, AES.MODE_CFB, iv=data, segment_size=128)
+            self._encryptor = AES.new(key, AES.MODE_CFB, iv=data, segment_size=128)
+            return
+        self._buffer += self._decryptor.decrypt(data)
+        while len(self._buffer) >= 6 and len(self._buffer) >= self._buffer[5] + 8:
+            size = self._buffer[5] + 8
+            frame, self._buffer = self._buffer[:size], self._buffer[size:]
+            delay, response = self._transport.next_response(frame[4], frame[6:-2])
+            response = self._transport.with_user_code(response, frame[1:4])
+            if delay > 0:
+                time.sleep(delay)
+            self._pending += self._encryptor.encrypt(response)
+
+    def recv(self, size: int) -> bytes:
+        data, self._pending = self._pending[:size], self._pending[size:]
+        return data
+
+    def close(self) -> None:
+        self._pending = b""
@@ -0,0 +1,112 @@
+"""Compact binary snapshot of the last known panel state."""
+
+import os
+import struct
+from typing import NamedTuple, Optional
+
+from .entities import GeneralStatus, ProgramStatus, ZoneDetailedStatus
+
+_MAGIC = b"TOSS"
+_VERSION = 1
+# magic, version, saved at (epoch s), zones count, programs count
+_HEADER = struct.Struct("<4sBdHB")
+_GENERAL_STATUS_SIZE = 16
+
+
+class PanelSnapshot(NamedTuple):
+    """Last known state of a panel, with zone and program descriptions."""
+
+    saved_at: float
+    general_status: GeneralStatus
+    zones: list[ZoneDetailedStatus]
+    programs: list[ProgramStatus]
+
+
+def _encode_text(text: Optional[str]) -> bytes:
+    data = (text or "").encode("utf-8")[:255]
+    return bytes((len(data),)) + data
+
+
+def _decode_text(data: bytes, offset: int) -> tuple[Optional[str], int]:
+    if offset >= len(data):
+        raise ValueError("Truncated panel snapshot.")
+    end = offset + 1 + data[offset]
+    return data[offset + 1 : end].decode("utf-8") or None, end
+
+
+def encode_snapshot(
+    saved_at: float,
+    general_status: GeneralStatus,
+    zones: list[ZoneDetailedStatus],
+    programs: list[ProgramStatus],
+) -> bytes:
+    """
+    Encode the panel state in the wire layout of the status responses.
+
+    The header is followed by the 16 bytes of the general status, 2 bytes
+    per zone, 1 byte per program, then the length-prefixed zone and program
+    descriptions. Zones and programs are numbered from 1 in list order.
+    """
+    return b"".join(
+        (
+            _HEADER.pack(_MAGIC, _VERSION, saved_at, len(zones), len(programs)),
+            general_status.to_bytes(),
+            b"".join(zone.to_bytes() for zone in zones),
+            b"".join(program.to_bytes() for program in programs),
+            b"".join(_encode_text(zone.description) for zone in zones),
+            b"".join(_encode_text(program.name) for program in programs),
+        )
+    )
+
+
+def decode_snapshot(data: bytes) -> PanelSnapshot:
+    """
+    Decode a snapshot produced by :func:`encode_snapshot`.
+
+    :raises ValueError: If the data is not a valid snapshot.
+    """
+    if len(data) < _HEADER.size + _GENERAL_STATUS_SIZE:
+        raise ValueError("Data is too short to be a panel snapshot.")
+    magic, version, saved_at, zones_count, programs_count = _HEADER.unpack_from(data)
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError("Not a TecnoOut panel snapshot.")
+    offset = _HEADER.size
+    general_status = GeneralStatus.from_bytes(
+        data[offset : offset + _GENERAL_STATUS_SIZE]
+    )
+    offset += _GENERAL_STATUS_SIZE
+    zones = [
+        ZoneDetailedStatus.from_bytes(data[offset + i * 2 : offset + i * 2 + 2], i + 1)
+        for i in range(zones_count)
+    ]
+    offset += zones_count * 2
+    programs = [
+        ProgramStatus.from_bytes(byte, i + 1)
+        for i, byte in enumerate(data[offset : offset + programs_count])
+    ]
+    offset += programs_count
+    for zone in zones:
+        zone.description, offset = _decode_text(data, offset)
+    for program in programs:
+        program.name, offset = _decode_text(data, offset)
+    return PanelSnapshot(saved_at, general_status, zones, programs)
+
+
+def write_snapshot(path: str, data: bytes) -> None:
+    """Atomically replace the snapshot file at ``path``."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as file:
+        file.write(data)
+    os.replace(tmp_path, path)
+
+
+def read_snapshot(path: str) -> PanelSnapshot:
+    """
+    Read a snapshot file.
+
+    :raises FileNotFoundError: If there is no snapshot at ``path``.
+    :raises ValueError: If the file is not a valid snapshot.
+    """
+    with open(path, "rb") as file:
+        return decode_snapshot(file.read())
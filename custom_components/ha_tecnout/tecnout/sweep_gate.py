@@ -0,0 +1,78 @@
+"""Skip the full zone sweep while cheap change indicators stay the same."""
+
+from typing import Any, Optional
+
+REASON_REQUIRED = "required"
+REASON_INDICATOR = "indicator"
+REASON_FORCED = "forced"
+
+
+class SweepGate:
+    """Decide, cycle by cycle, whether the multi-chunk ``0x0F`` sweep is needed.
+
+    The indicators are bytes the cycle reads anyway (general status flags and
+    program status). The sweep runs when they change, when a sweep is
+    requested (first cycle, failed sweep, command sent) and at least every
+    ``forced_interval`` seconds. A zone change found by a forced sweep was
+    missed by the indicators and is counted as late; the time since the
+    previous sweep bounds how late it was.
+    """
+
+    def __init__(self, forced_interval: float) -> None:
+        self.forced_interval = forced_interval
+        self._indicators: Optional[bytes] = None
+        self._zones: Optional[bytes] = None
+        self._last_sweep: Optional[float] = None
+        self._requested = True
+        self._reason = REASON_REQUIRED
+        self.cycles = 0
+        self.skipped = 0
+        self.sweeps = {REASON_REQUIRED: 0, REASON_INDICATOR: 0, REASON_FORCED: 0}
+        self.changes = 0
+        self.late_changes = 0
+        self.max_late = 0.0
+
+    def request(self) -> None:
+        """Make the next cycle sweep regardless of the indicators."""
+        self._requested = True
+
+    def should_sweep(self, now: float, indicators: Optional[bytes]) -> bool:
+        """Return True if the zones must be swept; None indicators force it."""
+        self.cycles += 1
+        if indicators is None or self._requested or self._last_sweep is None:
+            reason = REASON_REQUIRED
+        elif indicators != self._indicators:
+            reason = REASON_INDICATOR
+        elif now - self._last_sweep >= self.forced_interval:
+            reason = REASON_FORCED
+        else:
+            self.skipped += 1
+            return False
+        self._indicators = indicators
+        self._reason = reason
+        self.sweeps[reason] += 1
+        return True
+
+    def swept(self, now: float, zones: bytes) -> None:
+        """Record a successful sweep and the zone bytes it returned."""
+        if self._zones is not None and zones != self._zones:
+            self.changes += 1
+            if self._reason == REASON_FORCED:
+                self.late_changes += 1
+                self.max_late = max(self.max_late, now - self._last_sweep)
+        self._zones = zones
+        self._last_sweep = now
+        self._requested = False
+
+    def report(self) -> dict[str, Any]:
+        """Return the sweeps avoided and the zone changes caught late."""
+        return {
+            "forced_interval_s": self.forced_interval,
+            "cycles": self.cycles,
+            "sweeps": dict(self.sweeps),
+            "skipped": self.skipped,
+            "skipped_ratio": round(self.skipped / self.cycles, 3) if self.cycles else 0.0,
+            "changes": self.changes,
+            "late_changes": self.late_changes,
+            "max_late_s": round(self.max_late, 3),
+        }
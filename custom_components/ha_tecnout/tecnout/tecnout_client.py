@@ -1,9 +1,11 @@
 ﻿import logging
+import random
 import socket
 import struct
 import threading
 import time
-from typing import Optional
+from collections import Counter
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Optional
 
 from Crypto.Cipher import AES
 from Crypto.Random import get_random_bytes
@@ -16,14 +18,65 @@ from .entities import (
     ZoneDetailedStatus,
     ZoneSetting,
 )
+from .profiler import (
+    PHASE_AES,
+    PHASE_CRC,
+    PHASE_DECODE,
+    PHASE_LOCK_WAIT,
+    PHASE_SOCKET_IO,
+    CycleProfiler,
+)
+from .rate_limit import CONTROL_COMMANDS, TokenBucket
+from .tracing import DIRECTION_RX, DIRECTION_TX, FrameTracer, HexDump
+from .watch import DEFAULT_SWEEP_TIMEOUT, Change, watch_changes
+
+if TYPE_CHECKING:
+    from .recording import SessionRecorder
 
 _LOGGER = logging.getLogger(__name__)
 
+# Seconds allowed to open the connection
+DEFAULT_CONNECT_TIMEOUT = 10.0
+# Seconds allowed for a request/response exchange, lock wait included
+DEFAULT_COMMAND_TIMEOUT = 5.0
+# Retries of a command answered USY (busy), and the base of their backoff
+DEFAULT_BUSY_RETRIES = 3
+DEFAULT_BUSY_BACKOFF = 0.05
+# Commands any caller may send back to back, and extra ones kept for control
+DEFAULT_RATE_BURST = 5
+DEFAULT_CONTROL_BURST = 2
+# Response header: STX, 3-byte user code, status, payload length
+_RESPONSE_HEADER_SIZE = 6
+# Header, payload and 2-byte CRC
+_RESPONSE_OVERHEAD = _RESPONSE_HEADER_SIZE + 2
+
+
+class PanelBusyError(ValueError):
+    """The request was valid but the control panel answered USY (busy)."""
+
 
 class TecnoOutClient:
     """TecnoOutClient is a class that allows interfacing with Tecnoalarm control panels using the Tecno Out protocol."""
 
-    def __init__(self, host, port: int, user_code: int, passphrase: str, legacy=False, watchdog_interval: Optional[float] = None) -> None:
+    def __init__(
+        self,
+        host,
+        port: int,
+        user_code: int,
+        passphrase: str,
+        legacy=False,
+        watchdog_interval: Optional[float] = None,
+        socket_factory: Optional[Callable] = None,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        command_timeout: float = DEFAULT_COMMAND_TIMEOUT,
+        command_timeouts: Optional[dict[int, float]] = None,
+        busy_retries: int = DEFAULT_BUSY_RETRIES,
+        busy_retry_budgets: Optional[dict[int, int]] = None,
+        busy_backoff: float = DEFAULT_BUSY_BACKOFF,
+        rate_limit: Optional[float] = None,
+        rate_burst: int = DEFAULT_RATE_BURST,
+        control_burst: int = DEFAULT_CONTROL_BURST,
+    ) -> None:
         """
         Initialize the TecnoOutClient.
 
@@ -33,6 +86,24 @@ class TecnoOutClient:
         :param passphrase: The passphrase for encryption (optional).
         :param legacy: Boolean flag for legacy hardware compatibility.
         :param watchdog_interval: Interval for watchdog in seconds (optional).
+        :param socket_factory: Replacement for ``socket.create_connection``
+            (optional), e.g. a replay transport.
+        :param connect_timeout: Seconds allowed to open the connection.
+        :param command_timeout: Seconds allowed for a command, from waiting for
+            the connection to the last byte of the response.
+        :param command_timeouts: Per-command overrides of ``command_timeout``,
+            by command code (optional).
+        :param busy_retries: Times a command answered USY (busy) is retried.
+        :param busy_retry_budgets: Per-command overrides of ``busy_retries``,
+            by command code (optional).
+        :param busy_backoff: Base of the jittered exponential backoff between
+            busy retries, in seconds.
+        :param rate_limit: Commands per second sent to the panel, busy retries
+            included (optional, unlimited by default).
+        :param rate_burst: Commands that may be sent back to back once the
+            rate limit has been idle.
+        :param control_burst: Additional burst kept for the commands that
+            change the panel state (set program, zone isolation).
         """
         self.host = host
         self.port = port
@@ -47,12 +118,45 @@ class TecnoOutClient:
             else self._format_passphrase("")
         )
         self._bcd_user_code = self._get_bcd_user_code(user_code)
+        self._socket_factory = socket_factory or socket.create_connection
+        self.connect_timeout = connect_timeout
+        self.command_timeout = command_timeout
+        self.command_timeouts: dict[int, float] = dict(command_timeouts or {})
+        self.busy_retries = busy_retries
+        self.busy_retry_budgets: dict[int, int] = dict(busy_retry_budgets or {})
+        self.busy_backoff = busy_backoff
+        # Busy retries, and commands still busy once their budget ran out,
+        # by command code
+        self.busy_retry_counts: Counter[int] = Counter()
+        self.busy_exhausted_counts: Counter[int] = Counter()
+        self.rate_limiter: Optional[TokenBucket] = (
+            TokenBucket(rate_limit, rate_burst, control_burst) if rate_limit else None
+        )
+        # Commands delayed by the rate limiter, and seconds (total and
+        # longest) they waited, by command code
+        self.throttled_counts: Counter[int] = Counter()
+        self.throttle_delays: Counter[int] = Counter()
+        self.throttle_max_delays: dict[int, float] = {}
+        # Waits for a rate limit token; replaced by the caller to do other
+        # work in the meantime
+        self.throttle_sleep: Callable[[float], None] = time.sleep
         self._sock = None
+        # Set when a failed exchange dropped the connection: reconnect on demand
+        self._reconnect_pending = False
         self._aes_cipher = None
         self._aes_cipher_response = None
         self._lock = threading.Lock()
+        # Monotonic time of the last valid (ACK) response
+        self.last_response: float = 0.0
+        # Optional cycle profiler, set by the caller when profiling is enabled
+        self.profiler: Optional[CycleProfiler] = None
+        # Optional frame tracer, set by the caller when tracing is enabled
+        self.tracer: Optional[FrameTracer] = None
+        # Optional session recorder, set by the caller when recording
+        self.recorder: Optional["SessionRecorder"] = None
 
-    def _format_passphrase(self, passphrase):
+    @staticmethod
+    def _format_passphrase(passphrase):
         """
         Format the passphrase to be exactly 16 bytes long.
 
@@ -79,12 +183,66 @@ class TecnoOutClient:
             self._passphrase.encode("utf-8"), AES.MODE_CFB, iv=iv, segment_size=128
         )
 
-    def _receive_response(self):
+    def _set_timeout(self, deadline: Optional[float]) -> None:
+        """
+        Bound the next socket operation by ``deadline`` (monotonic time).
+
+        :raises TimeoutError: If the deadline has already passed.
+        """
+        if deadline is None:
+            self._sock.settimeout(None)
+            return
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError("Deadline exceeded")
+        self._sock.settimeout(remaining)
+
+    def _read_frame(self, deadline: Optional[float]) -> bytes:
+        """
+        Read and decrypt one whole response frame, however the panel splits it.
+
+        :param deadline: Monotonic time by which the frame must be complete.
+        :return: The decrypted frame.
+        :raises TimeoutError: If the deadline passes before the frame is complete.
+        :raises ConnectionError: If the connection is closed mid-frame.
+        """
+        prof = self.profiler
+        if prof is not None:
+            t = prof.clock()
+        frame = b""
+        needed = _RESPONSE_HEADER_SIZE
+        while len(frame) < needed:
+            self._set_timeout(deadline)
+            data = self._sock.recv(
+                1024 if len(frame) < _RESPONSE_HEADER_SIZE else needed - len(frame)
+            )
+            if len(data) == 0:
+                raise ConnectionError("Connection closed by remote host")
+            if prof is not None:
+                t = prof.mark(PHASE_SOCKET_IO, t)
+            frame += self._aes_cipher_response.decrypt(data)
+            if prof is not None:
+                t = prof.mark(PHASE_AES, t)
+            if len(frame) >= _RESPONSE_HEADER_SIZE:
+                needed = frame[5] + _RESPONSE_OVERHEAD
+        return frame[:needed]
+
+    def _receive_response(
+        self,
+        command: Optional[int] = None,
+        traced: bool = False,
+        deadline: Optional[float] = None,
+    ):
         """
         Receive a response from the Tecnoalarm control panel.
 
+        :param command: Code of the command being answered.
+        :param traced: Whether the request was sampled by the frame tracer.
+        :param deadline: Monotonic time by which the response must be complete
+            (optional, blocks indefinitely otherwise).
         :return: The decrypted response data.
         :raises ConnectionError: If not connected.
+        :raises TimeoutError: If the deadline passes.
         :raises ValueError: If the response is invalid.
         """
         if not self._sock:
@@ -92,31 +250,46 @@ class TecnoOutClient:
         if not self._aes_cipher_response:
             raise ConnectionError("AES encryption not initialized.")
 
-        result = self._sock.recv(1024)
-        if len(result) == 0:
-            raise ConnectionError("Connection closed by remote host")
-        result = self._aes_cipher_response.decrypt(result)
+        result = self._read_frame(deadline)
+        prof = self.profiler
+        if prof is not None:
+            t = prof.clock()
         self._verify_crc16(result)
-        _LOGGER.debug(
-            "Received response: %s", " ".join(f"{byte:02X}" for byte in result)
-        )
+        if prof is not None:
+            prof.mark(PHASE_CRC, t)
+        _LOGGER.debug("Received response: %s", HexDump(result))
+        if traced and self.tracer is not None:
+            self.tracer.record(DIRECTION_RX, command, result)
+        if self.recorder is not None:
+            self.recorder.record(DIRECTION_RX, command, result)
+
+        return self._response_data(result)
 
+    def _response_data(self, result: bytes) -> bytes:
+        """
+        Check the status byte of a response and return its data.
+
+        :raises ValueError: If the panel answered NAK or the status is unknown.
+        :raises PanelBusyError: If the panel answered USY.
+        """
         if len(result) < 5:
             raise ValueError("Response is too short to contain a valid status byte.")
 
         status_byte = result[4]
         if status_byte == 0x06:
+            self.last_response = time.monotonic()
             return result[6:-2]
         elif status_byte == 0x15:
             raise ValueError("Request was not valid. Received status byte: NAK")
         elif status_byte == 0x0F:
-            raise ValueError(
+            raise PanelBusyError(
                 "Request valid but control panel busy. Received status byte: USY"
             )
         else:
             raise ValueError(f"Unknown response status byte: {status_byte:#02x}")
 
-    def _calculate_crc16(self, msg: bytes) -> bytes:
+    @staticmethod
+    def _calculate_crc16(msg: bytes) -> bytes:
         """
         Calculate CRC16 using the Modbus RTU polynomial (0xA001) and return it as 2 bytes in little-endian order.
 
@@ -152,7 +325,8 @@ class TecnoOutClient:
         if calculated_crc != received_crc:
             raise ValueError("CRC check failed.")
 
-    def _get_bcd_user_code(self, number):
+    @staticmethod
+    def _get_bcd_user_code(number):
         """
         Convert a given number to BCD format (3 bytes) in little-endian,
         with digits in each byte inverted. Pads with zeros to the end if the code is shorter than 6 digits.
@@ -178,9 +352,7 @@ class TecnoOutClient:
     def connect(self):
         """Establish a TCP connection to the Tecnoalarm control panel and initiate encryption."""
         with self._lock:
-            self._sock = socket.create_connection((self.host, self.port), timeout=10.0)
-            self._sock.settimeout(None)
-            self._init_encryption()
+            self._open_connection(self.connect_timeout)
             
             # Start watchdog thread if interval is configured and thread doesn't exist
             if (self._watchdog_interval is not None and 
@@ -221,53 +393,221 @@ class TecnoOutClient:
                     # On critical failure, stop the watchdog
                     break
 
+    def keep_alive(self):
+        """
+        Send a lightweight keep-alive (general status), reconnecting on failure.
+
+        Lets callers that schedule their own I/O replace the watchdog thread.
+        """
+        try:
+            if self._sock is None:
+                raise ConnectionError("Socket is not connected")
+            self.send_command(0x01)
+        except Exception as e:
+            _LOGGER.warning("Keep-alive detected error '%s', attempting reconnect", e)
+            self._internal_reconnect()
+
+    def _open_connection(self, timeout: float):
+        """Open the socket and run the encryption handshake (lock held)."""
+        self._sock = self._socket_factory((self.host, self.port), timeout=timeout)
+        try:
+            self._init_encryption()
+        except OSError:
+            self._drop_connection()
+            raise
+        self._reconnect_pending = False
+
+    def _drop_connection(self):
+        """Close the socket and discard the cipher state (lock held)."""
+        if self._sock:
+            try:
+                self._sock.close()
+            except:
+                pass  # Ignore errors when closing broken socket
+            self._sock = None
+            self._aes_cipher = None
+            self._aes_cipher_response = None
+
     def _internal_reconnect(self):
         """Internal reconnection method used by watchdog to avoid deadlocks."""
         # Close socket and reset connection state without stopping watchdog
         with self._lock:
-            if self._sock:
-                try:
-                    self._sock.close()
-                except:
-                    pass  # Ignore errors when closing broken socket
-                self._sock = None
-                self._aes_cipher = None
-                self._aes_cipher_response = None
-            
+            self._drop_connection()
             # Recreate connection
-            self._sock = socket.create_connection((self.host, self.port), timeout=0.5)
-            self._sock.settimeout(None)
-            self._init_encryption()
+            self._open_connection(0.5)
 
-    def send_command(self, command: int, data: bytes = b""):
+    def send_command(
+        self, command: int, data: bytes = b"", deadline: Optional[float] = None
+    ):
         """
         Send a command to the Tecnoalarm control panel.
 
+        The exchange, waiting for the connection included, is bounded by the
+        command timeout and by ``deadline``. If it fails mid-frame the cipher
+        streams are out of step with the panel, so the connection is dropped
+        and reopened before the next command.
+
+        A USY (busy) answer is retried after a jittered exponential backoff,
+        within the retry budget of the command and its deadline; the lock is
+        released while waiting. NAK answers are not retried.
+
+        With a rate limit, every request sent (retries included) first takes
+        a token, waiting for one before the lock is acquired; control
+        commands may use the reserved burst.
+
         :param command: The command byte.
         :param data: Optional data to send with the command.
+        :param deadline: Monotonic time by which the command must complete
+            (optional), e.g. the end of a polling cycle.
         :return: The response from the control panel.
         :raises ConnectionError: If not connected.
+        :raises TimeoutError: If the command does not complete in time.
+        :raises PanelBusyError: If the panel is still busy once the retry
+            budget or the deadline runs out.
         """
-        with self._lock:
-            if not self._sock:
-                raise ConnectionError("You must connect first before sending commands.")
-            if not self._aes_cipher:
-                raise ConnectionError("AES encryption not initialized.")
-
-            stx = 0x02
-            length = len(data)
-            message = (
-                struct.pack("B", stx)
-                + self._bcd_user_code
-                + struct.pack("B", command)
-                + struct.pack("B", length)
-                + data
+        start = time.monotonic()
+        command_deadline = start + self.command_timeouts.get(
+            command, self.command_timeout
+        )
+        if deadline is not None:
+            command_deadline = min(command_deadline, deadline)
+        budget = self.busy_retry_budgets.get(command, self.busy_retries)
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self._throttle(command, command_deadline)
+            try:
+                return self._exchange(command, data, start, command_deadline)
+            except PanelBusyError:
+                delay = random.uniform(0.5, 1.0) * self.busy_backoff * 2**attempt
+                if attempt >= budget or time.monotonic() + delay >= command_deadline:
+                    self.busy_exhausted_counts[command] += 1
+                    raise
+            attempt += 1
+            self.busy_retry_counts[command] += 1
+            _LOGGER.debug(
+                "Command %#04x: panel busy, retry %s/%s in %.3fs",
+                command,
+                attempt,
+                budget,
+                delay,
+            )
+            time.sleep(delay)
+
+    def _throttle(self, command: int, command_deadline: float) -> None:
+        """Wait for a token of the rate limiter, recording the delay."""
+        try:
+            delay = self.rate_limiter.acquire(
+                command in CONTROL_COMMANDS, command_deadline, self.throttle_sleep
+            )
+        except TimeoutError as err:
+            raise TimeoutError(
+                f"Command {command:#04x} timed out waiting for the rate limit"
+            ) from err
+        if delay:
+            self.throttled_counts[command] += 1
+            self.throttle_delays[command] += delay
+            if delay > self.throttle_max_delays.get(command, 0.0):
+                self.throttle_max_delays[command] = delay
+
+    def _exchange(
+        self, command: int, data: bytes, start: float, command_deadline: float
+    ):
+        """Send one request and receive its response (see :meth:`send_command`)."""
+        prof = self.profiler
+        if prof is not None:
+            t = prof.clock()
+        if not self._lock.acquire(timeout=max(command_deadline - time.monotonic(), 0)):
+            raise TimeoutError(
+                f"Command {command:#04x} timed out waiting for the connection"
             )
-            message += self._calculate_crc16(message[:-1] if self.legacy else message)
-            _LOGGER.debug("Sent message: %s", " ".join(f"{byte:02X}" for byte in message))
-            message = self._aes_cipher.encrypt(message)
-            self._sock.sendall(message)
-            return self._receive_response()
+        try:
+            if prof is not None:
+                prof.mark(PHASE_LOCK_WAIT, t)
+            self._ensure_connection(command_deadline)
+            message, traced = self._build_request(command, data)
+            # Check the deadline before the cipher stream advances
+            self._set_timeout(command_deadline)
+            try:
+                self._send_encrypted(message)
+                return self._receive_response(command, traced, command_deadline)
+            except OSError as err:
+                _LOGGER.warning(
+                    "Command %#04x failed (%s), resetting the connection", command, err
+                )
+                self._drop_connection()
+                self._reconnect_pending = True
+                if isinstance(err, TimeoutError):
+                    raise TimeoutError(
+                        f"Command {command:#04x} timed out after "
+                        f"{time.monotonic() - start:.2f}s"
+                    ) from err
+                raise
+        finally:
+            self._lock.release()
+
+    def _ensure_connection(self, command_deadline: float) -> None:
+        """Reopen a connection dropped by a failed command (lock held)."""
+        if not self._sock and self._reconnect_pending:
+            remaining = command_deadline - time.monotonic()
+            self._open_connection(min(self.connect_timeout, max(remaining, 0.1)))
+        if not self._sock:
+            raise ConnectionError("You must connect first before sending commands.")
+        if not self._aes_cipher:
+            raise ConnectionError("AES encryption not initialized.")
+
+    def _build_request(self, command: int, data: bytes) -> tuple[bytes, bool]:
+        """
+        Frame a request, tracing and recording it in the clear.
+
+        :return: The request and whether the frame tracer sampled it.
+        """
+        prof = self.profiler
+        if prof is not None:
+            t = prof.clock()
+        stx = 0x02
+        length = len(data)
+        message = (
+            struct.pack("B", stx)
+            + self._bcd_user_code
+            + struct.pack("B", command)
+            + struct.pack("B", length)
+            + data
+        )
+        message += self._calculate_crc16(message[:-1] if self.legacy else message)
+        if prof is not None:
+            prof.mark(PHASE_CRC, t)
+        _LOGGER.debug("Sent message: %s", HexDump(message))
+        tracer = self.tracer
+        traced = tracer is not None and tracer.wants(command)
+        if traced:
+            tracer.record(DIRECTION_TX, command, message)
+        if self.recorder is not None:
+            self.recorder.record(DIRECTION_TX, command, message)
+        return message, traced
+
+    def _send_encrypted(self, message: bytes) -> None:
+        """Encrypt a request and send it whole (lock held)."""
+        prof = self.profiler
+        if prof is not None:
+            t = prof.clock()
+        message = self._aes_cipher.encrypt(message)
+        if prof is not None:
+            t = prof.mark(PHASE_AES, t)
+        self._sock.sendall(message)
+        if prof is not None:
+            prof.mark(PHASE_SOCKET_IO, t)
+
+    def _decode(self, decoder, *args):
+        """Run a response decoder, attributing its time to the profiler if enabled."""
+        prof = self.profiler
+        if prof is None:
+            return decoder(*args)
+        t = prof.clock()
+        try:
+            return decoder(*args)
+        finally:
+            prof.mark(PHASE_DECODE, t)
 
     def get_info(self) -> ControlPanelInfo:
         """
@@ -279,25 +619,29 @@ class TecnoOutClient:
         response = self.send_command(command)
         return ControlPanelInfo.from_bytes(response)
 
-    def get_general_status(self) -> GeneralStatus:
+    def get_general_status(self, deadline: Optional[float] = None) -> GeneralStatus:
         """
         Get the general status of the control panel.
 
+        :param deadline: Monotonic time by which to complete (optional).
         :return: The general status.
         """
         command = 0x01
-        response = self.send_command(command)
-        return GeneralStatus.from_bytes(response)
+        response = self.send_command(command, deadline=deadline)
+        return self._decode(GeneralStatus.from_bytes, response)
 
     def get_zones_detail(
-        self, zones_count: int, zone_from=1
+        self, zones_count: int, zone_from=1, deadline: Optional[float] = None
     ) -> list[ZoneDetailedStatus]:
         """
         Get detailed status of multiple zones.
 
         :param zones_count: The number of zones to retrieve.
         :param zone_from: The starting zone number.
+        :param deadline: Monotonic time by which the whole sweep must complete
+            (optional); no further chunk is requested once it has passed.
         :return: A list of detailed zone statuses.
+        :raises TimeoutError: If the deadline passes before the sweep completes.
         """
         chunk = 32
         all_zones = []
@@ -306,9 +650,11 @@ class TecnoOutClient:
             chunk_size = min(zones_count, chunk)
             zone_to = zone_from + chunk_size - 1
             response = self.send_command(
-                command_code, struct.pack("HH", zone_from, zone_to)
+                command_code, struct.pack("HH", zone_from, zone_to), deadline
+            )
+            all_zones.extend(
+                self._decode(_ZoneDetailedStatusResponse, response, zone_from).zones
             )
-            all_zones.extend(_ZoneDetailedStatusResponse(response, zone_from).zones)
             zones_count -= chunk_size
             zone_from = zone_to + 1
         return all_zones
@@ -357,20 +703,22 @@ class TecnoOutClient:
             zone_from = zone_to + 1
         return all_zones
 
-    def get_programs_status(self, prg_count: int, prg_from=1) -> list[ProgramStatus]:
+    def get_programs_status(
+        self, prg_count: int, prg_from=1, deadline: Optional[float] = None
+    ) -> list[ProgramStatus]:
         """
         Get the status of multiple programs.
 
         :param prg_count: The number of programs to retrieve.
         :param prg_from: The starting program number.
+        :param deadline: Monotonic time by which to complete (optional).
         :return: A list of program statuses.
         """
         command = 0x03
-        response = self.send_command(command, struct.pack("HH", prg_from, prg_count))
-        programs = []
-        for idx, byte in enumerate(response):
-            programs.append(ProgramStatus.from_bytes(byte, idx + prg_from))
-        return programs
+        response = self.send_command(
+            command, struct.pack("HH", prg_from, prg_count), deadline
+        )
+        return self._decode(_decode_programs_status, response, prg_from)
 
     def get_programs_description(self, prg_count: int, prg_from=1) -> list[str]:
         """
@@ -445,6 +793,44 @@ class TecnoOutClient:
             responses.append(response.decode("utf-8"))
         return responses
 
+    def watch(
+        self,
+        zones_count: Optional[int] = None,
+        programs_count: Optional[int] = None,
+        interval: float = 1.0,
+        general_status: bool = True,
+        sweep_timeout: float = DEFAULT_SWEEP_TIMEOUT,
+        max_failures: Optional[int] = None,
+    ) -> AsyncIterator[Change]:
+        """
+        Stream the changes of the panel status as typed events.
+
+        Use as ``async for change in client.watch():``; the connection must
+        be open. Changes piling up behind a slow consumer are coalesced.
+        Sweeps failing with a timeout, a connection error or a busy panel
+        are retried, the client reconnecting with the next command.
+
+        :param zones_count: The number of zones to watch (default: all).
+        :param programs_count: The number of programs to watch (default: all).
+        :param interval: Seconds between two sweeps of the panel.
+        :param general_status: Whether to report general status flags.
+        :param sweep_timeout: Seconds allowed for one sweep, whatever the
+            interval.
+        :param max_failures: Failed sweeps in a row after which the iterator
+            raises the last error (default: keep retrying).
+        :return: An async iterator of ZoneFlagChanged, ProgramChanged and
+            PanelFlagChanged events.
+        """
+        return watch_changes(
+            self,
+            zones_count,
+            programs_count,
+            interval,
+            general_status,
+            sweep_timeout,
+            max_failures,
+        )
+
     def close(self):
         """Close the connection to the control panel."""
         # Stop watchdog - signal it to stop
@@ -464,14 +850,8 @@ class TecnoOutClient:
             self._watchdog_thread = None
             
         with self._lock:
-            if self._sock:
-                try:
-                    self._sock.close()
-                except:
-                    pass  # Ignore errors when closing broken socket
-                self._sock = None
-                self._aes_cipher = None
-                self._aes_cipher_response = None
+            self._drop_connection()
+            self._reconnect_pending = False
                 
         # Reset watchdog event for potential reconnections
         self._watchdog_stop_event.clear()
@@ -509,6 +889,14 @@ class _ZoneDetailedStatusResponse:
         return [zone.model_dump() for zone in self.zones]
 
 
+def _decode_programs_status(response: bytes, prg_from: int) -> list[ProgramStatus]:
+    """Decode the response to the 0x03 command, one status byte per program."""
+    return [
+        ProgramStatus.from_bytes(byte, idx + prg_from)
+        for idx, byte in enumerate(response)
+    ]
+
+
 class _GenericDescriptionResponse:
     def __init__(self, response: bytes) -> None:
         self.result = self.parse_response(response)
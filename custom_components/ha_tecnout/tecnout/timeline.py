@@ -0,0 +1,146 @@
+"""Bounded in-memory timeline of zone and program state changes."""
+
+from array import array
+from typing import NamedTuple, Optional
+
+
+class TimelineState(NamedTuple):
+    """Open zones bitset (bit ``n - 1`` for zone ``n``) and program status bytes."""
+
+    time: float
+    open_zones: int
+    programs: bytes
+
+
+class TimelineTransition(NamedTuple):
+    """One changed cycle: zones opened and closed, and the new program bytes."""
+
+    time: float
+    opened: int
+    closed: int
+    programs: Optional[bytes]
+
+
+class ZoneTimeline:
+    """Ring buffer of timestamped state deltas, one per changed cycle.
+
+    Each entry keeps the XOR of the open zones bitset with the previous
+    cycle, and the program status bytes only when they changed. Evicted
+    entries are folded into a base state, so the state at any time since the
+    oldest retained change can be rebuilt from either end of the buffer.
+    """
+
+    def __init__(self, size: int = 10000) -> None:
+        if size < 1:
+            raise ValueError("Timeline size must be at least 1.")
+        self.size = size
+        self._times = array("d", bytes(8 * size))
+        self._zones: list[int] = [0] * size
+        self._programs: list[Optional[bytes]] = [None] * size
+        self._start = 0
+        self._count = 0
+        # State before the oldest retained entry, valid from base time on
+        self._base_time: Optional[float] = None
+        self._base_zones = 0
+        self._base_programs = b""
+        self._zones_now = 0
+        self._programs_now = b""
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def oldest(self) -> Optional[float]:
+        """Return the earliest time the timeline can answer for."""
+        if self._base_time is not None:
+            return self._base_time
+        return self._times[self._start] if self._count else None
+
+    def append(self, time: float, open_zones: int, programs: bytes) -> bool:
+        """Record the state of a cycle; return True if it changed."""
+        delta = open_zones ^ self._zones_now
+        changed_programs = programs if programs != self._programs_now else None
+        if not delta and changed_programs is None and self._count:
+            return False
+        if self._count == self.size:
+            # Fold the oldest delta into the base state
+            self._base_time = self._times[self._start]
+            self._base_zones ^= self._zones[self._start]
+            if self._programs[self._start] is not None:
+                self._base_programs = self._programs[self._start]
+            self._start = (self._start + 1) % self.size
+            self._count -= 1
+        slot = (self._start + self._count) % self.size
+        self._times[slot] = time
+        self._zones[slot] = delta
+        self._programs[slot] = changed_programs
+        self._count += 1
+        self._zones_now = open_zones
+        self._programs_now = programs
+        return True
+
+    def _slot(self, index: int) -> int:
+        return (self._start + index) % self.size
+
+    def _bisect(self, time: float) -> int:
+        """Return the number of entries recorded at or before ``time``."""
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._times[self._slot(middle)] <= time:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _state_after(self, index: int) -> tuple[int, bytes]:
+        """Return the state once the first ``index`` entries are applied."""
+        zones = self._base_zones
+        programs = self._base_programs
+        if index <= self._count - index:
+            for offset in range(index):
+                slot = self._slot(offset)
+                zones ^= self._zones[slot]
+                if self._programs[slot] is not None:
+                    programs = self._programs[slot]
+            return zones, programs
+        # Closer to the present: undo the newer entries instead
+        zones = self._zones_now
+        programs = self._programs_now
+        for offset in range(index, self._count):
+            zones ^= self._zones[self._slot(offset)]
+        for offset in range(index - 1, -1, -1):
+            slot = self._slot(offset)
+            if self._programs[slot] is not None:
+                return zones, self._programs[slot]
+        return zones, self._base_programs
+
+    def state_at(self, time: float) -> Optional[TimelineState]:
+        """Return the state at ``time``, or None if it predates the timeline."""
+        oldest = self.oldest
+        if oldest is None or time < oldest:
+            return None
+        zones, programs = self._state_after(self._bisect(time))
+        return TimelineState(time, zones, programs)
+
+    def transitions(self, start: float, end: float) -> list[TimelineTransition]:
+        """Return the changes recorded between ``start`` and ``end`` included."""
+        first = self._bisect(start)
+        # Entries at exactly ``start`` are transitions too
+        while first > 0 and self._times[self._slot(first - 1)] >= start:
+            first -= 1
+        zones, _ = self._state_after(first)
+        result = []
+        for offset in range(first, self._bisect(end)):
+            slot = self._slot(offset)
+            delta = self._zones[slot]
+            zones ^= delta
+            result.append(
+                TimelineTransition(
+                    self._times[slot],
+                    delta & zones,
+                    delta & ~zones,
+                    self._programs[slot],
+                )
+            )
+        return result
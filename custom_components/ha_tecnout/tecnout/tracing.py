@@ -0,0 +1,105 @@
+"""Lazy frame tracing for TecnoOUT client."""
+
+import threading
+import time
+from collections import deque
+from typing import Iterable, Optional
+
+DIRECTION_TX = "tx"
+DIRECTION_RX = "rx"
+
+# Bytes 1-3 of every frame carry the BCD user code (echoed in responses)
+_USER_CODE = slice(1, 4)
+USER_CODE_MASK = b"\xff\xff\xff"
+
+
+def mask_user_code(frame: bytes) -> bytes:
+    """Return ``frame`` with the user code replaced by :data:`USER_CODE_MASK`."""
+    if len(frame) < _USER_CODE.stop:
+        return bytes(frame)
+    return frame[: _USER_CODE.start] + USER_CODE_MASK + frame[_USER_CODE.stop :]
+
+
+class HexDump:
+    """Format bytes as a hex string only when converted to ``str``.
+
+    Passed as a logging argument, the formatting cost is paid only if the
+    record is actually emitted.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: bytes) -> None:
+        self._data = data
+
+    def __str__(self) -> str:
+        return self._data.hex(" ").upper()
+
+
+class FrameTracer:
+    """Record raw (decrypted) frames in a bounded ring buffer.
+
+    Frames are stored as bytes, with the user code masked, and formatted
+    only by :meth:`dump`. Every
+    ``sample_every``-th matching frame is recorded; ``commands`` restricts
+    tracing to a set of command codes (responses inherit the code of the
+    request they answer).
+    """
+
+    def __init__(
+        self,
+        size: int = 500,
+        sample_every: int = 1,
+        commands: Optional[Iterable[int]] = None,
+    ) -> None:
+        """
+        Initialize the tracer.
+
+        :param size: Maximum number of frames kept in the buffer.
+        :param sample_every: Record one frame out of ``sample_every``.
+        :param commands: Command codes to trace (all commands if None).
+        """
+        if sample_every < 1:
+            raise ValueError("sample_every must be at least 1.")
+        self.sample_every = sample_every
+        self.commands = frozenset(commands) if commands is not None else None
+        self._frames: deque = deque(maxlen=size)
+        self._lock = threading.Lock()
+        self._seen = 0
+
+    def wants(self, command: int) -> bool:
+        """Return True if frames for ``command`` pass the filter and sampling.
+
+        Call once per request; the response to a sampled request should be
+        recorded unconditionally with :meth:`record`.
+        """
+        if self.commands is not None and command not in self.commands:
+            return False
+        with self._lock:
+            self._seen += 1
+            return (self._seen - 1) % self.sample_every == 0
+
+    def record(self, direction: str, command: int, frame: bytes) -> None:
+        """Append a raw frame to the ring buffer, user code masked."""
+        frame = mask_user_code(frame)
+        with self._lock:
+            self._frames.append((time.time(), direction, command, frame))
+
+    def clear(self) -> None:
+        """Drop all recorded frames."""
+        with self._lock:
+            self._frames.clear()
+
+    def dump(self) -> list[dict]:
+        """Return the recorded frames, formatted as hex strings."""
+        with self._lock:
+            frames = list(self._frames)
+        return [
+            {
+                "time": timestamp,
+                "direction": direction,
+                "command": f"0x{command:02X}",
+                "frame": str(HexDump(frame)),
+            }
+            for timestamp, direction, command, frame in frames
+        ]
@@ -0,0 +1,292 @@
+"""Async change stream over the polled status of a TecnoOut panel."""
+
+import asyncio
+import logging
+import time
+from contextlib import suppress
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Callable,
+    NamedTuple,
+    Optional,
+    Union,
+)
+
+from .entities import GeneralStatus, ProgramStatus, ZoneDetailedStatus
+from .zone_index import ZONE_FLAGS
+
+if TYPE_CHECKING:
+    from .tecnout_client import TecnoOutClient
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds allowed for one sweep, whatever the polling interval
+DEFAULT_SWEEP_TIMEOUT = 10.0
+
+
+class ZoneFlagChanged(NamedTuple):
+    """A flag of a zone went on or off."""
+
+    zone: int
+    flag: str
+    value: bool
+    time: float
+
+
+class ProgramChanged(NamedTuple):
+    """The status byte of a program changed."""
+
+    program: int
+    previous: ProgramStatus
+    current: ProgramStatus
+    time: float
+
+
+class PanelFlagChanged(NamedTuple):
+    """A flag of the panel general status went on or off."""
+
+    flag: str
+    value: bool
+    time: float
+
+
+Change = Union[ZoneFlagChanged, ProgramChanged, PanelFlagChanged]
+
+
+class ChangeBuffer:
+    """Pending changes keyed by what changed, coalesced until consumed.
+
+    A key holds the value it had before its first pending change and its
+    latest event; a change that returns to that value cancels out. Memory is
+    bounded by the number of zones, programs and flags, however slow the
+    consumer.
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[tuple, tuple[object, Change]] = {}
+        self._ready = asyncio.Event()
+        self._error: Optional[BaseException] = None
+        self.coalesced = 0
+
+    def put(self, key: tuple, origin: object, current: object, event: Change) -> None:
+        """Add ``event``, which moved ``key`` from ``origin`` to ``current``."""
+        pending = self._pending.get(key)
+        if pending is None:
+            self._pending[key] = (origin, event)
+        else:
+            self.coalesced += 1
+            if pending[0] == current:
+                del self._pending[key]
+            else:
+                self._pending[key] = (pending[0], event)
+        if self._pending:
+            self._ready.set()
+
+    def fail(self, error: BaseException) -> None:
+        """Stop the stream: the consumer raises ``error`` once drained."""
+        self._error = error
+        self._ready.set()
+
+    async def get(self) -> list[Change]:
+        """Wait for and return every pending change, oldest key first."""
+        while not self._pending:
+            if self._error is not None:
+                raise self._error
+            self._ready.clear()
+            await self._ready.wait()
+        batch = [event for _, event in self._pending.values()]
+        self._pending = {}
+        return batch
+
+
+def _panel_flags() -> list[tuple[int, int, str]]:
+    """Return (byte, mask, flag) for every flag of the general status."""
+    return [
+        (byte, 1 << bit, flag)
+        for byte, flags in GeneralStatus._FLAG_BYTES.items()
+        for bit, flag in enumerate(flags)
+        if flag is not None
+    ]
+
+
+class _Differ:
+    """Compare consecutive sweeps byte-wise and feed the changes to a buffer."""
+
+    def __init__(self, buffer: ChangeBuffer) -> None:
+        self._buffer = buffer
+        self._panel_flags = _panel_flags()
+        self._general: Optional[bytes] = None
+        self._zones: Optional[bytes] = None
+        self._programs: dict[int, ProgramStatus] = {}
+
+    def update(
+        self,
+        general_status: Optional[GeneralStatus],
+        zones: list[ZoneDetailedStatus],
+        programs: list[ProgramStatus],
+        now: float,
+    ) -> None:
+        if general_status is not None:
+            self._diff_general(general_status.to_bytes(), now)
+        self._diff_zones(zones, now)
+        for program in programs:
+            previous = self._programs.get(program.idx)
+            self._programs[program.idx] = program
+            if previous is None or previous.to_bytes() == program.to_bytes():
+                continue
+            self._buffer.put(
+                ("program", program.idx),
+                previous.to_bytes(),
+                program.to_bytes(),
+                ProgramChanged(program.idx, previous, program, now),
+            )
+
+    def _diff_general(self, general: bytes, now: float) -> None:
+        previous, self._general = self._general, general
+        if previous is None or previous == general:
+            return
+        for byte, mask, flag in self._panel_flags:
+            if (previous[byte] ^ general[byte]) & mask:
+                value = bool(general[byte] & mask)
+                self._buffer.put(
+                    ("panel", flag), not value, value, PanelFlagChanged(flag, value, now)
+                )
+
+    def _diff_zones(self, zones: list[ZoneDetailedStatus], now: float) -> None:
+        payload = b"".join(zone.to_bytes() for zone in zones)
+        previous, self._zones = self._zones, payload
+        if previous is None or previous == payload or len(previous) != len(payload):
+            return
+        for offset, zone in enumerate(zones):
+            start = offset * 2
+            before = previous[start : start + 2]
+            after = payload[start : start + 2]
+            if before == after:
+                continue
+            old_word = before[0] | before[1] << 8
+            new_word = after[0] | after[1] << 8
+            flipped = old_word ^ new_word
+            while flipped:
+                bit = flipped & -flipped
+                flipped ^= bit
+                flag = ZONE_FLAGS[bit.bit_length() - 1]
+                value = bool(new_word & bit)
+                self._buffer.put(
+                    ("zone", zone.idx, flag),
+                    not value,
+                    value,
+                    ZoneFlagChanged(zone.idx, flag, value, now),
+                )
+
+
+# General status (if watched), zones and programs read by one sweep
+_Sweep = tuple[Optional[GeneralStatus], list[ZoneDetailedStatus], list[ProgramStatus]]
+
+
+def _sweeper(
+    client: "TecnoOutClient",
+    zones_count: int,
+    programs_count: int,
+    general_status: bool,
+    sweep_timeout: float,
+) -> Callable[[], _Sweep]:
+    """Return the blocking job reading everything watched, within ``sweep_timeout``."""
+
+    def sweep() -> _Sweep:
+        deadline = time.monotonic() + sweep_timeout
+        return (
+            client.get_general_status(deadline=deadline) if general_status else None,
+            client.get_zones_detail(zones_count, deadline=deadline)
+            if zones_count
+            else [],
+            client.get_programs_status(programs_count, deadline=deadline)
+            if programs_count
+            else [],
+        )
+
+    return sweep
+
+
+async def _poll(
+    sweep: Callable[[], _Sweep],
+    differ: _Differ,
+    buffer: ChangeBuffer,
+    interval: float,
+    max_failures: Optional[int],
+) -> None:
+    """Sweep every ``interval`` seconds until cancelled or a fatal error."""
+    # Imported here: the client module imports this one
+    # pylint: disable-next=import-outside-toplevel
+    from .tecnout_client import PanelBusyError
+
+    loop = asyncio.get_running_loop()
+    failures = 0
+    next_due = loop.time()
+    while True:
+        try:
+            result = await loop.run_in_executor(None, sweep)
+        except (OSError, PanelBusyError) as err:
+            # Timeouts, dropped connections and busy answers: the client
+            # reconnects with the next command, so try again next period
+            failures += 1
+            if max_failures is not None and failures >= max_failures:
+                buffer.fail(err)
+                return
+            _LOGGER.debug("Watch sweep failed (%s), retrying", err)
+        except Exception as err:  # pylint: disable=broad-except
+            buffer.fail(err)
+            return
+        else:
+            failures = 0
+            differ.update(*result, time.time())
+        # Keep the cadence: skip missed periods instead of bursting
+        next_due += interval
+        now = loop.time()
+        if next_due < now:
+            next_due = now
+        await asyncio.sleep(next_due - now)
+
+
+async def watch_changes(
+    client: "TecnoOutClient",
+    zones_count: Optional[int] = None,
+    programs_count: Optional[int] = None,
+    interval: float = 1.0,
+    general_status: bool = True,
+    sweep_timeout: float = DEFAULT_SWEEP_TIMEOUT,
+    max_failures: Optional[int] = None,
+) -> AsyncIterator[Change]:
+    """
+    Poll the panel every ``interval`` seconds and yield what changed.
+
+    Each sweep runs as a single blocking job in the default executor, with
+    ``sweep_timeout`` as its deadline. The first sweep is the baseline and
+    yields nothing. Changes that pile up while the consumer is busy are
+    coalesced, so a flag that went on and off again in the meantime is not
+    reported. A sweep failing with a timeout, a connection error or a busy
+    panel is retried the next period, and the changes are reported against
+    the last successful sweep; other errors, or ``max_failures`` failed
+    sweeps in a row, are raised by the iterator.
+    """
+    loop = asyncio.get_running_loop()
+    if zones_count is None or programs_count is None:
+        info = await loop.run_in_executor(None, client.get_info)
+        if zones_count is None:
+            zones_count = info.associated_zones
+        if programs_count is None:
+            programs_count = info.programs_count
+
+    buffer = ChangeBuffer()
+    sweep = _sweeper(client, zones_count, programs_count, general_status, sweep_timeout)
+    producer = loop.create_task(
+        _poll(sweep, _Differ(buffer), buffer, interval, max_failures)
+    )
+    try:
+        while True:
+            for change in await buffer.get():
+                yield change
+    finally:
+        producer.cancel()
+        with suppress(asyncio.CancelledError):
+            await producer
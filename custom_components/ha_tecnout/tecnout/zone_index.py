@@ -0,0 +1,149 @@
+"""Bitsets over the zones of a panel: flags, program membership and queries.
+
+Zone ``n`` is bit ``n - 1`` of every bitset.
+"""
+
+from typing import Iterable, Optional
+
+from .entities import ZoneDetailedStatus, ZoneSetting
+
+# Zone flags in bit order of the 2-byte 0x0F status, least significant first
+ZONE_FLAGS: tuple[str, ...] = (
+    "isolation_active",
+    "zone_status",
+    "zone_tamper_status",
+    "zone_tamper_alarm",
+    "battery_low",
+    "supervision_alarm",
+    "active_zone",
+    "learned_zone",
+    "mask_status",
+    "fail_status",
+    "alim_failure",
+    "input_10s_status",
+    "pre_alarm",
+    "alarm",
+    "alarm_24h",
+    "enabled",
+)
+
+# Short names accepted by queries
+ZONE_FLAG_ALIASES: dict[str, str] = {
+    "isolated": "isolation_active",
+    "open": "zone_status",
+    "tamper": "zone_tamper_status",
+    "tamper_alarm": "zone_tamper_alarm",
+    "low_battery": "battery_low",
+    "supervision": "supervision_alarm",
+    "active": "active_zone",
+    "learned": "learned_zone",
+    "masked": "mask_status",
+    "failure": "fail_status",
+    "power_failure": "alim_failure",
+}
+
+
+def resolve_flag(name: str) -> str:
+    """
+    Return the zone flag for a flag name or alias.
+
+    :raises ValueError: If ``name`` is not a zone flag.
+    """
+    flag = ZONE_FLAG_ALIASES.get(name, name)
+    if flag not in ZONE_FLAGS:
+        raise ValueError(f"Unknown zone flag: {name}")
+    return flag
+
+
+def zones_in(mask: int) -> list[int]:
+    """Return the zone numbers set in ``mask``, in ascending order."""
+    zones = []
+    while mask:
+        low = mask & -mask
+        zones.append(low.bit_length())
+        mask ^= low
+    return zones
+
+
+class ZoneBitsets:
+    """One bitset per zone flag, transposed from the zone status table.
+
+    Built once per polling cycle; filters then run as a handful of integer
+    operations whatever the number of zones.
+    """
+
+    def __init__(self, zones: Iterable[ZoneDetailedStatus]) -> None:
+        bitsets = [0] * len(ZONE_FLAGS)
+        present = 0
+        for zone in zones:
+            bit = 1 << (zone.idx - 1)
+            present |= bit
+            low, high = zone.to_bytes()
+            word = low | high << 8
+            while word:
+                flag = word & -word
+                bitsets[flag.bit_length() - 1] |= bit
+                word ^= flag
+        self.present = present
+        self._bitsets = dict(zip(ZONE_FLAGS, bitsets, strict=True))
+
+    def flag(self, name: str) -> int:
+        """Return the bitset of the zones with flag ``name`` (or alias) set."""
+        return self._bitsets[resolve_flag(name)]
+
+    def query(
+        self,
+        all_of: Iterable[str] = (),
+        none_of: Iterable[str] = (),
+        any_of: Iterable[str] = (),
+        within: Optional[int] = None,
+    ) -> int:
+        """
+        Return the bitset of the zones matching a filter.
+
+        :param all_of: Flags that must all be set.
+        :param none_of: Flags that must all be clear.
+        :param any_of: Flags of which at least one must be set (ignored if empty).
+        :param within: Bitset the result is restricted to, e.g. a program's zones.
+        :raises ValueError: If a flag name is unknown.
+        """
+        result = self.present if within is None else self.present & within
+        for name in all_of:
+            result &= self.flag(name)
+        for name in none_of:
+            result &= ~self.flag(name)
+        any_mask: Optional[int] = None
+        for name in any_of:
+            any_mask = (any_mask or 0) | self.flag(name)
+        if any_mask is not None:
+            result &= any_mask
+        return result
+
+
+class ProgramZoneIndex:
+    """Map every program to the bitset of its member zones.
+
+    Built once from the zone settings (``0x20``); readiness checks then only
+    combine integers with the live zone table, without any panel traffic.
+    """
+
+    def __init__(self, settings: list[ZoneSetting], zone_from: int = 1) -> None:
+        self.zones_count = len(settings)
+        self._members: dict[int, int] = {}
+        self.cannot_be_excluded = 0
+        for offset, setting in enumerate(settings):
+            bit = 1 << (zone_from + offset - 1)
+            for program_offset, member in enumerate(setting.programs):
+                if member:
+                    program = program_offset + 1
+                    self._members[program] = self._members.get(program, 0) | bit
+            if setting.cannot_be_excluded:
+                self.cannot_be_excluded |= bit
+
+    def members(self, program: int) -> int:
+        """Return the bitset of the zones that belong to ``program``."""
+        return self._members.get(program, 0)
+
+    def blocking(self, program: int, open_zones: int) -> int:
+        """Return the bitset of the open zones of ``program``."""
+        return self._members.get(program, 0) & open_zones
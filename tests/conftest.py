@@ -0,0 +1,43 @@
+"""Fixtures for the TecnoOut tests."""
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+# The client library is imported as the top-level "tecnout" package, like
+# the benchmarks do, so these tests do not need Home Assistant
+sys.path.insert(
+    0, str(Path(__file__).resolve().parent.parent / "custom_components" / "ha_tecnout")
+)
+
+from tecnout.tecnout_client import TecnoOutClient  # noqa: E402
+
+from .const import PASSPHRASE, USER_CODE  # noqa: E402
+from .simulator import PanelSimulator, SimulatedPanel  # noqa: E402
+
+
+@pytest.fixture
+def panel() -> SimulatedPanel:
+    """Return the state of a small simulated panel."""
+    return SimulatedPanel(zones_count=16, programs_count=4)
+
+
+@pytest.fixture
+def simulator(panel: SimulatedPanel) -> Iterator[PanelSimulator]:
+    """Serve ``panel`` on a local port."""
+    with PanelSimulator(panel, user_code=USER_CODE, passphrase=PASSPHRASE) as sim:
+        yield sim
+
+
+@pytest.fixture
+def client(simulator: PanelSimulator) -> Iterator[TecnoOutClient]:
+    """Return a client connected to the simulator."""
+    client = TecnoOutClient(
+        simulator.host, simulator.port, USER_CODE, PASSPHRASE, command_timeout=2.0
+    )
+    client.connect()
+    yield client
+    client.close()
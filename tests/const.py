@@ -0,0 +1,4 @@
+"""Constants for the TecnoOut tests."""
+
+USER_CODE = 123456
+PASSPHRASE = "secret"
@@ -0,0 +1,377 @@
+"""Local TecnoOUT panel simulator for tests and benchmarks."""
+
+import logging
+import random
+import socket
+import socketserver
+import struct
+import threading
+import time
+from typing import Iterable, Optional
+
+from Crypto.Cipher import AES
+from tecnout.tecnout_client import TecnoOutClient
+
+_LOGGER = logging.getLogger(__name__)
+
+STX = 0x02
+ACK = 0x06
+NAK = 0x15
+USY = 0x0F
+
+_DESCRIPTION_SIZE = 30
+_ZONE_OPEN = 0b00000010
+_ZONE_ISOLATED = 0b00000001
+
+# Status set by command 0x10, indexed by SetProgramStatusEnum value
+_SET_PROGRAM_STATUS = {0: 0, 1: 3, 2: 3, 4: 3, 5: 5}
+
+
+class SimulatedPanel:
+    """State of a simulated control panel, shared by all its connections."""
+
+    def __init__(
+        self,
+        zones_count: int = 32,
+        programs_count: int = 4,
+        zone_names: Optional[list[str]] = None,
+        program_names: Optional[list[str]] = None,
+        logs: Optional[list[str]] = None,
+    ) -> None:
+        """
+        Initialize the panel state.
+
+        :param zones_count: Number of associated zones.
+        :param programs_count: Number of programs.
+        :param zone_names: Zone descriptions (defaults to "Zone N").
+        :param program_names: Program descriptions (defaults to "Area N").
+        :param logs: Log entries served by command 0x07, newest first.
+        """
+        self.zones_count = zones_count
+        self.programs_count = programs_count
+        self.zone_names = zone_names or [f"Zone {i}" for i in range(1, zones_count + 1)]
+        self.program_names = program_names or [
+            f"Area {i}" for i in range(1, programs_count + 1)
+        ]
+        self.logs = logs or ["System start"]
+        self.lock = threading.Lock()
+        # 2 bytes per zone: learned + active, enabled
+        self.zones = bytearray(b"\xc0\x80" * zones_count)
+        self.programs = bytearray(programs_count)
+        self.general_status = bytearray(16)
+        self.general_status[0:6] = bytes([0x27, 0x21, 0x10, 0xFF, 0x00, 35])
+        self.general_status[9] = 0b01000000  # system_status_ok
+        self.commands_served = 0
+
+    def set_zone_open(self, zone: int, is_open: bool) -> None:
+        """Open or close a zone (1-based)."""
+        self.set_zone_flags(zone, 0, _ZONE_OPEN, is_open)
+
+    def set_zone_flags(self, zone: int, byte: int, mask: int, value: bool) -> None:
+        """Set or clear ``mask`` in byte 0 or 1 of a zone's status (1-based)."""
+        with self.lock:
+            offset = (zone - 1) * 2 + byte
+            if value:
+                self.zones[offset] |= mask
+            else:
+                self.zones[offset] &= ~mask & 0xFF
+
+    def info_bytes(self) -> bytes:
+        """Return the 32-byte payload of command 0x28."""
+        data = bytearray(32)
+        data[0:6] = self.general_status[0:6]
+        data[6:8] = struct.pack("<H", max(self.zones_count, 1))
+        data[8:10] = struct.pack("<H", self.zones_count)
+        data[14:16] = struct.pack("<H", len(self.logs))
+        data[16] = self.programs_count
+        return bytes(data)
+
+    def zone_setting_bytes(self, zone: int) -> bytes:
+        """Return the 8-byte setting of a zone: one program, direct type."""
+        membership = 1 << ((zone - 1) % max(self.programs_count, 1))
+        return struct.pack("<I", membership) + bytes([1, 0, 0, 0])
+
+    def handle(self, command: int, data: bytes) -> tuple[int, bytes]:
+        """Execute a command and return its status byte and payload."""
+        with self.lock:
+            self.commands_served += 1
+            if command == 0x01:
+                return ACK, bytes(self.general_status)
+            if command == 0x28:
+                return ACK, self.info_bytes()
+            if command == 0x06:
+                return ACK, b""
+            if command == 0x07:
+                (number,) = struct.unpack("<H", data[:2])
+                if not 1 <= number <= len(self.logs):
+                    return NAK, b""
+                return ACK, self.logs[number - 1].encode("ascii")
+            if command == 0x03:
+                first, count = struct.unpack("<HH", data[:4])
+                return ACK, bytes(self.programs[first - 1 : first - 1 + count])
+            if command in (0x0F, 0x20, 0x21, 0x22):
+                first, last = struct.unpack("<HH", data[:4])
+                limit = self.programs_count if command == 0x22 else self.zones_count
+                if not 1 <= first <= last <= limit:
+                    return NAK, b""
+                if command == 0x0F:
+                    return ACK, bytes(self.zones[(first - 1) * 2 : last * 2])
+                if command == 0x20:
+                    return ACK, b"".join(
+                        self.zone_setting_bytes(zone) for zone in range(first, last + 1)
+                    )
+                names = self.program_names if command == 0x22 else self.zone_names
+                return ACK, b"".join(
+                    names[idx - 1].encode("ascii")[:_DESCRIPTION_SIZE].ljust(
+                        _DESCRIPTION_SIZE, b"\0"
+                    )
+                    for idx in range(first, last + 1)
+                )
+            if command == 0x10:
+                program, status = struct.unpack("<HB", data[:3])
+                if not 1 <= program <= self.programs_count or (
+                    status not in _SET_PROGRAM_STATUS
+                ):
+                    return NAK, b""
+                self.programs[program - 1] = _SET_PROGRAM_STATUS[status]
+                return ACK, b""
+            if command == 0x11:
+                zone, operation = struct.unpack("<HB", data[:3])
+                if not 1 <= zone <= self.zones_count:
+                    return NAK, b""
+                if operation:
+                    self.zones[(zone - 1) * 2] |= _ZONE_ISOLATED
+                else:
+                    self.zones[(zone - 1) * 2] &= ~_ZONE_ISOLATED & 0xFF
+                return ACK, b""
+        return NAK, b""
+
+
+class _ConnectionHandler(socketserver.BaseRequestHandler):
+    """Serve one client connection: IV handshake, then framed AES-CFB requests."""
+
+    server: "_SimulatorServer"
+
+    def setup(self) -> None:
+        self.server.connections.add(self.request)
+
+    def finish(self) -> None:
+        self.server.connections.discard(self.request)
+
+    def handle(self) -> None:
+        simulator = self.server.simulator
+        key = simulator.passphrase
+        try:
+            iv = self._read_raw(16)
+        except ConnectionError:
+            return
+        self._decryptor = AES.new(key, AES.MODE_CFB, iv=iv, segment_size=128)
+        self._encryptor = AES.new(key, AES.MODE_CFB, iv=iv, segment_size=128)
+        self._buffer = b""
+        while not simulator.stopping:
+            try:
+                header = self._read(6)
+                body = self._read(header[5] + 2)
+            except ConnectionError:
+                return
+            response = simulator.respond(header + body)
+            try:
+                simulator.write(self.request, self._encryptor.encrypt(response))
+            except OSError:
+                return
+
+    def _read_raw(self, size: int) -> bytes:
+        data = b""
+        while len(data) < size:
+            chunk = self.request.recv(size - len(data))
+            if not chunk:
+                raise ConnectionError("Connection closed by client")
+            data += chunk
+        return data
+
+    def _read(self, size: int) -> bytes:
+        """Read and decrypt exactly ``size`` bytes, keeping coalesced extra bytes."""
+        while len(self._buffer) < size:
+            chunk = self.request.recv(4096)
+            if not chunk:
+                raise ConnectionError("Connection closed by client")
+            self._buffer += self._decryptor.decrypt(chunk)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+class _SimulatorServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, address, simulator: "PanelSimulator") -> None:
+        self.simulator = simulator
+        self.connections: set = set()
+        super().__init__(address, _ConnectionHandler)
+
+
+class PanelSimulator:
+    """TCP server speaking the TecnoOUT protocol on behalf of a SimulatedPanel.
+
+    Supports legacy CRC mode, scripted zone activity, injected latency,
+    NAK/USY replies and fragmented response writes. Typical use::
+
+        with PanelSimulator(SimulatedPanel(zones_count=128)) as sim:
+            client = TecnoOutClient(sim.host, sim.port, 123456, "")
+            client.connect()
+    """
+
+    def __init__(
+        self,
+        panel: Optional[SimulatedPanel] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        user_code: int = 123456,
+        passphrase: str = "",
+        legacy: bool = False,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        busy_rate: float = 0.0,
+        nak_rate: float = 0.0,
+        fragment_size: Optional[int] = None,
+        fragment_delay: float = 0.0,
+        activity: Optional[Iterable[tuple[float, int, bool]]] = None,
+        seed: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize the simulator.
+
+        :param panel: Panel state to serve (a default 32-zone panel if None).
+        :param host: Address to listen on.
+        :param port: Port to listen on (0 picks a free port).
+        :param user_code: User code expected in requests.
+        :param passphrase: AES passphrase, formatted like the client does.
+        :param legacy: Use the legacy CRC layout.
+        :param latency: Fixed delay in seconds before each response.
+        :param jitter: Maximum random delay added to ``latency``.
+        :param busy_rate: Probability of answering USY to a request.
+        :param nak_rate: Probability of answering NAK to a request.
+        :param fragment_size: Split each response into writes of this size.
+        :param fragment_delay: Delay in seconds between fragments.
+        :param activity: Scripted zone changes as (seconds after start, zone,
+            open) tuples, applied when the first request after that time arrives.
+        :param seed: Seed for the latency, busy and NAK random generator.
+        """
+        self.panel = panel or SimulatedPanel()
+        self.legacy = legacy
+        self.passphrase = TecnoOutClient._format_passphrase(passphrase).encode("utf-8")
+        self.latency = latency
+        self.jitter = jitter
+        self.busy_rate = busy_rate
+        self.nak_rate = nak_rate
+        self.fragment_size = fragment_size
+        self.fragment_delay = fragment_delay
+        self.stopping = False
+        self._user_code = TecnoOutClient._get_bcd_user_code(user_code)
+        self._activity = sorted(activity or [])
+        self._random = random.Random(seed)
+        self._injected: list[tuple[Optional[int], int]] = []
+        self._injected_lock = threading.Lock()
+        self._started_at = 0.0
+        self._server = _SimulatorServer((host, port), self)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def host(self) -> str:
+        """Return the address the simulator listens on."""
+        return self._server.server_address[0]
+
+    @property
+    def port(self) -> int:
+        """Return the port the simulator listens on."""
+        return self._server.server_address[1]
+
+    def inject(self, status: int, count: int = 1, command: Optional[int] = None) -> None:
+        """Answer the next ``count`` requests (for ``command``, or any) with ``status``."""
+        with self._injected_lock:
+            self._injected.extend([(command, status)] * count)
+
+    def process(self, frame: bytes) -> tuple[int, bytes]:
+        """Validate a decrypted request frame and return status and payload."""
+        command = frame[4]
+        crc_data = frame[:-3] if self.legacy else frame[:-2]
+        if (
+            frame[0] != STX
+            or frame[1:4] != self._user_code
+            or TecnoOutClient._calculate_crc16(crc_data) != frame[-2:]
+        ):
+            return NAK, b""
+        self._apply_activity()
+        if self.latency or self.jitter:
+            time.sleep(self.latency + self._random.uniform(0.0, self.jitter))
+        injected = self._take_injected(command)
+        if injected is not None:
+            return injected, b""
+        if self.busy_rate and self._random.random() < self.busy_rate:
+            return USY, b""
+        if self.nak_rate and self._random.random() < self.nak_rate:
+            return NAK, b""
+        return self.panel.handle(command, frame[6:-2])
+
+    def respond(self, frame: bytes) -> bytes:
+        """Process a decrypted request frame and return the plaintext response."""
+        status, payload = self.process(frame)
+        response = bytes([STX]) + frame[1:4] + bytes([status, len(payload) & 0xFF])
+        response += payload
+        return response + TecnoOutClient._calculate_crc16(
+            response[:-1] if self.legacy else response
+        )
+
+    def write(self, sock, data: bytes) -> None:
+        """Send a response, fragmented if configured."""
+        if not self.fragment_size:
+            sock.sendall(data)
+            return
+        for i in range(0, len(data), self.fragment_size):
+            if i and self.fragment_delay:
+                time.sleep(self.fragment_delay)
+            sock.sendall(data[i : i + self.fragment_size])
+
+    def _take_injected(self, command: int) -> Optional[int]:
+        with self._injected_lock:
+            for i, (target, status) in enumerate(self._injected):
+                if target is None or target == command:
+                    del self._injected[i]
+                    return status
+        return None
+
+    def _apply_activity(self) -> None:
+        elapsed = time.monotonic() - self._started_at
+        while self._activity and self._activity[0][0] <= elapsed:
+            _, zone, is_open = self._activity.pop(0)
+            self.panel.set_zone_open(zone, is_open)
+
+    def start(self) -> "PanelSimulator":
+        """Start serving in a background thread."""
+        self._started_at = time.monotonic()
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        _LOGGER.debug("Panel simulator listening on %s:%s", self.host, self.port)
+        return self
+
+    def stop(self) -> None:
+        """Stop serving, drop open connections and close the listening socket."""
+        self.stopping = True
+        self._server.shutdown()
+        for connection in list(self._server.connections):
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        self._server.server_close()
+        if self._thread:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+
+    def __enter__(self) -> "PanelSimulator":
+        """Start the simulator."""
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Stop the simulator."""
+        self.stop()
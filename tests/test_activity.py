@@ -0,0 +1,95 @@
+"""Tests for the incremental zone activity counters."""
+from __future__ import annotations
+
+import pytest
+from tecnout.activity import ZoneActivity
+
+HOUR = 3600.0
+DAY = 86400.0
+
+
+def _update(activity: ZoneActivity, now: float, open_zones: int) -> bool:
+    return activity.update(now, open_zones, now // HOUR * HOUR, now // DAY * DAY)
+
+
+def test_first_update_is_a_baseline() -> None:
+    """Zones already open start their interval but are not activations."""
+    activity = ZoneActivity()
+
+    assert _update(activity, 100.0, 0b101)
+
+    assert activity.zones[1].activations == 0
+    assert activity.zones[3].open_since == 100.0
+    assert activity.zones[3].last_activated is None
+
+
+def test_openings_count_and_closings_add_open_time() -> None:
+    """Each opening is an activation; the open time adds up on closing."""
+    activity = ZoneActivity()
+    _update(activity, 0.0, 0)
+    for start in (10.0, 100.0, 200.0):
+        assert _update(activity, start, 0b10)
+        assert _update(activity, start + 5.0, 0)
+
+    stats = activity.zones[2]
+    assert stats.activations == 3
+    assert stats.open_time == pytest.approx(15.0)
+    assert stats.open_since is None
+    assert stats.last_activated == 200.0
+    assert set(activity.zones) == {2}
+
+
+def test_unchanged_cycles_touch_nothing() -> None:
+    """A cycle without openings or closings reports no change."""
+    activity = ZoneActivity()
+    _update(activity, 0.0, 0b1)
+
+    assert not _update(activity, 1.0, 0b1)
+    assert not _update(activity, 2.0, 0b1)
+
+
+def test_unchanged_baseline_primes_the_counters() -> None:
+    """After a baseline with nothing open, the first opening counts."""
+    activity = ZoneActivity()
+    assert not _update(activity, 0.0, 0)
+
+    _update(activity, 1.0, 0b1)
+
+    assert activity.zones[1].activations == 1
+
+
+def test_hour_and_day_counters_reset() -> None:
+    """Hour and day counts restart with a new hour or day."""
+    activity = ZoneActivity()
+    _update(activity, 0.0, 0)
+    for now in (10.0, 20.0, HOUR + 10.0, DAY + 10.0):
+        _update(activity, now, 0b1)
+        _update(activity, now + 1.0, 0)
+
+    stats = activity.zones[1]
+    assert stats.activations == 4
+    assert stats.activations_in_hour(DAY) == 1
+    assert stats.activations_in_day(DAY) == 1
+    # Counts of a past hour or day are not reported for another one
+    assert stats.activations_in_hour(0.0) == 0
+    assert stats.activations_in_day(0.0) == 0
+
+
+def test_saved_counters_restore_with_a_baseline() -> None:
+    """Restored counters keep their totals; open intervals close on save."""
+    activity = ZoneActivity()
+    _update(activity, 0.0, 0)
+    _update(activity, 10.0, 0b11)
+    _update(activity, 20.0, 0b01)
+
+    saved = activity.to_dict(now=40.0)
+    restored = ZoneActivity.from_dict(saved)
+
+    assert saved["zones"]["1"]["open_time"] == pytest.approx(30.0)
+    assert saved["zones"]["1"]["open_since"] is None
+    assert restored.zones[1].activations == 1
+    assert restored.zones[2].open_time == pytest.approx(10.0)
+    # Zone 1 still open after the restart: not a new activation
+    _update(restored, 50.0, 0b01)
+    assert restored.zones[1].activations == 1
+    assert restored.zones[1].open_since == 50.0
@@ -0,0 +1,177 @@
+"""Tests for the TecnoOut client, driven against the panel simulator."""
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import pytest
+from tecnout.entities import ProgramStatusEnum, SetProgramStatusEnum
+from tecnout.recording import ReplayTransport, SessionRecorder
+from tecnout.tecnout_client import PanelBusyError, TecnoOutClient
+from tecnout.tracing import FrameTracer
+
+from .const import PASSPHRASE, USER_CODE
+from .simulator import NAK, USY, PanelSimulator, SimulatedPanel
+
+# BCD user code as sent in bytes 1-3 of every frame
+BCD_USER_CODE = TecnoOutClient._get_bcd_user_code(USER_CODE)
+
+
+def test_get_info(client: TecnoOutClient) -> None:
+    """The panel reports its zones and programs."""
+    info = client.get_info()
+
+    assert info.associated_zones == 16
+    assert info.programs_count == 4
+
+
+def test_zones_detail(client: TecnoOutClient, panel: SimulatedPanel) -> None:
+    """Zone flags are decoded, zone by zone."""
+    panel.set_zone_open(3, True)
+
+    zones = client.get_zones_detail(16)
+
+    assert [zone.idx for zone in zones] == list(range(1, 17))
+    assert [zone.idx for zone in zones if zone.zone_status] == [3]
+    assert all(zone.enabled for zone in zones)
+
+
+def test_zones_detail_in_chunks(simulator: PanelSimulator) -> None:
+    """Sweeps of more than 32 zones are split in several requests."""
+    simulator.panel = SimulatedPanel(zones_count=70)
+    simulator.panel.set_zone_open(65, True)
+    client = TecnoOutClient(simulator.host, simulator.port, USER_CODE, PASSPHRASE)
+    with client:
+        zones = client.get_zones_detail(70)
+
+    assert len(zones) == 70
+    assert simulator.panel.commands_served == 3
+    assert [zone.idx for zone in zones if zone.zone_status] == [65]
+
+
+def test_set_program(client: TecnoOutClient) -> None:
+    """Arming a program changes its status."""
+    client.set_program(2, SetProgramStatusEnum.AUTOARM)
+
+    programs = client.get_programs_status(4)
+
+    assert [program.program_status for program in programs] == [
+        ProgramStatusEnum.STANDBY,
+        ProgramStatusEnum.ARMED,
+        ProgramStatusEnum.STANDBY,
+        ProgramStatusEnum.STANDBY,
+    ]
+
+
+def test_set_zone_isolation(client: TecnoOutClient) -> None:
+    """A zone can be isolated and reintegrated."""
+    client.set_zone_isolation(5, True)
+    assert client.get_zones_detail(1, 5)[0].isolation_active
+
+    client.set_zone_isolation(5, False)
+    assert not client.get_zones_detail(1, 5)[0].isolation_active
+
+
+def test_descriptions(client: TecnoOutClient) -> None:
+    """Zone and program descriptions are read in chunks of 8."""
+    assert client.get_zones_description(10) == [f"Zone {i}" for i in range(1, 11)]
+    assert client.get_programs_description(4) == [f"Area {i}" for i in range(1, 5)]
+
+
+def test_busy_answer_is_retried(
+    client: TecnoOutClient, simulator: PanelSimulator
+) -> None:
+    """A USY answer is retried within the budget of the command."""
+    simulator.inject(USY, count=2, command=0x01)
+
+    client.get_general_status()
+
+    assert client.busy_retry_counts[0x01] == 2
+
+
+def test_busy_retries_exhausted(
+    client: TecnoOutClient, simulator: PanelSimulator
+) -> None:
+    """The panel still busy after the retries raises PanelBusyError."""
+    client.busy_retries = 1
+    simulator.inject(USY, count=2, command=0x01)
+
+    with pytest.raises(PanelBusyError):
+        client.get_general_status()
+    assert client.busy_exhausted_counts[0x01] == 1
+
+
+def test_nak_is_not_retried(client: TecnoOutClient, simulator: PanelSimulator) -> None:
+    """A NAK answer raises at once."""
+    simulator.inject(NAK, command=0x01)
+
+    with pytest.raises(ValueError, match="NAK"):
+        client.get_general_status()
+    assert client.busy_retry_counts[0x01] == 0
+
+
+def test_legacy_crc(panel: SimulatedPanel) -> None:
+    """The legacy CRC layout is used both ways."""
+    with PanelSimulator(
+        panel, user_code=USER_CODE, passphrase=PASSPHRASE, legacy=True
+    ) as sim, TecnoOutClient(
+        sim.host, sim.port, USER_CODE, PASSPHRASE, legacy=True
+    ) as client:
+        assert client.get_info().associated_zones == 16
+
+
+def test_fragmented_responses(panel: SimulatedPanel) -> None:
+    """Responses split over several TCP segments are reassembled."""
+    with PanelSimulator(
+        panel,
+        user_code=USER_CODE,
+        passphrase=PASSPHRASE,
+        fragment_size=3,
+        fragment_delay=0.001,
+    ) as sim, TecnoOutClient(sim.host, sim.port, USER_CODE, PASSPHRASE) as client:
+        assert len(client.get_zones_detail(16)) == 16
+
+
+def test_deadline_drops_and_reopens_the_connection(
+    client: TecnoOutClient, simulator: PanelSimulator
+) -> None:
+    """A command past its deadline fails; the next one reconnects."""
+    simulator.latency = 0.3
+
+    with pytest.raises(TimeoutError):
+        client.get_general_status(deadline=time.monotonic() + 0.05)
+
+    simulator.latency = 0.0
+    assert client.get_general_status() is not None
+
+
+def test_tracer_masks_user_code(client: TecnoOutClient) -> None:
+    """Traced frames never hold the user code."""
+    client.tracer = FrameTracer()
+
+    client.get_general_status()
+
+    frames = client.tracer.dump()
+    assert [frame["direction"] for frame in frames] == ["tx", "rx"]
+    for frame in frames:
+        assert frame["frame"].startswith("02 FF FF FF ")
+
+
+def test_recording_replays_without_user_code(
+    client: TecnoOutClient, tmp_path: Path
+) -> None:
+    """A recording holds no user code and replays with any other code."""
+    path = tmp_path / "session.tosr"
+    client.recorder = SessionRecorder(str(path))
+    info = client.get_info()
+    status = client.get_general_status()
+    client.recorder.close()
+
+    assert BCD_USER_CODE not in path.read_bytes()
+
+    replay = ReplayTransport.from_file(str(path), passphrase=PASSPHRASE, speed=0)
+    with TecnoOutClient(
+        "replay", 0, 654321, PASSPHRASE, socket_factory=replay.connect
+    ) as replayed:
+        assert replayed.get_info() == info
+        assert replayed.get_general_status() == status
@@ -0,0 +1,166 @@
+"""Tests for the coordinator snapshot restore, against the panel simulator."""
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.ha_tecnout.const import (  # noqa: E402
+    CONF_HOST,
+    CONF_PASSPHRASE,
+    CONF_PORT,
+    CONF_USER_CODE,
+)
+from custom_components.ha_tecnout.coordinator import (  # noqa: E402
+    SECTIONS,
+    TecnoOutCoordinator,
+)
+from custom_components.ha_tecnout.hub import TecnoOutHub  # noqa: E402
+
+from .const import PASSPHRASE, USER_CODE  # noqa: E402
+from .simulator import NAK, PanelSimulator  # noqa: E402
+
+GENERAL_STATUS = 0x01
+
+
+async def _restore_scenario(tmp_path: Path, simulator: PanelSimulator) -> None:
+    """Poll, save, then restore the snapshot with the panel gone."""
+    hass = HomeAssistant(str(tmp_path))
+    hub = TecnoOutHub(hass)
+    entry = SimpleNamespace(
+        entry_id="entry",
+        data={
+            CONF_HOST: simulator.host,
+            CONF_PORT: simulator.port,
+            CONF_USER_CODE: USER_CODE,
+            CONF_PASSPHRASE: PASSPHRASE,
+        },
+        options={},
+    )
+    try:
+        coordinator = TecnoOutCoordinator(hass, entry, hub)
+        await coordinator.async_refresh()
+        assert coordinator.last_update_success
+        zones = coordinator.data["zones"]
+        # Saves the snapshot
+        await coordinator.async_shutdown()
+        simulator.stop()
+
+        coordinator = TecnoOutCoordinator(hass, entry, hub)
+        coordinator.stale_after = 0.3
+        assert await coordinator.async_restore_snapshot()
+        assert coordinator.stale
+        assert coordinator.data["zones"] == zones
+        assert coordinator.data["zones"][2].zone_status
+
+        # The panel is gone: the restored data lasts stale_after, no more
+        await coordinator.async_refresh()
+        assert coordinator.last_update_success
+        assert all(coordinator.section_available(s) for s in SECTIONS)
+
+        await asyncio.sleep(0.4)
+        await coordinator.async_refresh()
+        assert not coordinator.last_update_success
+        assert not any(coordinator.section_available(s) for s in SECTIONS)
+        assert set(coordinator.section_errors) == set(SECTIONS)
+        await coordinator.async_shutdown()
+    finally:
+        hub.shutdown()
+        await hass.async_stop(force=True)
+
+
+def test_restored_snapshot_expires(tmp_path: Path, simulator: PanelSimulator) -> None:
+    """A restored snapshot stays available only stale_after without the panel."""
+    simulator.panel.set_zone_open(3, True)
+
+    asyncio.run(_restore_scenario(tmp_path, simulator))
+
+
+async def _partial_first_cycle_scenario(
+    tmp_path: Path, simulator: PanelSimulator
+) -> None:
+    """Unload after a first cycle whose general status read failed."""
+    hass = HomeAssistant(str(tmp_path))
+    hub = TecnoOutHub(hass)
+    entry = SimpleNamespace(
+        entry_id="entry",
+        data={
+            CONF_HOST: simulator.host,
+            CONF_PORT: simulator.port,
+            CONF_USER_CODE: USER_CODE,
+            CONF_PASSPHRASE: PASSPHRASE,
+        },
+        options={},
+    )
+    try:
+        coordinator = TecnoOutCoordinator(hass, entry, hub)
+        simulator.inject(NAK, command=GENERAL_STATUS)
+        await coordinator.async_refresh()
+        assert coordinator.last_update_success
+        assert coordinator.data["general_status"] is None
+        assert coordinator.data["zones"]
+
+        await coordinator.async_shutdown()
+
+        assert coordinator.client is None
+        assert not coordinator.io.running
+        assert not Path(coordinator.snapshot_path).exists()
+    finally:
+        hub.shutdown()
+        await hass.async_stop(force=True)
+
+
+def test_shutdown_after_partial_first_cycle(
+    tmp_path: Path, simulator: PanelSimulator
+) -> None:
+    """An incomplete first cycle saves no snapshot and still closes the client."""
+    asyncio.run(_partial_first_cycle_scenario(tmp_path, simulator))
+
+
+async def _failed_cycle_scenario(tmp_path: Path, simulator: PanelSimulator) -> None:
+    """Profile a good cycle, then one failing with the panel gone."""
+    hass = HomeAssistant(str(tmp_path))
+    hub = TecnoOutHub(hass)
+    entry = SimpleNamespace(
+        entry_id="entry",
+        data={
+            CONF_HOST: simulator.host,
+            CONF_PORT: simulator.port,
+            CONF_USER_CODE: USER_CODE,
+            CONF_PASSPHRASE: PASSPHRASE,
+        },
+        options={},
+    )
+    try:
+        coordinator = TecnoOutCoordinator(hass, entry, hub)
+        coordinator.set_profiling(True)
+        await coordinator.async_refresh()
+        assert coordinator.profile_report()["cycles"] == 1
+
+        simulator.stop()
+        coordinator.stale_after = 0
+        await coordinator.async_refresh()
+        assert not coordinator.last_update_success
+        # A second failure in a row does not update the listeners
+        await coordinator.async_refresh()
+
+        # Closed by the failed refresh, not by the next cycle
+        assert not coordinator.profiler.in_cycle
+        assert coordinator.profile_report()["cycles"] == 3
+        await coordinator.async_shutdown()
+    finally:
+        hub.shutdown()
+        await hass.async_stop(force=True)
+
+
+def test_failed_refresh_closes_the_profiled_cycle(
+    tmp_path: Path, simulator: PanelSimulator
+) -> None:
+    """A failed cycle is recorded when it fails, without the idle time after."""
+    asyncio.run(_failed_cycle_scenario(tmp_path, simulator))
@@ -0,0 +1,170 @@
+"""Tests for the per-panel I/O thread."""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+from tecnout.entities import SetProgramStatusEnum
+from tecnout.io_thread import PanelIOThread
+from tecnout.tecnout_client import TecnoOutClient
+
+from .const import PASSPHRASE, USER_CODE
+from .simulator import PanelSimulator
+
+
+def test_calls_run_in_order_on_one_thread() -> None:
+    """Every call runs on the named thread, in submission order."""
+    io = PanelIOThread("tecnout_io_test")
+    seen: list[tuple[int, str]] = []
+
+    def call(number: int) -> int:
+        seen.append((number, threading.current_thread().name))
+        return number * 2
+
+    async def run() -> list[int]:
+        return await asyncio.gather(*(io.run(call, n) for n in range(20)))
+
+    try:
+        assert asyncio.run(run()) == [n * 2 for n in range(20)]
+    finally:
+        io.stop()
+    assert seen == [(n, "tecnout_io_test") for n in range(20)]
+    assert io.calls == 20
+
+
+def test_exceptions_reach_the_caller() -> None:
+    """A failing call raises in the awaiting task; the thread goes on."""
+    io = PanelIOThread()
+
+    async def run() -> int:
+        with pytest.raises(ZeroDivisionError):
+            await io.run(divmod, 1, 0)
+        return await io.run(int, "7")
+
+    try:
+        assert asyncio.run(run()) == 7
+    finally:
+        io.stop()
+    assert io.failures == 1
+
+
+def test_stop_and_restart() -> None:
+    """The thread ends after stop and starts again with the next call."""
+    io = PanelIOThread()
+
+    async def run() -> None:
+        first = await io.run(threading.get_ident)
+        io.stop()
+        assert not io.running
+        second = await io.run(threading.get_ident)
+        assert first != second
+
+    try:
+        asyncio.run(run())
+    finally:
+        io.stop()
+
+
+def test_urgent_calls_go_first() -> None:
+    """An urgent call runs before the calls already queued."""
+    io = PanelIOThread()
+    order: list[str] = []
+    gate = threading.Event()
+
+    async def run() -> None:
+        blocker = asyncio.ensure_future(io.run(gate.wait))
+        queued = [asyncio.ensure_future(io.run(order.append, n)) for n in "abc"]
+        await asyncio.sleep(0.05)
+        urgent = asyncio.ensure_future(io.run_urgent(order.append, "urgent"))
+        await asyncio.sleep(0.05)
+        gate.set()
+        await asyncio.gather(blocker, urgent, *queued)
+
+    try:
+        asyncio.run(run())
+    finally:
+        io.stop()
+    assert order == ["urgent", "a", "b", "c"]
+
+
+def test_shared_limiter_caps_concurrent_calls() -> None:
+    """Threads sharing a limiter run that many calls at once; urgent ones skip it."""
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def call() -> None:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+
+    async def run() -> float:
+        limiter = asyncio.Semaphore(2)
+        threads = [PanelIOThread(f"tecnout_io_{n}", limiter) for n in range(4)]
+        try:
+            await asyncio.gather(*(io.run(call) for io in threads for _ in range(2)))
+            assert peak == 2
+            blockers = [asyncio.ensure_future(io.run(call)) for io in threads]
+            await asyncio.sleep(0.01)
+            start = time.monotonic()
+            await threads[3].run_urgent(int, "1")
+            latency = time.monotonic() - start
+            await asyncio.gather(*blockers)
+            return latency
+        finally:
+            for io in threads:
+                io.stop()
+
+    # Behind the limiter the urgent call would wait for the blocked thread
+    assert asyncio.run(run()) < 0.05
+
+
+def test_idle_outside_the_thread_sleeps() -> None:
+    """Called from another thread, idle is a plain sleep."""
+    start = time.monotonic()
+    PanelIOThread().idle(0.05)
+    assert time.monotonic() - start >= 0.05
+
+
+def test_control_commands_skip_throttled_reads(simulator: PanelSimulator) -> None:
+    """An arm command runs while queued reads wait for rate limit tokens."""
+    client = TecnoOutClient(
+        simulator.host,
+        simulator.port,
+        USER_CODE,
+        PASSPHRASE,
+        command_timeout=30.0,
+        rate_limit=2.0,
+        rate_burst=1,
+        control_burst=2,
+    )
+    io = PanelIOThread()
+    client.throttle_sleep = io.idle
+
+    async def run() -> float:
+        await io.run(client.connect)
+        reads = [
+            asyncio.ensure_future(io.run(client.get_general_status))
+            for _ in range(6)
+        ]
+        await asyncio.sleep(0.2)
+        start = time.monotonic()
+        await io.run_urgent(client.set_program, 1, SetProgramStatusEnum.AUTOARM)
+        latency = time.monotonic() - start
+        await asyncio.gather(*reads)
+        await io.run(client.close)
+        return latency
+
+    try:
+        latency = asyncio.run(run())
+    finally:
+        io.stop()
+    # Queued behind the reads it would take about 2.5 s
+    assert latency < 0.5
+    assert simulator.panel.programs[0] == 3
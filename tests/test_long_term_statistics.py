@@ -0,0 +1,192 @@
+"""Tests for the hourly long-term statistics of zone and program activity."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Coroutine
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+pytest.importorskip("homeassistant.components.recorder")
+
+from custom_components.ha_tecnout import long_term_statistics  # noqa: E402
+from custom_components.ha_tecnout.const import (  # noqa: E402
+    STATISTICS_MAX_SAMPLE_GAP,
+)
+from custom_components.ha_tecnout.long_term_statistics import (  # noqa: E402
+    HOUR,
+    ActivityStatistics,
+)
+from custom_components.ha_tecnout.tecnout.entities import ProgramStatus  # noqa: E402
+
+PREFIX = "ha_tecnout:entry"
+ALARM = 0x20
+
+
+class FakeHass:
+    """Collect the background writes so the test can run them."""
+
+    def __init__(self) -> None:
+        self.tasks: list[Coroutine[Any, Any, None]] = []
+
+    def async_create_background_task(self, target, name: str) -> None:
+        self.tasks.append(target)
+
+    def run_tasks(self) -> None:
+        tasks, self.tasks = self.tasks, []
+        for task in tasks:
+            asyncio.run(task)
+
+
+class FakeRecorder:
+    """Stand in for the recorder: last rows to load and rows imported."""
+
+    def __init__(self) -> None:
+        self.last_rows: dict[str, dict[str, float]] = {}
+        self.rows: list[tuple[str, float, float, float]] = []
+
+    async def async_add_executor_job(self, target, *args):
+        return target(*args)
+
+    def get_last_statistics(self, hass, number, statistic_id, *_args):
+        row = self.last_rows.get(statistic_id)
+        return {statistic_id: [row]} if row else {}
+
+    def add_external_statistics(self, hass, metadata, statistics) -> None:
+        for row in statistics:
+            self.rows.append(
+                (
+                    metadata["statistic_id"],
+                    row["start"].timestamp(),
+                    row["state"],
+                    row["sum"],
+                )
+            )
+
+
+@pytest.fixture
+def recorder(monkeypatch: pytest.MonkeyPatch) -> FakeRecorder:
+    """Route the statistics reads and writes to a fake recorder."""
+    recorder = FakeRecorder()
+    monkeypatch.setattr(long_term_statistics, "get_instance", lambda hass: recorder)
+    monkeypatch.setattr(
+        long_term_statistics, "get_last_statistics", recorder.get_last_statistics
+    )
+    monkeypatch.setattr(
+        long_term_statistics,
+        "async_add_external_statistics",
+        recorder.add_external_statistics,
+    )
+    return recorder
+
+
+@pytest.fixture
+def hass() -> FakeHass:
+    """Return a hass collecting the background writes."""
+    return FakeHass()
+
+
+@pytest.fixture
+def statistics(hass: FakeHass) -> ActivityStatistics:
+    """Return a writer for a panel with no zone names."""
+    coordinator = SimpleNamespace(
+        entry=SimpleNamespace(entry_id="ENTRY"), get_zone=lambda zone_idx: None
+    )
+    return ActivityStatistics(hass, coordinator)
+
+
+def _programs(*status_bytes: int) -> list[ProgramStatus]:
+    return [
+        ProgramStatus.from_bytes(status_byte, idx)
+        for idx, status_byte in enumerate(status_bytes, start=1)
+    ]
+
+
+def _faulted(faulted: bool) -> SimpleNamespace:
+    return SimpleNamespace(
+        general_alarm_failure=False,
+        general_low_battery=False,
+        general_power_failure=faulted,
+        general_tamper=False,
+        wireless_failure=False,
+    )
+
+
+def test_hourly_sums_accumulate(
+    hass: FakeHass, recorder: FakeRecorder, statistics: ActivityStatistics
+) -> None:
+    """Openings are counted per hour and each row carries the running sum."""
+    # Zone 2 open on the first sample: a baseline, not an activation
+    statistics.record(0.0, 0b10, [], None)
+    for now, open_zones in ((10.0, 0b01), (20.0, 0), (30.0, 0b01), (40.0, 0)):
+        statistics.record(now, open_zones, [], None)
+    statistics.record(HOUR + 10.0, 0b01, [], None)
+    hass.run_tasks()
+    statistics.record(2 * HOUR + 10.0, 0, [], None)
+    hass.run_tasks()
+
+    assert recorder.rows == [
+        (f"{PREFIX}_zone_1_activations", 0.0, 2, 2),
+        (f"{PREFIX}_zone_1_activations", HOUR, 1, 3),
+    ]
+
+
+def test_sums_continue_after_a_restart(
+    hass: FakeHass, recorder: FakeRecorder, statistics: ActivityStatistics
+) -> None:
+    """The sums continue from the last row; the same hour extends that row."""
+    recorder.last_rows[f"{PREFIX}_zone_1_activations"] = {
+        "start": 0.0,
+        "state": 2.0,
+        "sum": 10.0,
+    }
+    recorder.last_rows[f"{PREFIX}_zone_3_activations"] = {
+        "start": -HOUR,
+        "state": 1.0,
+        "sum": 4.0,
+    }
+    statistics.record(100.0, 0, [], None)
+    statistics.record(110.0, 0b101, [], None)
+
+    asyncio.run(statistics.async_shutdown())
+
+    assert recorder.rows == [
+        (f"{PREFIX}_zone_1_activations", 0.0, 3.0, 11.0),
+        (f"{PREFIX}_zone_3_activations", 0.0, 1, 5.0),
+    ]
+    assert not hass.tasks
+
+
+def test_program_alarms_count_rising_edges(
+    hass: FakeHass, recorder: FakeRecorder, statistics: ActivityStatistics
+) -> None:
+    """An alarm lasting several cycles counts once."""
+    statistics.record(0.0, 0, _programs(0, 0), None)
+    for now in (10.0, 20.0, 30.0):
+        statistics.record(now, 0, _programs(0, ALARM), None)
+    statistics.record(40.0, 0, _programs(ALARM, 0), None)
+
+    asyncio.run(statistics.async_shutdown())
+
+    assert sorted(recorder.rows) == [
+        (f"{PREFIX}_program_1_alarms", 0.0, 1, 1),
+        (f"{PREFIX}_program_2_alarms", 0.0, 1, 1),
+    ]
+
+
+def test_fault_time_gaps_are_capped(
+    hass: FakeHass, recorder: FakeRecorder, statistics: ActivityStatistics
+) -> None:
+    """Fault time adds up between samples, at most the maximum gap each."""
+    statistics.record(0.0, 0, [], _faulted(True))
+    statistics.record(5.0, 0, [], _faulted(True))
+    statistics.record(5.0 + 10 * STATISTICS_MAX_SAMPLE_GAP, 0, [], _faulted(False))
+    statistics.record(HOUR - 1.0, 0, [], _faulted(False))
+
+    asyncio.run(statistics.async_shutdown())
+
+    fault_time = 5.0 + STATISTICS_MAX_SAMPLE_GAP
+    assert recorder.rows == [
+        (f"{PREFIX}_panel_fault_time", 0.0, fault_time, fault_time),
+    ]
@@ -0,0 +1,123 @@
+"""Tests for the cycle-time profiler."""
+from __future__ import annotations
+
+import pytest
+from tecnout.profiler import (
+    PHASE_AES,
+    PHASE_ENTITY_WRITES,
+    PHASE_OTHER,
+    PHASE_SOCKET_IO,
+    CycleProfiler,
+)
+
+
+class FakeClock:
+    """Clock advanced by hand."""
+
+    def __init__(self) -> None:
+        self.now = 10.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Drive every profiler from a fake clock."""
+    clock = FakeClock()
+    monkeypatch.setattr(CycleProfiler, "clock", staticmethod(clock))
+    return clock
+
+
+def _cycle(profiler: CycleProfiler, clock: FakeClock, socket_io: float, idle: float):
+    """Run a cycle spending ``socket_io`` on the socket and ``idle`` elsewhere."""
+    profiler.begin_cycle()
+    start = clock()
+    clock.now += socket_io
+    profiler.mark(PHASE_SOCKET_IO, start)
+    clock.now += idle
+    return profiler.end_cycle()
+
+
+def test_unattributed_time_goes_to_other(clock: FakeClock) -> None:
+    """The time no phase claimed is reported as other."""
+    profiler = CycleProfiler()
+
+    cycle = _cycle(profiler, clock, socket_io=0.2, idle=0.05)
+
+    assert cycle[PHASE_SOCKET_IO] == pytest.approx(0.2)
+    assert cycle[PHASE_OTHER] == pytest.approx(0.05)
+    assert cycle["total"] == pytest.approx(0.25)
+
+
+def test_mark_chains_phases(clock: FakeClock) -> None:
+    """Marks return the clock, so consecutive phases do not overlap."""
+    profiler = CycleProfiler()
+    profiler.begin_cycle()
+    t = clock()
+    clock.now += 0.01
+    t = profiler.mark(PHASE_AES, t)
+    clock.now += 0.03
+    profiler.mark(PHASE_ENTITY_WRITES, t)
+
+    cycle = profiler.end_cycle()
+
+    assert cycle[PHASE_AES] == pytest.approx(0.01)
+    assert cycle[PHASE_ENTITY_WRITES] == pytest.approx(0.03)
+    assert cycle[PHASE_OTHER] == pytest.approx(0.0)
+
+
+def test_time_outside_a_cycle_is_ignored(clock: FakeClock) -> None:
+    """Phases reported with no open cycle are not recorded."""
+    profiler = CycleProfiler()
+    profiler.add(PHASE_SOCKET_IO, 1.0)
+
+    assert not profiler.in_cycle
+    assert profiler.end_cycle() is None
+    assert profiler.report()["cycles"] == 0
+
+
+def test_cycle_left_open_is_dropped(clock: FakeClock) -> None:
+    """A cycle nobody closed does not count the wait for the next one."""
+    profiler = CycleProfiler(budget=1.0)
+    profiler.begin_cycle()
+    clock.now += 30.0
+
+    _cycle(profiler, clock, socket_io=0.1, idle=0.0)
+
+    report = profiler.report()
+    assert report["cycles"] == 1
+    assert report["overruns"] == 0
+
+
+def test_report_counts_overruns_in_the_window(clock: FakeClock) -> None:
+    """Only the last ``window`` cycles are reported, overruns included."""
+    profiler = CycleProfiler(window=3, budget=0.5)
+    for socket_io in (2.0, 0.1, 0.6, 0.2):
+        _cycle(profiler, clock, socket_io=socket_io, idle=0.0)
+
+    report = profiler.report()
+
+    assert report["cycles"] == 3
+    assert report["budget_ms"] == 500.0
+    assert report["overruns"] == 1
+    socket_io = report["phases"][PHASE_SOCKET_IO]
+    assert socket_io["max_ms"] == pytest.approx(600.0)
+    assert socket_io["mean_ms"] == pytest.approx(300.0)
+
+
+def test_reset_drops_the_cycles(clock: FakeClock) -> None:
+    """Reset empties the window and closes the open cycle."""
+    profiler = CycleProfiler()
+    _cycle(profiler, clock, socket_io=0.1, idle=0.0)
+    profiler.begin_cycle()
+
+    profiler.reset()
+
+    assert not profiler.in_cycle
+    assert profiler.report() == {
+        "cycles": 0,
+        "budget_ms": 1000.0,
+        "overruns": 0,
+        "phases": {},
+    }
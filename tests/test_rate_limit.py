@@ -0,0 +1,95 @@
+"""Tests for the token bucket rate limiter."""
+from __future__ import annotations
+
+import pytest
+from tecnout.rate_limit import TokenBucket
+
+
+class FakeClock:
+    """Monotonic clock advanced only by the bucket's own sleeps."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Drive every bucket from a fake clock."""
+    clock = FakeClock()
+    monkeypatch.setattr(TokenBucket, "clock", staticmethod(clock))
+    return clock
+
+
+def test_burst_then_rate(clock: FakeClock) -> None:
+    """A full bucket serves the burst at once, then one token per period."""
+    bucket = TokenBucket(rate=2.0, burst=3)
+
+    waits = [bucket.acquire(sleep=clock.sleep) for _ in range(5)]
+
+    assert waits == [0.0, 0.0, 0.0, pytest.approx(0.5), pytest.approx(0.5)]
+
+
+def test_tokens_refill_up_to_capacity(clock: FakeClock) -> None:
+    """Idle time refills the bucket, but not beyond its burst."""
+    bucket = TokenBucket(rate=1.0, burst=2)
+    bucket.acquire(sleep=clock.sleep)
+    bucket.acquire(sleep=clock.sleep)
+
+    clock.now += 60.0
+
+    assert [bucket.acquire(sleep=clock.sleep) for _ in range(3)] == [
+        0.0,
+        0.0,
+        pytest.approx(1.0),
+    ]
+
+
+def test_reserved_tokens_are_for_control_commands(clock: FakeClock) -> None:
+    """Reads leave the reserved tokens to control commands."""
+    bucket = TokenBucket(rate=1.0, burst=1, reserved=2)
+    assert bucket.acquire(sleep=clock.sleep) == 0.0
+
+    # The burst is spent: a read waits, control commands do not
+    assert bucket.acquire(control=True, sleep=clock.sleep) == 0.0
+    assert bucket.acquire(control=True, sleep=clock.sleep) == 0.0
+    assert bucket.acquire(control=True, sleep=clock.sleep) == pytest.approx(1.0)
+
+
+def test_reads_wait_for_the_reserve_to_refill(clock: FakeClock) -> None:
+    """A read needs a token above the reserve."""
+    bucket = TokenBucket(rate=1.0, burst=1, reserved=1)
+    bucket.acquire(sleep=clock.sleep)
+    bucket.acquire(control=True, sleep=clock.sleep)
+
+    # Empty bucket: one token to refill the reserve, one for the read
+    assert bucket.acquire(sleep=clock.sleep) == pytest.approx(2.0)
+
+
+def test_deadline(clock: FakeClock) -> None:
+    """No waiting past the deadline: TimeoutError instead."""
+    bucket = TokenBucket(rate=1.0)
+    bucket.acquire(sleep=clock.sleep)
+
+    with pytest.raises(TimeoutError):
+        bucket.acquire(deadline=clock.now + 0.5, sleep=clock.sleep)
+    assert clock.sleeps == []
+    assert bucket.acquire(deadline=clock.now + 1.0, sleep=clock.sleep) == pytest.approx(
+        1.0
+    )
+
+
+@pytest.mark.parametrize(
+    ("rate", "burst", "reserved"), [(0.0, 1, 0), (1.0, 0, 0), (1.0, 1, -1)]
+)
+def test_invalid_settings(rate: float, burst: int, reserved: int) -> None:
+    """Rate, burst and reserve are validated."""
+    with pytest.raises(ValueError):
+        TokenBucket(rate, burst, reserved)
@@ -0,0 +1,168 @@
+"""Tests for the integration services, with two panels set up."""
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from homeassistant.config_entries import (  # noqa: E402
+    ConfigEntries,
+    ConfigEntry,
+    ConfigEntryState,
+)
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.exceptions import ServiceValidationError  # noqa: E402
+from homeassistant.helpers import area_registry as ar  # noqa: E402
+from homeassistant.helpers import device_registry as dr  # noqa: E402
+from homeassistant.helpers import entity as entity_helper  # noqa: E402
+from homeassistant.helpers import entity_registry as er  # noqa: E402
+from homeassistant.helpers import issue_registry as ir  # noqa: E402
+from homeassistant.helpers import translation as translation_helper  # noqa: E402
+
+from custom_components.ha_tecnout.const import (  # noqa: E402
+    CONF_CONTROL_PIN,
+    CONF_HOST,
+    CONF_PASSPHRASE,
+    CONF_PORT,
+    CONF_USER_CODE,
+    DOMAIN,
+)
+
+from .const import PASSPHRASE, USER_CODE  # noqa: E402
+from .simulator import PanelSimulator, SimulatedPanel  # noqa: E402
+
+
+async def _async_start_hass(config_dir: Path) -> HomeAssistant:
+    """Start a bare Home Assistant that can load the custom integration."""
+    # Imported once homeassistant.core is, which it imports circularly
+    from homeassistant import loader  # pylint: disable=import-outside-toplevel
+
+    (config_dir / "custom_components").symlink_to(
+        Path(__file__).resolve().parent.parent / "custom_components"
+    )
+    hass = HomeAssistant(str(config_dir))
+    hass.config.skip_pip = True
+    loader.async_setup(hass)
+    translation_helper.async_setup(hass)
+    entity_helper.async_setup(hass)
+    await ar.async_load(hass)
+    await dr.async_load(hass)
+    await er.async_load(hass)
+    await ir.async_load(hass)
+    hass.config_entries = ConfigEntries(hass, {})
+    await hass.config_entries.async_initialize()
+    await hass.async_start()
+    return hass
+
+
+async def _async_add_panel(
+    hass: HomeAssistant, simulator: PanelSimulator, pin: str
+) -> ConfigEntry:
+    """Set up a config entry for the panel served by ``simulator``."""
+    entry = ConfigEntry(
+        version=1,
+        minor_version=1,
+        domain=DOMAIN,
+        title=f"Panel {pin}",
+        data={
+            CONF_HOST: simulator.host,
+            CONF_PORT: simulator.port,
+            CONF_USER_CODE: USER_CODE,
+            CONF_PASSPHRASE: PASSPHRASE,
+            CONF_CONTROL_PIN: pin,
+        },
+        source="user",
+        options={},
+    )
+    await hass.config_entries.async_add(entry)
+    await hass.async_block_till_done()
+    assert entry.state is ConfigEntryState.LOADED
+    return entry
+
+
+async def _services_scenario(
+    tmp_path: Path, first: PanelSimulator, second: PanelSimulator
+) -> None:
+    hass = await _async_start_hass(tmp_path)
+    try:
+        first_entry = await _async_add_panel(hass, first, "1111")
+        second_entry = await _async_add_panel(hass, second, "2222")
+
+        # Each call acts on its own panel and checks that panel's PIN
+        await hass.services.async_call(
+            DOMAIN,
+            "arm_program",
+            {"config_entry_id": second_entry.entry_id, "program_id": 1, "pin": "2222"},
+            blocking=True,
+        )
+        assert second.panel.programs[0] == 3
+        assert first.panel.programs[0] == 0
+        with pytest.raises(ServiceValidationError):
+            await hass.services.async_call(
+                DOMAIN,
+                "arm_program",
+                {
+                    "config_entry_id": first_entry.entry_id,
+                    "program_id": 1,
+                    "pin": "2222",
+                },
+                blocking=True,
+            )
+        assert first.panel.programs[0] == 0
+
+        first.panel.set_zone_open(2, True)
+        await hass.data[DOMAIN][first_entry.entry_id].async_refresh()
+        response = await hass.services.async_call(
+            DOMAIN,
+            "query_zones",
+            {"config_entry_id": first_entry.entry_id, "all": ["open"]},
+            blocking=True,
+            return_response=True,
+        )
+        assert [zone["zone"] for zone in response["zones"]] == [2]
+        response = await hass.services.async_call(
+            DOMAIN,
+            "query_zones",
+            {"config_entry_id": second_entry.entry_id, "all": ["open"]},
+            blocking=True,
+            return_response=True,
+        )
+        assert response["count"] == 0
+
+        # Unknown or unloaded entries are rejected, never replaced by another
+        with pytest.raises(ServiceValidationError):
+            await hass.services.async_call(
+                DOMAIN,
+                "query_zones",
+                {"config_entry_id": "missing"},
+                blocking=True,
+                return_response=True,
+            )
+        await hass.config_entries.async_unload(second_entry.entry_id)
+        with pytest.raises(ServiceValidationError):
+            await hass.services.async_call(
+                DOMAIN,
+                "disarm_program",
+                {
+                    "config_entry_id": second_entry.entry_id,
+                    "program_id": 1,
+                    "pin": "2222",
+                },
+                blocking=True,
+            )
+        assert second.panel.programs[0] == 3
+
+        await hass.config_entries.async_unload(first_entry.entry_id)
+        assert not hass.services.async_services().get(DOMAIN)
+    finally:
+        await hass.async_stop(force=True)
+
+
+def test_services_target_one_panel(tmp_path: Path, simulator: PanelSimulator) -> None:
+    """Services act only on the panel of the given config entry."""
+    other = SimulatedPanel(zones_count=16, programs_count=4)
+    with PanelSimulator(other, user_code=USER_CODE, passphrase=PASSPHRASE) as second:
+        asyncio.run(_services_scenario(tmp_path, simulator, second))
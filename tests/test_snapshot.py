@@ -0,0 +1,72 @@
+"""Tests for the panel state snapshot."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from tecnout.snapshot import (
+    decode_snapshot,
+    encode_snapshot,
+    read_snapshot,
+    write_snapshot,
+)
+from tecnout.tecnout_client import TecnoOutClient
+
+from .simulator import SimulatedPanel
+
+
+@pytest.fixture
+def panel() -> SimulatedPanel:
+    """Return a panel with some zones open and a program armed."""
+    panel = SimulatedPanel(zones_count=12, programs_count=3)
+    panel.set_zone_open(2, True)
+    panel.set_zone_open(9, True)
+    panel.programs[1] = 3
+    return panel
+
+
+def _state(client: TecnoOutClient):
+    """Return the general status, zones and programs, with descriptions."""
+    zones = client.get_zones_detail(12)
+    descriptions = client.get_zones_description(12)
+    for zone, description in zip(zones, descriptions, strict=True):
+        zone.description = description
+    programs = client.get_programs_status(3)
+    names = client.get_programs_description(3)
+    for program, name in zip(programs, names, strict=True):
+        program.name = name
+    return client.get_general_status(), zones, programs
+
+
+def test_round_trip(client: TecnoOutClient, tmp_path: Path) -> None:
+    """A written snapshot reads back the same state and descriptions."""
+    general_status, zones, programs = _state(client)
+    zones[4].description = "Ingresso è"
+    path = str(tmp_path / "ha_tecnout" / "snapshot.bin")
+
+    write_snapshot(path, encode_snapshot(1700000000.5, general_status, zones, programs))
+    snapshot = read_snapshot(path)
+
+    assert snapshot.saved_at == 1700000000.5
+    assert snapshot.general_status == general_status
+    assert snapshot.zones == zones
+    assert snapshot.programs == programs
+    assert [zone.idx for zone in snapshot.zones if zone.zone_status] == [2, 9]
+
+
+def test_missing_file(tmp_path: Path) -> None:
+    """No snapshot yet: FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        read_snapshot(str(tmp_path / "snapshot.bin"))
+
+
+def test_invalid_data(client: TecnoOutClient) -> None:
+    """Foreign and truncated data are rejected with ValueError."""
+    data = encode_snapshot(0.0, *_state(client))
+
+    with pytest.raises(ValueError):
+        decode_snapshot(b"TOSR" + data[4:])
+    with pytest.raises(ValueError):
+        decode_snapshot(data[:10])
+    with pytest.raises(ValueError):
+        decode_snapshot(data[:-20])
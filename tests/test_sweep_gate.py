@@ -0,0 +1,91 @@
+"""Tests for the zone sweep gate."""
+from __future__ import annotations
+
+from tecnout.sweep_gate import (
+    REASON_FORCED,
+    REASON_INDICATOR,
+    REASON_REQUIRED,
+    SweepGate,
+)
+
+IDLE = b"\x00\x01"
+ZONES = b"\x80\xc0" * 4
+
+
+def swept_gate() -> SweepGate:
+    """Return a gate past its first, required sweep at time 0."""
+    gate = SweepGate(forced_interval=60.0)
+    assert gate.should_sweep(0.0, IDLE)
+    gate.swept(0.0, ZONES)
+    return gate
+
+
+def test_first_cycle_sweeps() -> None:
+    """Nothing to compare against yet: the first cycle sweeps."""
+    gate = SweepGate(forced_interval=60.0)
+
+    assert gate.should_sweep(0.0, IDLE)
+    assert gate.sweeps[REASON_REQUIRED] == 1
+
+
+def test_unchanged_indicators_skip_the_sweep() -> None:
+    """Same indicators within the forced interval: no sweep."""
+    gate = swept_gate()
+
+    assert not gate.should_sweep(1.0, IDLE)
+    assert not gate.should_sweep(2.0, IDLE)
+    assert gate.skipped == 2
+
+
+def test_changed_indicators_sweep() -> None:
+    """A changed indicator byte triggers a sweep."""
+    gate = swept_gate()
+
+    assert gate.should_sweep(1.0, b"\x01\x01")
+    assert gate.sweeps[REASON_INDICATOR] == 1
+
+
+def test_missing_indicators_sweep() -> None:
+    """Without indicators (a failed read) the sweep is required."""
+    gate = swept_gate()
+
+    assert gate.should_sweep(1.0, None)
+    assert gate.sweeps[REASON_REQUIRED] == 2
+
+
+def test_request_forces_the_next_sweep() -> None:
+    """A sent command or a failed sweep requests the next one."""
+    gate = swept_gate()
+    gate.request()
+
+    assert gate.should_sweep(1.0, IDLE)
+    gate.swept(1.0, ZONES)
+    assert not gate.should_sweep(2.0, IDLE)
+
+
+def test_forced_sweep_counts_late_changes() -> None:
+    """A change only a forced sweep found is late by up to the interval."""
+    gate = swept_gate()
+
+    assert not gate.should_sweep(59.0, IDLE)
+    assert gate.should_sweep(60.0, IDLE)
+    gate.swept(60.0, b"\x82\xc0" + ZONES[2:])
+
+    report = gate.report()
+    assert report["sweeps"][REASON_FORCED] == 1
+    assert report["changes"] == 1
+    assert report["late_changes"] == 1
+    assert report["max_late_s"] == 60.0
+
+
+def test_report() -> None:
+    """The report counts the cycles and the sweeps avoided."""
+    gate = swept_gate()
+    for second in range(1, 4):
+        gate.should_sweep(float(second), IDLE)
+
+    report = gate.report()
+    assert report["cycles"] == 4
+    assert report["skipped"] == 3
+    assert report["skipped_ratio"] == 0.75
+    assert report["late_changes"] == 0
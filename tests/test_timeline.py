@@ -0,0 +1,98 @@
+"""Tests for the zone timeline."""
+from __future__ import annotations
+
+import random
+
+import pytest
+from tecnout.timeline import TimelineState, TimelineTransition, ZoneTimeline
+
+
+def test_unchanged_cycles_are_not_recorded() -> None:
+    """Only cycles that change something take an entry."""
+    timeline = ZoneTimeline()
+
+    assert timeline.append(1.0, 0b01, b"\x00")
+    assert not timeline.append(2.0, 0b01, b"\x00")
+    assert timeline.append(3.0, 0b11, b"\x00")
+    assert timeline.append(4.0, 0b11, b"\x03")
+
+    assert len(timeline) == 3
+
+
+def test_state_at() -> None:
+    """The state at a time is the one of the last change before it."""
+    timeline = ZoneTimeline()
+    timeline.append(10.0, 0b001, b"\x00")
+    timeline.append(20.0, 0b101, b"\x00")
+    timeline.append(30.0, 0b100, b"\x03")
+
+    assert timeline.state_at(9.9) is None
+    assert timeline.state_at(10.0) == TimelineState(10.0, 0b001, b"\x00")
+    assert timeline.state_at(25.0) == TimelineState(25.0, 0b101, b"\x00")
+    assert timeline.state_at(99.0) == TimelineState(99.0, 0b100, b"\x03")
+
+
+def test_transitions() -> None:
+    """Each change reports the zones opened and closed."""
+    timeline = ZoneTimeline()
+    timeline.append(10.0, 0b001, b"\x00")
+    timeline.append(20.0, 0b110, b"\x00")
+    timeline.append(30.0, 0b110, b"\x03")
+
+    assert timeline.transitions(20.0, 30.0) == [
+        TimelineTransition(20.0, 0b110, 0b001, None),
+        TimelineTransition(30.0, 0, 0, b"\x03"),
+    ]
+    assert timeline.transitions(11.0, 19.0) == []
+
+
+def test_eviction_keeps_the_base_state() -> None:
+    """Evicted changes are folded into the state the timeline starts from."""
+    timeline = ZoneTimeline(size=2)
+    timeline.append(10.0, 0b01, b"\x01")
+    timeline.append(20.0, 0b11, b"\x01")
+    timeline.append(30.0, 0b10, b"\x02")
+
+    assert len(timeline) == 2
+    assert timeline.oldest == 10.0
+    assert timeline.state_at(5.0) is None
+    assert timeline.state_at(15.0) == TimelineState(15.0, 0b01, b"\x01")
+    assert timeline.state_at(30.0) == TimelineState(30.0, 0b10, b"\x02")
+
+
+def test_matches_a_full_history() -> None:
+    """Answers match a plain list of every cycle, across many evictions."""
+    rng = random.Random(42)
+    timeline = ZoneTimeline(size=50)
+    history: list[tuple[float, int, bytes]] = []
+    zones, programs = 0, b"\x00\x00"
+    for cycle in range(500):
+        if rng.random() < 0.3:
+            zones ^= 1 << rng.randrange(64)
+        if rng.random() < 0.05:
+            programs = bytes(rng.randrange(7) for _ in range(2))
+        if timeline.append(float(cycle), zones, programs):
+            history.append((float(cycle), zones, programs))
+
+    assert len(timeline) == 50
+    oldest = timeline.oldest
+    assert oldest is not None and oldest > history[0][0]
+    middle = (oldest + 499.0) / 2
+    for when in (oldest, oldest + 0.5, middle, middle + 0.5, 499.0):
+        expected = [entry for entry in history if entry[0] <= when][-1]
+        assert timeline.state_at(when) == TimelineState(when, *expected[1:])
+
+    previous = [entry for entry in history if entry[0] < middle][-1][1]
+    transitions = timeline.transitions(middle, 499.0)
+    assert transitions
+    for transition in transitions:
+        current = next(entry for entry in history if entry[0] == transition.time)[1]
+        assert transition.opened == current & ~previous
+        assert transition.closed == previous & ~current
+        previous = current
+
+
+def test_size_must_be_positive() -> None:
+    """A timeline keeps at least one entry."""
+    with pytest.raises(ValueError):
+        ZoneTimeline(size=0)
@@ -0,0 +1,100 @@
+"""Tests for the frame tracer and the lazy hex dumps."""
+from __future__ import annotations
+
+import logging
+
+import pytest
+from tecnout.tecnout_client import TecnoOutClient
+from tecnout.tracing import (
+    DIRECTION_RX,
+    DIRECTION_TX,
+    USER_CODE_MASK,
+    FrameTracer,
+    HexDump,
+    mask_user_code,
+)
+
+FRAME = bytes([0x02, 0x12, 0x34, 0x56, 0x0F, 0x02, 0x01, 0x20, 0xAB, 0xCD])
+
+
+class CountingHexDump(HexDump):
+    """Hex dump counting how many times it is formatted."""
+
+    formatted = 0
+
+    def __str__(self) -> str:
+        CountingHexDump.formatted += 1
+        return super().__str__()
+
+
+def test_hex_dump_formats_on_demand(caplog: pytest.LogCaptureFixture) -> None:
+    """A dump passed to a disabled log level is never formatted."""
+    logger = logging.getLogger("tecnout.test")
+    CountingHexDump.formatted = 0
+
+    with caplog.at_level(logging.INFO, logger="tecnout.test"):
+        logger.debug("Frame: %s", CountingHexDump(FRAME))
+    assert CountingHexDump.formatted == 0
+
+    with caplog.at_level(logging.DEBUG, logger="tecnout.test"):
+        logger.debug("Frame: %s", CountingHexDump(FRAME))
+    # Formatted by each handler emitting the record
+    assert CountingHexDump.formatted >= 1
+    assert caplog.messages == ["Frame: 02 12 34 56 0F 02 01 20 AB CD"]
+
+
+def test_mask_user_code() -> None:
+    """Bytes 1-3 are replaced, the rest of the frame is kept."""
+    masked = mask_user_code(FRAME)
+
+    assert masked == FRAME[:1] + USER_CODE_MASK + FRAME[4:]
+    assert mask_user_code(bytearray(FRAME)) == masked
+    # Too short to hold a user code
+    assert mask_user_code(b"\x02\x12") == b"\x02\x12"
+
+
+def test_tracer_samples_and_filters() -> None:
+    """Only the sampled requests of the traced commands are wanted."""
+    tracer = FrameTracer(sample_every=3, commands=[0x0F])
+
+    wanted = [tracer.wants(command) for command in (0x0F, 0x01) * 6]
+
+    assert [i for i, want in enumerate(wanted) if want] == [0, 6]
+
+
+def test_tracer_keeps_the_last_frames() -> None:
+    """The buffer holds the last ``size`` frames, masked and formatted on dump."""
+    tracer = FrameTracer(size=2)
+    for command in (0x01, 0x0F, 0x10):
+        tracer.record(DIRECTION_TX, command, FRAME[:4] + bytes([command]))
+
+    frames = tracer.dump()
+
+    assert [(frame["direction"], frame["command"]) for frame in frames] == [
+        (DIRECTION_TX, "0x0F"),
+        (DIRECTION_TX, "0x10"),
+    ]
+    assert frames[-1]["frame"] == "02 FF FF FF 10"
+    tracer.clear()
+    assert tracer.dump() == []
+
+
+def test_tracer_rejects_zero_sampling() -> None:
+    """Sampling must record at least one frame out of N."""
+    with pytest.raises(ValueError):
+        FrameTracer(sample_every=0)
+
+
+def test_client_traces_sampled_exchanges(client: TecnoOutClient) -> None:
+    """A sampled request is traced together with its response."""
+    client.tracer = FrameTracer(sample_every=2)
+
+    for _ in range(4):
+        client.get_general_status()
+
+    frames = client.tracer.dump()
+    assert [frame["direction"] for frame in frames] == [
+        DIRECTION_TX,
+        DIRECTION_RX,
+    ] * 2
+    assert {frame["command"] for frame in frames} == {"0x01"}
@@ -0,0 +1,188 @@
+"""Tests for the change stream of the client."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+
+import pytest
+from tecnout.tecnout_client import PanelBusyError, TecnoOutClient
+from tecnout.watch import ChangeBuffer, ProgramChanged, ZoneFlagChanged
+
+from .const import PASSPHRASE, USER_CODE
+from .simulator import NAK, USY, PanelSimulator
+
+ZONES_DETAIL = 0x0F
+
+
+def _zone_event(zone: int, value: bool, time: float) -> ZoneFlagChanged:
+    return ZoneFlagChanged(zone, "zone_status", value, time)
+
+
+def test_buffer_keeps_the_latest_change_per_key() -> None:
+    """Changes of the same key are merged into the latest one."""
+    buffer = ChangeBuffer()
+    buffer.put(("program", 1), b"\x00", b"\x01", ProgramChanged(1, None, None, 1.0))
+    buffer.put(("program", 1), b"\x01", b"\x03", ProgramChanged(1, None, None, 2.0))
+    buffer.put(("zone", 2, "zone_status"), False, True, _zone_event(2, True, 3.0))
+
+    batch = asyncio.run(buffer.get())
+
+    assert [(type(event), event.time) for event in batch] == [
+        (ProgramChanged, 2.0),
+        (ZoneFlagChanged, 3.0),
+    ]
+    assert buffer.coalesced == 1
+
+
+def test_buffer_drops_changes_that_cancel_out() -> None:
+    """A flag back to its value before the pending change is not reported."""
+    buffer = ChangeBuffer()
+    key = ("zone", 4, "zone_status")
+    buffer.put(key, False, True, _zone_event(4, True, 1.0))
+    buffer.put(key, True, False, _zone_event(4, False, 2.0))
+    buffer.put(("zone", 5, "zone_status"), False, True, _zone_event(5, True, 3.0))
+
+    assert asyncio.run(buffer.get()) == [_zone_event(5, True, 3.0)]
+
+
+def test_buffer_is_bounded_by_the_keys() -> None:
+    """However many changes a slow consumer misses, one per key is pending."""
+    buffer = ChangeBuffer()
+    for step in range(1, 1001):
+        for zone in range(1, 4):
+            value = bool(step % 2)
+            buffer.put(
+                ("zone", zone, "zone_status"),
+                not value,
+                value,
+                _zone_event(zone, value, float(step)),
+            )
+        buffer.put(
+            ("program", 1),
+            (step - 1).to_bytes(2, "big"),
+            step.to_bytes(2, "big"),
+            ProgramChanged(1, None, None, float(step)),
+        )
+        assert len(buffer._pending) <= 4
+    buffer.put(("zone", 1, "zone_status"), False, True, _zone_event(1, True, 1e3))
+
+    batch = asyncio.run(buffer.get())
+
+    # The flips cancelled out, the program kept changing
+    assert batch == [
+        ProgramChanged(1, None, None, 1000.0),
+        _zone_event(1, True, 1000.0),
+    ]
+    assert buffer.coalesced == 3 * 500 + 999
+
+
+def test_buffer_raises_once_drained() -> None:
+    """The error of the producer is raised after the pending changes."""
+    buffer = ChangeBuffer()
+    buffer.put(("zone", 1, "zone_status"), False, True, _zone_event(1, True, 1.0))
+    buffer.fail(ConnectionError("gone"))
+
+    async def drain() -> None:
+        assert len(await buffer.get()) == 1
+        with pytest.raises(ConnectionError):
+            await buffer.get()
+
+    asyncio.run(drain())
+
+
+@pytest.fixture
+def watched(simulator: PanelSimulator) -> Iterator[TecnoOutClient]:
+    """Return a connected client that does not retry busy answers itself."""
+    client = TecnoOutClient(
+        simulator.host,
+        simulator.port,
+        USER_CODE,
+        PASSPHRASE,
+        command_timeout=2.0,
+        busy_retries=0,
+    )
+    client.connect()
+    yield client
+    client.close()
+
+
+async def _next(stream) -> object:
+    return await asyncio.wait_for(anext(stream), 5.0)
+
+
+def test_watch_survives_failed_sweeps(
+    watched: TecnoOutClient, simulator: PanelSimulator
+) -> None:
+    """Busy sweeps are retried and the change is reported afterwards."""
+
+    async def run() -> object:
+        stream = watched.watch(16, 4, interval=0.05)
+        try:
+            changes = asyncio.ensure_future(_next(stream))
+            # Let the baseline sweep complete
+            await asyncio.sleep(0.3)
+            simulator.inject(USY, count=3, command=ZONES_DETAIL)
+            simulator.panel.set_zone_open(3, True)
+            return await changes
+        finally:
+            await stream.aclose()
+
+    change = asyncio.run(run())
+
+    assert (change.zone, change.flag, change.value) == (3, "zone_status", True)
+    assert not simulator._injected
+
+
+def test_watch_raises_fatal_errors(
+    watched: TecnoOutClient, simulator: PanelSimulator
+) -> None:
+    """A NAK is not retried: the iterator raises it."""
+    simulator.inject(NAK, command=ZONES_DETAIL)
+
+    async def run() -> None:
+        stream = watched.watch(16, 4, interval=0.05)
+        try:
+            with pytest.raises(ValueError, match="NAK"):
+                await _next(stream)
+        finally:
+            await stream.aclose()
+
+    asyncio.run(run())
+
+
+def test_watch_gives_up_after_max_failures(
+    watched: TecnoOutClient, simulator: PanelSimulator
+) -> None:
+    """With max_failures, that many failed sweeps in a row end the stream."""
+    simulator.inject(USY, count=2, command=ZONES_DETAIL)
+
+    async def run() -> None:
+        stream = watched.watch(16, 4, interval=0.05, max_failures=2)
+        try:
+            with pytest.raises(PanelBusyError):
+                await _next(stream)
+        finally:
+            await stream.aclose()
+
+    asyncio.run(run())
+
+
+def test_watch_sweep_timeout_is_not_the_interval(
+    watched: TecnoOutClient, simulator: PanelSimulator
+) -> None:
+    """Sweeps slower than the interval complete within the sweep timeout."""
+    simulator.latency = 0.03
+
+    async def run() -> object:
+        stream = watched.watch(16, 4, interval=0.01, max_failures=1)
+        try:
+            changes = asyncio.ensure_future(_next(stream))
+            await asyncio.sleep(0.3)
+            simulator.panel.set_zone_open(7, True)
+            return await changes
+        finally:
+            await stream.aclose()
+
+    change = asyncio.run(run())
+
+    assert (change.zone, change.value) == (7, True)
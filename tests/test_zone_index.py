@@ -0,0 +1,121 @@
+"""Tests for the zone bitsets and the program to zone index."""
+from __future__ import annotations
+
+import pytest
+from tecnout.entities import ZoneDetailedStatus, ZoneSetting
+from tecnout.zone_index import ProgramZoneIndex, ZoneBitsets, resolve_flag, zones_in
+
+# Low byte of the 0x0F zone status
+ISOLATED = 0x01
+OPEN = 0x02
+LOW_BATTERY = 0x10
+# High byte
+ALARM = 0x20
+ENABLED = 0x80
+
+
+def _zone(idx: int, low: int = 0, high: int = ENABLED) -> ZoneDetailedStatus:
+    return ZoneDetailedStatus.from_bytes(bytes([low, high]), idx)
+
+
+def _setting(programs: list[int], cannot_be_excluded: bool = False) -> ZoneSetting:
+    return ZoneSetting(
+        programs=[program in programs for program in range(1, 9)],
+        zone_type="instant",
+        common_zone=False,
+        coinciding_zone=False,
+        can_be_partset=False,
+        cannot_be_excluded=cannot_be_excluded,
+        other_flags=0,
+        reserved=0,
+    )
+
+
+@pytest.fixture
+def bitsets() -> ZoneBitsets:
+    """Six zones: 1 and 2 open, 2 isolated, 3 low battery, 5 in alarm."""
+    return ZoneBitsets(
+        [
+            _zone(1, OPEN),
+            _zone(2, OPEN | ISOLATED),
+            _zone(3, LOW_BATTERY),
+            _zone(4),
+            _zone(5, OPEN, ENABLED | ALARM),
+            _zone(6),
+        ]
+    )
+
+
+def test_zones_in() -> None:
+    """Bits map to one-based zone numbers, in ascending order."""
+    assert zones_in(0) == []
+    assert zones_in(0b1010_0001) == [1, 6, 8]
+    assert zones_in(1 << 511 | 1 << 63) == [64, 512]
+
+
+def test_resolve_flag() -> None:
+    """Aliases resolve to flags and unknown names are rejected."""
+    assert resolve_flag("open") == "zone_status"
+    assert resolve_flag("battery_low") == "battery_low"
+    with pytest.raises(ValueError):
+        resolve_flag("door")
+
+
+def test_flag_bitsets(bitsets: ZoneBitsets) -> None:
+    """Every flag holds the bits of the zones that have it set."""
+    assert zones_in(bitsets.present) == [1, 2, 3, 4, 5, 6]
+    assert zones_in(bitsets.flag("open")) == [1, 2, 5]
+    assert zones_in(bitsets.flag("isolated")) == [2]
+    assert zones_in(bitsets.flag("alarm")) == [5]
+    assert zones_in(bitsets.flag("enabled")) == [1, 2, 3, 4, 5, 6]
+
+
+def test_query_combines_flags(bitsets: ZoneBitsets) -> None:
+    """all_of, none_of and any_of combine as and, and-not and or."""
+    assert zones_in(bitsets.query(all_of=["open"], none_of=["isolated"])) == [1, 5]
+    assert zones_in(bitsets.query(any_of=["low_battery", "alarm"])) == [3, 5]
+    assert zones_in(bitsets.query(all_of=["open", "alarm"])) == [5]
+    # No filter: every zone read
+    assert zones_in(bitsets.query()) == [1, 2, 3, 4, 5, 6]
+
+
+def test_query_stays_within_the_zones(bitsets: ZoneBitsets) -> None:
+    """Negated flags and ``within`` never add zones that were not read."""
+    assert zones_in(bitsets.query(none_of=["open", "low_battery"])) == [4, 6]
+    within = 0b11_0011
+    assert zones_in(bitsets.query(all_of=["open"], within=within)) == [1, 2, 5]
+    assert zones_in(bitsets.query(none_of=["open"], within=1 << 9)) == []
+
+
+def test_query_rejects_unknown_flags(bitsets: ZoneBitsets) -> None:
+    """A typo in a flag name raises instead of matching nothing."""
+    with pytest.raises(ValueError):
+        bitsets.query(none_of=["isolate"])
+
+
+def test_program_zone_index() -> None:
+    """Program members and unexcludable zones come from the settings."""
+    index = ProgramZoneIndex(
+        [
+            _setting([1]),
+            _setting([1, 2], cannot_be_excluded=True),
+            _setting([2]),
+            _setting([]),
+        ]
+    )
+
+    assert index.zones_count == 4
+    assert zones_in(index.members(1)) == [1, 2]
+    assert zones_in(index.members(2)) == [2, 3]
+    assert index.members(3) == 0
+    assert zones_in(index.cannot_be_excluded) == [2]
+    open_zones = 0b1110
+    assert zones_in(index.blocking(1, open_zones)) == [2]
+    assert zones_in(index.blocking(2, open_zones)) == [2, 3]
+
+
+def test_program_zone_index_offset() -> None:
+    """Settings read from a later zone map to the matching bits."""
+    index = ProgramZoneIndex([_setting([3]), _setting([3])], zone_from=33)
+
+    assert zones_in(index.members(3)) == [33, 34]